@@ -0,0 +1,10 @@
+"""Performance benchmarks for dndgame hot paths.
+
+Run the suite and save the results::
+
+    python -m benchmarks run --output baseline.json
+
+Later, fail if anything got slower than the baseline by more than 10%::
+
+    python -m benchmarks run --baseline baseline.json --threshold 0.10
+"""
@@ -0,0 +1,85 @@
+"""Command-line entry point: ``python -m benchmarks``."""
+
+import argparse
+import sys
+from typing import Optional, Sequence
+
+import benchmarks.suite  # noqa: F401  (registers the benchmarks)
+from benchmarks.harness import (
+    DEFAULT_SEED,
+    DEFAULT_THRESHOLD,
+    Regression,
+    Report,
+    compare,
+    format_result,
+    run,
+    select,
+)
+
+
+def _print_regressions(regressions: Sequence[Regression]) -> None:
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.key}: {regression.baseline_ns:,.1f} -> "
+            f"{regression.current_ns:,.1f} ns/op (+{regression.slowdown:.1%}, "
+            f"limit {regression.threshold:.0%})"
+        )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run or compare benchmarks. Returns the process exit status."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmark suite")
+    run_parser.add_argument("names", nargs="*", help="benchmark name prefixes")
+    run_parser.add_argument(
+        "--scales", help="comma-separated operation counts, e.g. 1,1000"
+    )
+    run_parser.add_argument("--repeats", type=int, default=5)
+    run_parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    run_parser.add_argument("--output", help="write results as JSON here")
+    run_parser.add_argument("--baseline", help="compare against saved results")
+    run_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        current = Report.load(args.current)
+        baseline = Report.load(args.baseline)
+    else:
+        scales = (
+            [int(scale) for scale in args.scales.split(",")] if args.scales else None
+        )
+        cases = select(args.names, scales)
+        if not cases:
+            print("No benchmarks selected.", file=sys.stderr)
+            return 2
+        results = run(
+            cases,
+            seed=args.seed,
+            repeats=args.repeats,
+            progress=lambda result: print(format_result(result), flush=True),
+        )
+        current = Report(results, seed=args.seed)
+        if args.output:
+            current.save(args.output)
+        if not args.baseline:
+            return 0
+        baseline = Report.load(args.baseline)
+
+    regressions = compare(baseline, current, args.threshold)
+    _print_regressions(regressions)
+    if regressions:
+        return 1
+    print("No regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
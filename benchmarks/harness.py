@@ -0,0 +1,277 @@
+"""Benchmark registry, timing and baseline comparison.
+
+A benchmark is a setup function registered with :func:`benchmark`. It is
+called with an operation count and a seed and returns a zero-argument
+callable that performs that many operations. Setup (building fixtures,
+seeding) is never timed. Small workloads are looped until one timing run
+lasts long enough to measure, and the best of several runs is kept.
+"""
+
+import json
+import math
+import platform
+import statistics
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, Sequence, Union
+
+
+Setup = Callable[[int, int], Callable[[], object]]
+
+SCALES: tuple[int, ...] = (1, 1_000, 1_000_000)
+
+DEFAULT_SEED: int = 1234
+
+DEFAULT_THRESHOLD: float = 0.10
+
+FORMAT_VERSION: int = 1
+
+# Shortest timing run worth measuring.
+MIN_RUN_SECONDS: float = 0.05
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """A registered benchmark.
+
+    Attributes:
+        name: Dotted name, e.g. "dice.roll"
+        setup: Builds the timed callable for an operation count and seed
+        scales: Operation counts to run at
+        threshold: Allowed slowdown overriding the global one (noisy cases)
+    """
+
+    name: str
+    setup: Setup
+    scales: tuple[int, ...] = SCALES
+    threshold: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class Result:
+    """Timing of one benchmark at one scale.
+
+    Attributes:
+        name: Benchmark name
+        scale: Operations per call of the timed function
+        number: Calls per timing run
+        repeats: Timing runs
+        best: Fastest run, in seconds per call
+        median: Median run, in seconds per call
+    """
+
+    name: str
+    scale: int
+    number: int
+    repeats: int
+    best: float
+    median: float
+
+    @property
+    def key(self) -> str:
+        """Identifier matching results across runs."""
+        return f"{self.name}[{self.scale}]"
+
+    @property
+    def ns_per_op(self) -> float:
+        """Best time per operation in nanoseconds."""
+        return self.best / self.scale * 1e9
+
+
+@dataclass(frozen=True)
+class Regression:
+    """A result slower than its baseline by more than the threshold."""
+
+    key: str
+    baseline_ns: float
+    current_ns: float
+    threshold: float
+
+    @property
+    def slowdown(self) -> float:
+        """Fractional increase in time per operation."""
+        return self.current_ns / self.baseline_ns - 1
+
+
+REGISTRY: dict[str, Benchmark] = {}
+
+
+def benchmark(
+    name: str,
+    scales: Sequence[int] = SCALES,
+    threshold: Optional[float] = None,
+) -> Callable[[Setup], Setup]:
+    """Register a setup function as a benchmark."""
+
+    def register(setup: Setup) -> Setup:
+        if name in REGISTRY:
+            raise ValueError(f"Benchmark {name!r} is already registered")
+        REGISTRY[name] = Benchmark(name, setup, tuple(scales), threshold)
+        return setup
+
+    return register
+
+
+def time_benchmark(
+    bench: Benchmark, scale: int, seed: int = DEFAULT_SEED, repeats: int = 5
+) -> Result:
+    """Time one benchmark at one scale.
+
+    Args:
+        bench: Benchmark to run
+        scale: Operations per call
+        seed: Seed passed to the setup
+        repeats: Timing runs; the best and median are reported
+
+    Returns:
+        The timing result
+    """
+    func = bench.setup(scale, seed)
+    start = time.perf_counter()
+    func()
+    first = time.perf_counter() - start
+    number = max(1, math.ceil(MIN_RUN_SECONDS / max(first, 1e-9)))
+    if first >= 1.0:
+        repeats = min(repeats, 2)
+
+    runs = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        runs.append((time.perf_counter() - start) / number)
+    return Result(
+        bench.name, scale, number, repeats, min(runs), statistics.median(runs)
+    )
+
+
+def select(
+    patterns: Iterable[str] = (), scales: Optional[Iterable[int]] = None
+) -> list[tuple[Benchmark, int]]:
+    """Pick registered (benchmark, scale) pairs.
+
+    Args:
+        patterns: Name prefixes to keep (all benchmarks if empty)
+        scales: Scales to keep (each benchmark's own scales if omitted)
+    """
+    prefixes = tuple(patterns)
+    allowed = set(scales) if scales is not None else None
+    chosen = []
+    for name in sorted(REGISTRY):
+        bench = REGISTRY[name]
+        if prefixes and not name.startswith(prefixes):
+            continue
+        for scale in bench.scales:
+            if allowed is None or scale in allowed:
+                chosen.append((bench, scale))
+    return chosen
+
+
+def run(
+    cases: Sequence[tuple[Benchmark, int]],
+    seed: int = DEFAULT_SEED,
+    repeats: int = 5,
+    progress: Optional[Callable[[Result], None]] = None,
+) -> list[Result]:
+    """Time every case in order."""
+    results = []
+    for bench, scale in cases:
+        result = time_benchmark(bench, scale, seed, repeats)
+        if progress is not None:
+            progress(result)
+        results.append(result)
+    return results
+
+
+@dataclass
+class Report:
+    """Results of one suite run, as saved to disk.
+
+    Attributes:
+        results: Timings in run order
+        seed: Seed every setup received
+        python: Python version
+        machine: Platform description
+        created: Unix time of the run
+    """
+
+    results: list[Result]
+    seed: int = DEFAULT_SEED
+    python: str = field(default_factory=platform.python_version)
+    machine: str = field(default_factory=platform.platform)
+    created: float = field(default_factory=time.time)
+
+    def to_dict(self) -> dict[str, object]:
+        """Convert to a JSON-compatible dict."""
+        return {
+            "version": FORMAT_VERSION,
+            "seed": self.seed,
+            "python": self.python,
+            "machine": self.machine,
+            "created": self.created,
+            "results": [
+                {**asdict(result), "ns_per_op": result.ns_per_op}
+                for result in self.results
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Report":
+        """Rebuild a report from :meth:`to_dict` output."""
+        if data.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported benchmark format: {data.get('version')}")
+        fields = ("name", "scale", "number", "repeats", "best", "median")
+        results = [Result(*(row[name] for name in fields)) for row in data["results"]]
+        return cls(
+            results,
+            seed=data["seed"],
+            python=data["python"],
+            machine=data["machine"],
+            created=data["created"],
+        )
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the report as JSON."""
+        Path(path).write_text(json.dumps(self.to_dict(), indent=2) + "\n")
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "Report":
+        """Read a report saved with :meth:`save`."""
+        return cls.from_dict(json.loads(Path(path).read_text()))
+
+
+def compare(
+    baseline: Report, current: Report, threshold: float = DEFAULT_THRESHOLD
+) -> list[Regression]:
+    """Find results that got slower than their baseline.
+
+    Results are matched by name and scale; ones missing from either report
+    are ignored. A benchmark's own threshold overrides ``threshold``.
+
+    Returns:
+        Every result slower by more than its threshold
+    """
+    before = {result.key: result for result in baseline.results}
+    regressions = []
+    for result in current.results:
+        old = before.get(result.key)
+        if old is None:
+            continue
+        bench = REGISTRY.get(result.name)
+        limit = threshold
+        if bench is not None and bench.threshold is not None:
+            limit = bench.threshold
+        if result.ns_per_op > old.ns_per_op * (1 + limit):
+            regressions.append(
+                Regression(result.key, old.ns_per_op, result.ns_per_op, limit)
+            )
+    return regressions
+
+
+def format_result(result: Result) -> str:
+    """One-line summary of a result."""
+    return (
+        f"{result.key:<40} {result.ns_per_op:>14,.1f} ns/op "
+        f"(x{result.number}, best of {result.repeats})"
+    )
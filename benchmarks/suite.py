@@ -0,0 +1,309 @@
+"""The benchmark cases.
+
+Every case uses a fixed seed and a fixed workload, and reports to a
+:class:`~dndgame.events.NullSink` so that timings measure game logic rather
+than console output.
+"""
+
+import random
+from typing import Callable, Optional
+
+from benchmarks.harness import benchmark
+from dndgame.character import Character
+from dndgame.combat import Combat
+from dndgame.dice import roll
+from dndgame.enemy import Enemy
+from dndgame.events import EventSink, NullSink, get_default_sink
+from dndgame.metrics import collecting
+from dndgame.registry import Registry
+from dndgame.rng import RandomSource
+from dndgame.spells import Spell, SpellBook
+from dndgame.tape import DiceTape, RecordingRng, ReplayRng
+
+
+SCHOOLS: tuple[str, ...] = (
+    "Abjuration",
+    "Conjuration",
+    "Divination",
+    "Enchantment",
+    "Evocation",
+    "Illusion",
+    "Necromancy",
+    "Transmutation",
+)
+
+SPELLBOOK_SIZE: int = 10_000
+
+
+def make_spells(count: int, seed: int) -> list[Spell]:
+    """Create a reproducible spread of spells."""
+    rng = random.Random(seed)
+    return [
+        Spell(f"Spell {i}", rng.randint(0, 9), rng.choice(SCHOOLS), rng.randint(0, 100))
+        for i in range(count)
+    ]
+
+
+def make_spellbook(count: int, seed: int) -> SpellBook:
+    """Create a reproducible spell book."""
+    book = SpellBook()
+    for spell in make_spells(count, seed):
+        book.add_spell(spell)
+    return book
+
+
+@benchmark("dice.roll")
+def bench_roll(n: int, seed: int) -> Callable[[], object]:
+    """Roll 1d20 ``n`` times."""
+    sink, rng = NullSink(), random.Random(seed)
+
+    def run() -> None:
+        for _ in range(n):
+            roll(20, 1, sink=sink, rng=rng)
+
+    return run
+
+
+@benchmark("dice.roll_3d6")
+def bench_roll_3d6(n: int, seed: int) -> Callable[[], object]:
+    """Roll 3d6 ``n`` times."""
+    sink, rng = NullSink(), random.Random(seed)
+
+    def run() -> None:
+        for _ in range(n):
+            roll(6, 3, sink=sink, rng=rng)
+
+    return run
+
+
+def _hero() -> Character:
+    """Create the standard benchmark player."""
+    player = Character("Hero", "Human", 10)
+    player.stats = {"STR": 14, "DEX": 12, "CON": 14}
+    return player
+
+
+@benchmark("combat.execute_round")
+def bench_execute_round(n: int, seed: int) -> Callable[[], object]:
+    """Run ``n`` rounds of a fight neither side can lose."""
+    rng = random.Random(seed)
+    player = _hero()
+    enemy = Enemy("Orc")
+    for combatant in (player, enemy):
+        combatant.max_hp = combatant.hp = 1 << 30
+    combat = Combat(player, enemy, sink=NullSink(), rng=rng)
+    combat.roll_initiative()
+
+    def run() -> None:
+        for _ in range(n):
+            combat.execute_round()
+
+    return run
+
+
+@benchmark("combat.execute_round_instrumented")
+def bench_execute_round_instrumented(n: int, seed: int) -> Callable[[], object]:
+    """Run ``n`` rounds with metrics collection on.
+
+    Compare with ``combat.execute_round`` for the cost of collecting. The
+    ``metrics.roll_*`` pair measures the cost while collection is off.
+    """
+    rounds = bench_execute_round(n, seed)
+
+    def run() -> None:
+        with collecting():
+            rounds()
+
+    return run
+
+
+def roll_uninstrumented(
+    dice_type: int,
+    number_of_dice: int,
+    sink: Optional[EventSink] = None,
+    rng: Optional[RandomSource] = None,
+) -> int:
+    """:func:`~dndgame.dice.roll` without its metrics check.
+
+    A line-for-line copy of the silent-sink path, kept only as the
+    reference for ``metrics.roll_uninstrumented``; rolls for a live sink
+    are passed on to the real function.
+    """
+    if sink is None:
+        sink = get_default_sink()
+    randint = rng.randint if rng is not None else random.randint
+    total: int = 0
+    if not sink.enabled:
+        for _ in range(number_of_dice):
+            total += randint(1, dice_type)
+        return total
+    return roll(dice_type, number_of_dice, sink, rng)
+
+
+@benchmark("metrics.roll_disabled")
+def bench_roll_metrics_disabled(n: int, seed: int) -> Callable[[], object]:
+    """Roll 1d20 ``n`` times with metrics collection off.
+
+    The same work as ``metrics.roll_uninstrumented``; the difference
+    between the two is what the disabled metrics check costs per roll.
+    """
+    sink, rng = NullSink(), random.Random(seed)
+
+    def run() -> None:
+        for _ in range(n):
+            roll(20, 1, sink=sink, rng=rng)
+
+    return run
+
+
+@benchmark("metrics.roll_uninstrumented")
+def bench_roll_uninstrumented(n: int, seed: int) -> Callable[[], object]:
+    """Roll 1d20 ``n`` times with a copy of ``roll`` that has no metrics."""
+    sink, rng = NullSink(), random.Random(seed)
+
+    def run() -> None:
+        for _ in range(n):
+            roll_uninstrumented(20, 1, sink=sink, rng=rng)
+
+    return run
+
+
+@benchmark("tape.replay", scales=(1, 1_000))
+def bench_tape_replay(n: int, seed: int) -> Callable[[], object]:
+    """Replay ``n`` recorded Hero-vs-Goblin fights."""
+    sink, tapes = NullSink(), []
+    for index in range(n):
+        tape = DiceTape()
+        Combat(
+            _hero(),
+            Enemy("Goblin"),
+            sink=sink,
+            rng=RecordingRng(tape, random.Random(seed + index)),
+        ).run_combat()
+        tapes.append(tape)
+
+    def run() -> None:
+        for tape in tapes:
+            Combat(
+                _hero(), Enemy("Goblin"), sink=sink, rng=ReplayRng(tape)
+            ).run_combat()
+
+    return run
+
+
+@benchmark("character.roll_stats")
+def bench_roll_stats(n: int, seed: int) -> Callable[[], object]:
+    """Roll a character's ability scores ``n`` times."""
+    sink, rng = NullSink(), random.Random(seed)
+    character = Character("Hero", "Elf", 10)
+
+    def run() -> None:
+        for _ in range(n):
+            character.roll_stats(sink=sink, rng=rng)
+
+    return run
+
+
+@benchmark("enemy.init")
+def bench_enemy_init(n: int, seed: int) -> Callable[[], object]:
+    """Create ``n`` Orcs with ``Enemy.__init__``."""
+
+    def run() -> None:
+        for _ in range(n):
+            Enemy("Orc")
+
+    return run
+
+
+@benchmark("registry.spawn")
+def bench_registry_spawn(n: int, seed: int) -> Callable[[], object]:
+    """Create ``n`` Orcs by cloning the registry prototype."""
+    prototype = Registry().enemy("Orc")
+
+    def run() -> None:
+        for _ in range(n):
+            prototype.spawn()
+
+    return run
+
+
+@benchmark("spellbook.add_spell", scales=(1, 1_000))
+def bench_add_spell(n: int, seed: int) -> Callable[[], object]:
+    """Fill an empty spell book with ``n`` spells."""
+    spells = make_spells(n, seed)
+
+    def run() -> None:
+        book = SpellBook()
+        for spell in spells:
+            book.add_spell(spell)
+
+    return run
+
+
+def _spellbook_queries(
+    query: Callable[[SpellBook, random.Random], object],
+) -> Callable[[int, int], Callable[[], object]]:
+    """Build a setup that runs ``n`` queries against a 10k-spell book."""
+
+    def setup(n: int, seed: int) -> Callable[[], object]:
+        book = make_spellbook(SPELLBOOK_SIZE, seed)
+        rng = random.Random(seed)
+
+        def run() -> None:
+            for _ in range(n):
+                query(book, rng)
+
+        return run
+
+    return setup
+
+
+benchmark("spellbook.get_available_spells")(
+    _spellbook_queries(lambda book, rng: book.get_available_spells(rng.randint(0, 2)))
+)
+benchmark("spellbook.get_spells_by_school")(
+    _spellbook_queries(lambda book, rng: book.get_spells_by_school(rng.choice(SCHOOLS)))
+)
+benchmark("spellbook.get_powerful_spells")(
+    _spellbook_queries(lambda book, rng: book.get_powerful_spells(rng.randint(90, 100)))
+)
+benchmark("spellbook.get_spell")(
+    _spellbook_queries(
+        lambda book, rng: book.get_spell(f"Spell {rng.randrange(SPELLBOOK_SIZE)}")
+    )
+)
+benchmark("spellbook.query")(
+    _spellbook_queries(
+        lambda book, rng: book.query(
+            rng.choice(SCHOOLS), rng.randint(0, 3), rng.randint(80, 100)
+        )
+    )
+)
+
+
+def _horde(n: int) -> list[Enemy]:
+    """Create ``n`` orcs for area spells."""
+    return [Enemy("Orc", f"Orc {i}") for i in range(n)]
+
+
+@benchmark("spell.cast", scales=(1, 1_000, 100_000))
+def bench_cast(n: int, seed: int) -> Callable[[], object]:
+    """Cast a fireball at ``n`` orcs one ``take_damage`` at a time."""
+    fireball, horde = Spell("Fireball", 3, "Evocation", 8), _horde(n)
+    sink, rng = NullSink(), random.Random(seed)
+
+    def run() -> None:
+        for orc in horde:
+            fireball.cast(None, orc, sink, rng)
+
+    return run
+
+
+@benchmark("spell.cast_area", scales=(1, 1_000, 100_000))
+def bench_cast_area(n: int, seed: int) -> Callable[[], object]:
+    """Cast a fireball at ``n`` orcs in one vectorized pass."""
+    import numpy as np
+
+    fireball, horde = Spell("Fireball", 3, "Evocation", 8), _horde(n)
+    rng = np.random.default_rng(seed)
+    return lambda: fireball.cast_area(None, horde, rng)
@@ -0,0 +1,404 @@
+"""Procedurally generated dungeons, built lazily from a seed.
+
+A :class:`Dungeon` is a grid of rooms (a million by default) that exists
+only as a seed until someone looks at it. The doors of a room come from a
+fast hash of the seed and the room id: every room opens a door north or
+west, which links all rooms into one maze, and some open the other door
+too, adding loops. Rooms with their encounters are only materialized when
+visited and kept in a bounded LRU, so memory follows the visited rooms,
+not the size of the dungeon.
+
+Paths are found with A* on the grid's Manhattan distance. Every path to
+an exit is remembered room by room, so later queries from rooms on or near
+an earlier path finish after a short search. When many rooms will ask for
+the way out, :meth:`Dungeon.build_exit_index` runs one NumPy BFS from all
+exits at once and answers every later query from the resulting distance
+array (4 bytes per room).
+
+Example:
+    >>> dungeon = Dungeon(seed=42)
+    >>> room = dungeon.room(dungeon.entrance)
+    >>> room.encounter, room.exits  # doctest: +SKIP
+    ('Orc', (1, 1000))
+    >>> len(dungeon.path_to_exit(room.id))  # doctest: +SKIP
+    127
+"""
+
+import heapq
+import random
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+from dndgame.enemy import ENEMY_TEMPLATES, Enemy
+from dndgame.rng import derive_seed
+
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+
+DEFAULT_SIZE: int = 1000
+
+DEFAULT_CACHE_SIZE: int = 4096
+
+_MASK: int = (1 << 64) - 1
+
+# Resolution of the per-room chances drawn from the room hash.
+_CHANCE_BITS: int = 16
+
+
+def _mix(value: int) -> int:
+    """SplitMix64 finalizer: a fast, well-spread 64-bit hash."""
+    value = (value + 0x9E3779B97F4A7C15) & _MASK
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK
+    return value ^ (value >> 31)
+
+
+@dataclass(frozen=True)
+class Room:
+    """A materialized room.
+
+    Attributes:
+        id: Room id, ``y * width + x``
+        x: Column in the grid
+        y: Row in the grid
+        exits: Ids of the rooms behind this room's doors
+        encounter: Enemy type waiting here, if any
+        is_exit: Whether this room leads out of the dungeon
+    """
+
+    id: int
+    x: int
+    y: int
+    exits: tuple[int, ...]
+    encounter: Optional[str]
+    is_exit: bool
+
+    def spawn(self) -> Optional[Enemy]:
+        """Create the room's enemy, if it has one."""
+        return Enemy(self.encounter) if self.encounter is not None else None
+
+
+class Dungeon:
+    """A lazily generated grid dungeon.
+
+    Attributes:
+        width: Rooms per row
+        height: Rows
+        seed: Seed every room is derived from
+        entrance: Id of the starting room (the top-left corner)
+        exit_rooms: Ids of the rooms that lead out
+        loop_chance: Chance that a room opens both its north and west door
+        encounter_chance: Chance that a room holds an enemy
+        cache_size: Most rooms kept materialized
+    """
+
+    def __init__(
+        self,
+        width: int = DEFAULT_SIZE,
+        height: int = DEFAULT_SIZE,
+        seed: int = 0,
+        exits: int = 4,
+        loop_chance: float = 0.1,
+        encounter_chance: float = 0.3,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        if width < 1 or height < 1:
+            raise ValueError(f"Invalid dungeon size: {width}x{height}")
+        if not 1 <= exits <= width * height:
+            raise ValueError(f"exits must be between 1 and {width * height}")
+        if cache_size < 1:
+            raise ValueError(f"cache_size must be positive, got {cache_size}")
+        self.width: int = width
+        self.height: int = height
+        self.seed: int = seed
+        self.entrance: int = 0
+        self.loop_chance: float = loop_chance
+        self.encounter_chance: float = encounter_chance
+        self.cache_size: int = cache_size
+        self._salt: int = derive_seed(seed) & _MASK
+        self._loop_threshold: int = int(loop_chance * (1 << _CHANCE_BITS))
+        self._encounter_threshold: int = int(encounter_chance * (1 << _CHANCE_BITS))
+        self._enemy_types: tuple[str, ...] = tuple(ENEMY_TEMPLATES)
+        picker = random.Random(derive_seed(seed, -1))
+        self.exit_rooms: frozenset[int] = frozenset(
+            picker.sample(range(width * height), exits)
+        )
+        self._exit_points: tuple[tuple[int, int], ...] = tuple(
+            divmod(room, width)[::-1] for room in sorted(self.exit_rooms)
+        )
+        self._rooms: OrderedDict[int, Room] = OrderedDict()
+        # Nearest-exit distance and next room on the way, for every room on
+        # a path found so far.
+        self._exit_distance: dict[int, int] = {room: 0 for room in self.exit_rooms}
+        self._next_room: dict[int, int] = {}
+        self._exit_index: Optional["npt.NDArray[np.int32]"] = None
+
+    def __len__(self) -> int:
+        return self.width * self.height
+
+    @property
+    def materialized(self) -> int:
+        """Rooms currently held in the LRU."""
+        return len(self._rooms)
+
+    def _check(self, room: int) -> None:
+        if not 0 <= room < self.width * self.height:
+            raise IndexError(f"No room {room} in a {self.width}x{self.height} dungeon")
+
+    def _doors(self, room: int) -> tuple[bool, bool]:
+        """Whether a room opens its north and its west door."""
+        x, y = room % self.width, room // self.width
+        if y == 0:
+            return False, x > 0
+        if x == 0:
+            return True, False
+        bits = _mix(self._salt + room)
+        north = bool(bits & 1)
+        if (bits >> 1) & ((1 << _CHANCE_BITS) - 1) < self._loop_threshold:
+            return True, True
+        return north, not north
+
+    def neighbors(self, room: int) -> list[int]:
+        """Ids of the rooms connected to a room, without materializing it."""
+        self._check(room)
+        return self._links(room)
+
+    def _links(self, room: int) -> list[int]:
+        width = self.width
+        x, y = room % width, room // width
+        north, west = self._doors(room)
+        result = []
+        if north:
+            result.append(room - width)
+        if west:
+            result.append(room - 1)
+        if x + 1 < width and self._doors(room + 1)[1]:
+            result.append(room + 1)
+        if y + 1 < self.height and self._doors(room + width)[0]:
+            result.append(room + width)
+        return result
+
+    def room(self, room: int) -> Room:
+        """Materialize a room (or fetch it from the LRU)."""
+        rooms = self._rooms
+        cached = rooms.get(room)
+        if cached is not None:
+            rooms.move_to_end(room)
+            return cached
+        self._check(room)
+        bits = _mix(self._salt + room) >> (1 + _CHANCE_BITS)
+        encounter = None
+        if bits & ((1 << _CHANCE_BITS) - 1) < self._encounter_threshold:
+            encounter = self._enemy_types[
+                (bits >> _CHANCE_BITS) % len(self._enemy_types)
+            ]
+        result = Room(
+            room,
+            room % self.width,
+            room // self.width,
+            tuple(sorted(self._links(room))),
+            encounter,
+            room in self.exit_rooms,
+        )
+        rooms[room] = result
+        if len(rooms) > self.cache_size:
+            rooms.popitem(last=False)
+        return result
+
+    def _distance(self, a: int, b: int) -> int:
+        """Manhattan distance between two rooms."""
+        width = self.width
+        return abs(a % width - b % width) + abs(a // width - b // width)
+
+    def shortest_path(self, start: int, goal: int) -> Optional[list[int]]:
+        """Fewest-doors path between two rooms (A*).
+
+        Returns:
+            Room ids from ``start`` to ``goal``, or None if unreachable
+        """
+        self._check(start)
+        self._check(goal)
+        came_from: dict[int, int] = {start: start}
+        cost = {start: 0}
+        frontier = [(self._distance(start, goal), 0, start)]
+        while frontier:
+            _, steps, room = heapq.heappop(frontier)
+            if room == goal:
+                return self._walk_back(came_from, goal)
+            if steps > cost[room]:
+                continue
+            for neighbor in self._links(room):
+                if steps + 1 < cost.get(neighbor, steps + 2):
+                    cost[neighbor] = steps + 1
+                    came_from[neighbor] = room
+                    estimate = steps + 1 + self._distance(neighbor, goal)
+                    heapq.heappush(frontier, (estimate, steps + 1, neighbor))
+        return None
+
+    def reachable(self, start: int, max_steps: int) -> dict[int, int]:
+        """Rooms within ``max_steps`` doors of a room (BFS).
+
+        Returns:
+            Steps to each reachable room, by room id
+        """
+        self._check(start)
+        steps = {start: 0}
+        layer = [start]
+        for depth in range(1, max_steps + 1):
+            following = []
+            for room in layer:
+                for neighbor in self._links(room):
+                    if neighbor not in steps:
+                        steps[neighbor] = depth
+                        following.append(neighbor)
+            if not following:
+                break
+            layer = following
+        return steps
+
+    def _exit_estimate(self, room: int) -> int:
+        """Manhattan distance to the nearest exit."""
+        x, y = room % self.width, room // self.width
+        return min(abs(x - ex) + abs(y - ey) for ex, ey in self._exit_points)
+
+    def path_to_exit(self, start: int) -> list[int]:
+        """Shortest path from a room to the nearest exit.
+
+        Without an exit index this is A* towards all exits at once. Rooms
+        with a known distance from an earlier search are treated as
+        shortcuts: the search stops once no unexplored route can beat the
+        best route through one of them.
+
+        Returns:
+            Room ids from ``start`` to an exit
+        """
+        self._check(start)
+        index = self._exit_index
+        if index is not None:
+            path = [start]
+            while index[path[-1]] > 0:
+                steps = index[path[-1]] - 1
+                path.append(
+                    next(room for room in self._links(path[-1]) if index[room] == steps)
+                )
+            return path
+        if start not in self._exit_distance:
+            self._search_exit(start)
+        path = [start]
+        while path[-1] not in self.exit_rooms:
+            path.append(self._next_room[path[-1]])
+        return path
+
+    def distance_to_exit(self, start: int) -> int:
+        """Doors between a room and the nearest exit."""
+        self._check(start)
+        if self._exit_index is not None:
+            return int(self._exit_index[start])
+        if start not in self._exit_distance:
+            self._search_exit(start)
+        return self._exit_distance[start]
+
+    def _search_exit(self, start: int) -> None:
+        """Find the nearest exit from ``start`` and remember the path."""
+        known = self._exit_distance
+        came_from: dict[int, int] = {start: start}
+        cost = {start: 0}
+        frontier = [(self._exit_estimate(start), 0, start)]
+        best, via = -1, -1
+        while frontier:
+            estimate, steps, room = heapq.heappop(frontier)
+            if best >= 0 and estimate >= best:
+                break
+            if steps > cost[room]:
+                continue
+            if room in known:
+                if best < 0 or steps + known[room] < best:
+                    best, via = steps + known[room], room
+                continue
+            for neighbor in self._links(room):
+                if steps + 1 < cost.get(neighbor, steps + 2):
+                    cost[neighbor] = steps + 1
+                    came_from[neighbor] = room
+                    estimate = steps + 1 + self._exit_estimate(neighbor)
+                    heapq.heappush(frontier, (estimate, steps + 1, neighbor))
+        if best < 0:
+            raise RuntimeError(f"Room {start} can't reach an exit")
+
+        # Every room on the route shares the tail, so cache them all.
+        route = self._walk_back(came_from, via)
+        for index, room in enumerate(route[:-1]):
+            known[room] = best - index
+            self._next_room[room] = route[index + 1]
+
+    @staticmethod
+    def _walk_back(came_from: dict[int, int], goal: int) -> list[int]:
+        """Rebuild a path from A* back-pointers."""
+        path = [goal]
+        while came_from[path[-1]] != path[-1]:
+            path.append(came_from[path[-1]])
+        path.reverse()
+        return path
+
+    def build_exit_index(self) -> "npt.NDArray[np.int32]":
+        """Compute every room's distance to the nearest exit.
+
+        One breadth-first search from all exits at once, a whole layer per
+        step with NumPy. Door layouts are hashed for every room in one pass
+        and dropped afterwards; only the distances are kept. Once built,
+        :meth:`distance_to_exit` and :meth:`path_to_exit` read from it.
+
+        Returns:
+            Distance to the nearest exit, indexed by room id
+        """
+        import numpy as np
+
+        width, size = self.width, self.width * self.height
+        ids = np.arange(size, dtype=np.uint64)
+        bits = ids + np.uint64(self._salt)
+        bits += np.uint64(0x9E3779B97F4A7C15)
+        bits = (bits ^ (bits >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        bits = (bits ^ (bits >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        bits ^= bits >> np.uint64(31)
+        north = (bits & np.uint64(1)).astype(bool)
+        chance = (bits >> np.uint64(1)) & np.uint64((1 << _CHANCE_BITS) - 1)
+        both = chance < self._loop_threshold
+        del bits, chance
+        north_door = north | both
+        west_door = ~north | both
+        # Edge rooms: the left column only opens north, the top row west.
+        north_door[::width] = True
+        west_door[::width] = False
+        north_door[:width] = False
+        west_door[1:width] = True
+
+        distance = np.full(size, -1, dtype=np.int32)
+        frontier = np.array(sorted(self.exit_rooms), dtype=np.int64)
+        distance[frontier] = 0
+        depth = 0
+        while frontier.size:
+            depth += 1
+            east = frontier[frontier % width != width - 1] + 1
+            south = frontier[frontier < size - width] + width
+            reached = np.concatenate(
+                (
+                    frontier[north_door[frontier]] - width,
+                    frontier[west_door[frontier]] - 1,
+                    east[west_door[east]],
+                    south[north_door[south]],
+                )
+            )
+            frontier = np.unique(reached[distance[reached] < 0])
+            distance[frontier] = depth
+        self._exit_index = distance
+        return distance
+
+    def clear_cache(self) -> None:
+        """Forget materialized rooms, remembered exit paths and the index."""
+        self._rooms.clear()
+        self._exit_index = None
+        self._exit_distance = {room: 0 for room in self.exit_rooms}
+        self._next_room.clear()
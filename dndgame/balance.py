@@ -0,0 +1,322 @@
+"""Automatic enemy balancing against a target player win rate.
+
+A :class:`Balancer` searches an enemy's HP, AC and STR for values that give
+the player a chosen win rate. Each candidate is simulated in growing
+batches until the Wilson confidence interval of its win rate is clearly
+above, below or inside the target band, so obvious mismatches cost a few
+thousand fights while close calls get more. Win rate falls as any of the
+three values rises, so the search bisects one value at a time, and every
+evaluation is cached by its combatant templates.
+
+Example:
+    >>> balancer = Balancer(CombatantTemplate.character("Human"), target=0.6)
+    >>> tuned = balancer.retune()
+    >>> tuned["Orc"].hp, tuned["Orc"].win_rate  # doctest: +SKIP
+    (11, 0.603)
+"""
+
+import math
+from dataclasses import dataclass, replace
+from typing import Optional, Sequence
+
+import numpy as np
+
+from dndgame.enemy import ENEMY_TEMPLATES
+from dndgame.entity import ABILITY_NAMES
+from dndgame.parallel import CombatantTemplate
+from dndgame.rng import derive_seed
+from dndgame.simulation import CombatSimulator, SimulationResult
+
+
+PARAMETERS: tuple[str, ...] = ("hp", "armor_class", "STR")
+
+DEFAULT_BOUNDS: dict[str, tuple[int, int]] = {
+    "hp": (1, 200),
+    "armor_class": (1, 30),
+    "STR": (1, 30),
+}
+
+# (player, enemy, max_rounds)
+CacheKey = tuple[CombatantTemplate, CombatantTemplate, int]
+
+
+def wilson_interval(
+    successes: int, trials: int, z: float = 1.96
+) -> tuple[float, float]:
+    """Wilson score interval for a binomial proportion.
+
+    Args:
+        successes: Number of successes
+        trials: Number of trials
+        z: Normal quantile for the confidence level (1.96 for 95%)
+
+    Returns:
+        Lower and upper bound of the interval
+    """
+    if trials <= 0:
+        return 0.0, 1.0
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials))
+    margin /= denominator
+    return max(0.0, centre - margin), min(1.0, centre + margin)
+
+
+@dataclass
+class Evaluation:
+    """Accumulated simulation of one candidate matchup.
+
+    Attributes:
+        result: Every fight simulated so far
+        rng: Generator the next batch continues from
+    """
+
+    result: SimulationResult
+    rng: np.random.Generator
+
+    @property
+    def win_rate(self) -> float:
+        """Observed player win rate."""
+        return self.result.player_win_rate
+
+
+@dataclass(frozen=True)
+class BalanceResult:
+    """Outcome of tuning one enemy.
+
+    Attributes:
+        enemy: Template with the tuned values
+        win_rate: Estimated player win rate against it
+        interval: Confidence interval of the win rate
+        converged: Whether the interval settled inside the target band
+    """
+
+    enemy: CombatantTemplate
+    win_rate: float
+    interval: tuple[float, float]
+    converged: bool
+
+    @property
+    def hp(self) -> int:
+        """Tuned HP."""
+        assert self.enemy.hp is not None
+        return self.enemy.hp
+
+    @property
+    def armor_class(self) -> int:
+        """Tuned AC."""
+        assert self.enemy.armor_class is not None
+        return self.enemy.armor_class
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Tuned ability scores."""
+        assert self.enemy.stats is not None
+        return dict(zip(ABILITY_NAMES, self.enemy.stats))
+
+
+class Balancer:
+    """Tunes enemy templates to a target player win rate.
+
+    Attributes:
+        player: Template for the player side
+        target: Desired player win rate
+        tolerance: Accepted distance from the target
+        z: Normal quantile of the confidence intervals
+        batch_size: Fights in the first batch of each candidate
+        max_fights: Most fights spent on one candidate
+        max_rounds: Round limit per fight (a draw counts as a loss)
+        seed: Base seed; each candidate draws from its own stream
+        cache: Evaluations by (player, enemy, max_rounds)
+        fights_run: Fights simulated since creation
+    """
+
+    def __init__(
+        self,
+        player: CombatantTemplate,
+        target: float,
+        tolerance: float = 0.02,
+        z: float = 1.96,
+        batch_size: int = 2_000,
+        max_fights: int = 400_000,
+        max_rounds: int = 1000,
+        seed: int = 0,
+        cache: Optional[dict[CacheKey, Evaluation]] = None,
+    ) -> None:
+        if not 0.0 <= target <= 1.0:
+            raise ValueError(f"target must be between 0 and 1, got {target}")
+        if tolerance <= 0:
+            raise ValueError(f"tolerance must be positive, got {tolerance}")
+        self.player: CombatantTemplate = player
+        self.target: float = target
+        self.tolerance: float = tolerance
+        self.z: float = z
+        self.batch_size: int = batch_size
+        self.max_fights: int = max_fights
+        self.max_rounds: int = max_rounds
+        self.seed: int = seed
+        self.cache: dict[CacheKey, Evaluation] = cache if cache is not None else {}
+        self.fights_run: int = 0
+
+    def _verdict(self, evaluation: Evaluation) -> Optional[int]:
+        """Compare a candidate's interval with the target band.
+
+        Returns:
+            1 if the player clearly wins too often, -1 if too rarely, 0 if
+            the whole interval is inside the band, None if still unclear
+        """
+        result = evaluation.result
+        low, high = wilson_interval(result.player_wins, result.fights, self.z)
+        if low > self.target + self.tolerance:
+            return 1
+        if high < self.target - self.tolerance:
+            return -1
+        if self.target - self.tolerance <= low and high <= self.target + self.tolerance:
+            return 0
+        return None
+
+    def evaluate(self, enemy: CombatantTemplate) -> tuple[Evaluation, int]:
+        """Simulate a candidate until its win rate is settled.
+
+        Batches double in size until the verdict is clear or
+        ``max_fights`` is reached, in which case the point estimate
+        decides. Cached evaluations resume where they stopped.
+
+        Returns:
+            The evaluation and its verdict (see :meth:`_verdict`)
+        """
+        key = (self.player, enemy, self.max_rounds)
+        evaluation = self.cache.get(key)
+        if evaluation is None:
+            built = enemy.build()
+            seed = derive_seed(self.seed, built.hp, built.armor_class, *built.scores())
+            evaluation = Evaluation(
+                CombatSimulator(self.player.build(), built, self.max_rounds).run(0),
+                np.random.default_rng(seed),
+            )
+            self.cache[key] = evaluation
+
+        verdict = self._verdict(evaluation)
+        if verdict is None and evaluation.result.fights < self.max_fights:
+            simulator = CombatSimulator(
+                self.player.build(), enemy.build(), self.max_rounds
+            )
+            batch = max(self.batch_size, evaluation.result.fights)
+            while verdict is None and evaluation.result.fights < self.max_fights:
+                fights = min(batch, self.max_fights - evaluation.result.fights)
+                evaluation.result = evaluation.result.merge(
+                    simulator.run(fights, evaluation.rng)
+                )
+                self.fights_run += fights
+                batch *= 2
+                verdict = self._verdict(evaluation)
+
+        if verdict is None:
+            rate = evaluation.win_rate
+            if rate > self.target + self.tolerance:
+                verdict = 1
+            elif rate < self.target - self.tolerance:
+                verdict = -1
+            else:
+                verdict = 0
+        return evaluation, verdict
+
+    def _result(self, enemy: CombatantTemplate, verdict: int) -> BalanceResult:
+        """Summarize the cached evaluation of a chosen candidate."""
+        evaluation = self.evaluate(enemy)[0]
+        result = evaluation.result
+        return BalanceResult(
+            enemy=enemy,
+            win_rate=evaluation.win_rate,
+            interval=wilson_interval(result.player_wins, result.fights, self.z),
+            converged=verdict == 0,
+        )
+
+    def tune(
+        self,
+        enemy_type: str,
+        parameters: Sequence[str] = PARAMETERS,
+        bounds: Optional[dict[str, tuple[int, int]]] = None,
+    ) -> BalanceResult:
+        """Find HP, AC and STR values that hit the target win rate.
+
+        Parameters are searched in order. Each one is bisected within its
+        bounds while the others stay fixed; if the target is reached the
+        search stops, otherwise the closest value is kept and the next
+        parameter is tried.
+
+        Args:
+            enemy_type: Key of ``ENEMY_TEMPLATES`` to start from
+            parameters: Any of "hp", "armor_class" and "STR", in search order
+            bounds: Inclusive search range per parameter
+
+        Returns:
+            The best candidate found
+        """
+        limits = {**DEFAULT_BOUNDS, **(bounds or {})}
+        base = CombatantTemplate.enemy(enemy_type).build()
+        enemy = CombatantTemplate.enemy(
+            enemy_type,
+            stats=base.scores(),
+            hp=base.hp,
+            armor_class=base.armor_class,
+        )
+
+        best, best_verdict = enemy, self.evaluate(enemy)[1]
+        if best_verdict == 0:
+            return self._result(best, best_verdict)
+
+        for parameter in parameters:
+            if parameter not in limits:
+                raise ValueError(f"Cannot tune {parameter!r}")
+            low, high = limits[parameter]
+            while low <= high:
+                middle = (low + high) // 2
+                candidate = _with_value(best, parameter, middle)
+                evaluation, verdict = self.evaluate(candidate)
+                if self._closer(evaluation, best):
+                    best, best_verdict = candidate, verdict
+                if verdict == 0:
+                    return self._result(candidate, verdict)
+                # The player winning too often calls for a tougher enemy.
+                if verdict > 0:
+                    low = middle + 1
+                else:
+                    high = middle - 1
+
+        return self._result(best, best_verdict)
+
+    def _closer(self, evaluation: Evaluation, best: CombatantTemplate) -> bool:
+        """Check if an evaluation is nearer the target than ``best``."""
+        current = self.evaluate(best)[0].win_rate
+        return abs(evaluation.win_rate - self.target) < abs(current - self.target)
+
+    def retune(
+        self,
+        enemy_types: Optional[Sequence[str]] = None,
+        parameters: Sequence[str] = PARAMETERS,
+        bounds: Optional[dict[str, tuple[int, int]]] = None,
+    ) -> dict[str, BalanceResult]:
+        """Tune several enemy templates (all of them if omitted)."""
+        types = enemy_types if enemy_types is not None else list(ENEMY_TEMPLATES)
+        return {
+            enemy_type: self.tune(enemy_type, parameters, bounds)
+            for enemy_type in types
+        }
+
+
+def _with_value(
+    enemy: CombatantTemplate, parameter: str, value: int
+) -> CombatantTemplate:
+    """Copy a fully specified enemy template with one value changed."""
+    if parameter == "hp":
+        return replace(enemy, hp=value)
+    if parameter == "armor_class":
+        return replace(enemy, armor_class=value)
+    if parameter in ABILITY_NAMES:
+        assert enemy.stats is not None
+        stats = list(enemy.stats)
+        stats[ABILITY_NAMES.index(parameter)] = value
+        return replace(enemy, stats=tuple(stats))
+    raise ValueError(f"Cannot tune {parameter!r}")
@@ -0,0 +1,195 @@
+"""Vectorized dice rolling for bulk analytics.
+
+The functions here mirror :mod:`dndgame.dice` but roll a whole batch in one
+call and return NumPy arrays instead of printing each roll. Results use the
+smallest signed integer dtype that can hold them unless ``dtype`` is given,
+so cast with ``.astype`` before adding large modifiers.
+"""
+
+from typing import Any, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+
+DiceArray = npt.NDArray[np.signedinteger[Any]]
+
+
+def _generator(rng: Optional[np.random.Generator]) -> np.random.Generator:
+    """Return ``rng`` or a freshly seeded generator."""
+    return rng if rng is not None else np.random.default_rng()
+
+
+def _smallest_dtype(max_value: int) -> np.dtype[np.signedinteger[Any]]:
+    """Pick the narrowest signed integer dtype holding ``max_value``."""
+    for candidate in (np.int8, np.int16, np.int32):
+        if max_value <= np.iinfo(candidate).max:
+            return np.dtype(candidate)
+    return np.dtype(np.int64)
+
+
+def _check(dice_type: int, number_of_dice: int, batch: int) -> None:
+    """Validate common arguments."""
+    if dice_type < 1:
+        raise ValueError(f"dice_type must be at least 1, got {dice_type}")
+    if number_of_dice < 0:
+        raise ValueError(f"number_of_dice must be non-negative, got {number_of_dice}")
+    if batch < 0:
+        raise ValueError(f"batch must be non-negative, got {batch}")
+
+
+def roll_batch(
+    dice_type: int,
+    number_of_dice: int,
+    batch: int,
+    rng: Optional[np.random.Generator] = None,
+    dtype: Optional[npt.DTypeLike] = None,
+) -> DiceArray:
+    """Roll ``batch`` sets of dice and keep every individual die.
+
+    Args:
+        dice_type: Type of dice (6 for d6, 20 for d20)
+        number_of_dice: How many dice in each set
+        batch: How many sets to roll
+        rng: Generator to draw from
+        dtype: Result dtype (smallest fitting signed int by default)
+
+    Returns:
+        Array of shape (batch, number_of_dice)
+
+    Example:
+        >>> roll_batch(6, 3, 2, np.random.default_rng(0)).shape
+        (2, 3)
+    """
+    _check(dice_type, number_of_dice, batch)
+    out_dtype = np.dtype(dtype) if dtype is not None else _smallest_dtype(dice_type)
+    return _generator(rng).integers(
+        1, dice_type + 1, size=(batch, number_of_dice), dtype=out_dtype
+    )
+
+
+def roll_totals(
+    dice_type: int,
+    number_of_dice: int,
+    batch: int,
+    rng: Optional[np.random.Generator] = None,
+    dtype: Optional[npt.DTypeLike] = None,
+) -> DiceArray:
+    """Roll ``batch`` sets of dice and return the sum of each set.
+
+    Args:
+        dice_type: Type of dice (6 for d6, 20 for d20)
+        number_of_dice: How many dice in each set
+        batch: How many sets to roll
+        rng: Generator to draw from
+        dtype: Result dtype (smallest fitting signed int by default)
+
+    Returns:
+        Array of shape (batch,)
+    """
+    out_dtype = (
+        np.dtype(dtype)
+        if dtype is not None
+        else _smallest_dtype(dice_type * number_of_dice)
+    )
+    if number_of_dice == 1:
+        return roll_batch(dice_type, 1, batch, rng, out_dtype)[:, 0]
+    rolls = roll_batch(dice_type, number_of_dice, batch, rng)
+    totals: DiceArray = rolls.sum(axis=1, dtype=out_dtype)
+    return totals
+
+
+def keep_highest(rolls: DiceArray, keep: int) -> DiceArray:
+    """Select the ``keep`` highest dice from each row of ``rolls``.
+
+    Args:
+        rolls: Array of shape (batch, dice)
+        keep: Dice to keep per row
+
+    Returns:
+        Array of shape (batch, keep), unordered within each row
+    """
+    dice = rolls.shape[1]
+    if not 0 <= keep <= dice:
+        raise ValueError(f"keep must be between 0 and {dice}, got {keep}")
+    if keep == dice or keep == 0:
+        return rolls[:, dice - keep :]
+    return np.partition(rolls, dice - keep, axis=1)[:, dice - keep :]
+
+
+def keep_lowest(rolls: DiceArray, keep: int) -> DiceArray:
+    """Select the ``keep`` lowest dice from each row of ``rolls``.
+
+    Args:
+        rolls: Array of shape (batch, dice)
+        keep: Dice to keep per row
+
+    Returns:
+        Array of shape (batch, keep), unordered within each row
+    """
+    dice = rolls.shape[1]
+    if not 0 <= keep <= dice:
+        raise ValueError(f"keep must be between 0 and {dice}, got {keep}")
+    if keep == dice or keep == 0:
+        return rolls[:, :keep]
+    return np.partition(rolls, keep - 1, axis=1)[:, :keep]
+
+
+def roll_keep_highest(
+    dice_type: int,
+    number_of_dice: int,
+    keep: int,
+    batch: int,
+    rng: Optional[np.random.Generator] = None,
+) -> DiceArray:
+    """Roll NdX per set and sum the ``keep`` highest (e.g. 4d6 keep 3).
+
+    Returns:
+        Array of shape (batch,) with the kept totals
+    """
+    rolls = roll_batch(dice_type, number_of_dice, batch, rng)
+    kept = keep_highest(rolls, keep)
+    totals: DiceArray = kept.sum(axis=1, dtype=_smallest_dtype(dice_type * keep))
+    return totals
+
+
+def roll_keep_lowest(
+    dice_type: int,
+    number_of_dice: int,
+    keep: int,
+    batch: int,
+    rng: Optional[np.random.Generator] = None,
+) -> DiceArray:
+    """Roll NdX per set and sum the ``keep`` lowest.
+
+    Returns:
+        Array of shape (batch,) with the kept totals
+    """
+    rolls = roll_batch(dice_type, number_of_dice, batch, rng)
+    kept = keep_lowest(rolls, keep)
+    totals: DiceArray = kept.sum(axis=1, dtype=_smallest_dtype(dice_type * keep))
+    return totals
+
+
+def roll_with_advantage(
+    dice_type: int, batch: int, rng: Optional[np.random.Generator] = None
+) -> DiceArray:
+    """Roll two dice per set and take the highest.
+
+    Returns:
+        Array of shape (batch,)
+    """
+    highest: DiceArray = roll_batch(dice_type, 2, batch, rng).max(axis=1)
+    return highest
+
+
+def roll_with_disadvantage(
+    dice_type: int, batch: int, rng: Optional[np.random.Generator] = None
+) -> DiceArray:
+    """Roll two dice per set and take the lowest.
+
+    Returns:
+        Array of shape (batch,)
+    """
+    lowest: DiceArray = roll_batch(dice_type, 2, batch, rng).min(axis=1)
+    return lowest
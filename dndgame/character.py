@@ -1,8 +1,11 @@
 """Character creation and management."""
 
-from typing import ClassVar
+from typing import ClassVar, Optional, Union
 from dndgame.dice import roll
+from dndgame.dice_expr import DiceExpression, compile_dice
 from dndgame.entity import Entity
+from dndgame.events import EventSink, StatRollEvent, StatsRollEvent, get_default_sink
+from dndgame.rng import RandomSource
 
 
 RACES: dict[str, dict[str, int]] = {
@@ -17,6 +20,8 @@ RACES: dict[str, dict[str, int]] = {
 class Character(Entity):
     """Player character with race and stats."""
 
+    __slots__ = ("race", "base_hp")
+
     available_races: ClassVar[list[str]] = list(RACES.keys())
 
     def __init__(self, name: str, race: str, base_hp: int) -> None:
@@ -29,12 +34,28 @@ class Character(Entity):
         self.race: str = race
         self.base_hp: int = base_hp
 
-    def roll_stats(self) -> None:
-        """Roll 3d6 for each ability score."""
-        print("Rolling stats...\n")
+    def roll_stats(
+        self,
+        sink: Optional[EventSink] = None,
+        rng: Optional[RandomSource] = None,
+        dice: Union[str, DiceExpression] = "3d6",
+    ) -> None:
+        """Roll each ability score (3d6 unless other dice are given).
+
+        Args:
+            sink: Where to report the rolls (default sink if omitted)
+            rng: Random source to roll with (global ``random`` if omitted)
+            dice: Dice notation per score, e.g. "4d6kh3"
+        """
+        expression = compile_dice(dice)
+        if sink is None:
+            sink = get_default_sink()
+        if sink.enabled:
+            sink.emit(StatsRollEvent(self.name))
         for stat in ["STR", "DEX", "CON", "INT", "WIS", "CHA"]:
-            print(f"Rolling {stat}...")
-            self.stats[stat] = roll(6, 3)
+            if sink.enabled:
+                sink.emit(StatRollEvent(self.name, stat))
+            self.stats[stat] = expression.roll(sink, rng, roll)
         self.max_hp = self.base_hp + self.get_modifier("CON")
         self.hp = self.max_hp
 
@@ -1,65 +1,165 @@
 """Combat system for encounters."""
 
-from typing import Optional
+from time import perf_counter
+from typing import Optional, Union
+from dndgame.combat_log import CombatLog, LogCode, LogDetail
 from dndgame.dice import roll
+from dndgame.dice_expr import DiceExpression, compile_dice
 from dndgame.entity import Entity
+from dndgame.events import (
+    AttackEvent,
+    CombatEndEvent,
+    CombatStartEvent,
+    DefeatEvent,
+    EventSink,
+    HitEvent,
+    InitiativeEvent,
+    MissEvent,
+    RoundStartEvent,
+    StatusEvent,
+    TurnEvent,
+    get_default_sink,
+)
+from dndgame.metrics import METRICS
+from dndgame.rng import RandomSource
+
+
+DEFAULT_DAMAGE_DICE: str = "1d6"
+
+
+class CombatBase:
+    """Attack rules, event reporting and randomness shared by all fights.
+
+    Attributes:
+        round: Current round number
+        combat_log: Compact log of attacks (and, if asked for, defeats)
+        sink: Receives combat events (the default sink if none is given)
+        rng: Random source for every roll in this fight (global ``random``
+            if none is given)
+        damage_dice: Damage of a hit before the STR modifier (minimum 1
+            after it), e.g. "1d8" or "2d6kh1"
+    """
+
+    def __init__(
+        self,
+        sink: Optional[EventSink] = None,
+        rng: Optional[RandomSource] = None,
+        log: Optional[CombatLog] = None,
+        damage_dice: Union[str, DiceExpression] = DEFAULT_DAMAGE_DICE,
+    ) -> None:
+        self.round: int = 0
+        self.combat_log: CombatLog = log if log is not None else CombatLog()
+        self.sink: EventSink = sink if sink is not None else get_default_sink()
+        self.rng: Optional[RandomSource] = rng
+        self.damage_dice: DiceExpression = compile_dice(damage_dice)
+
+    def attack(self, attacker: Entity, defender: Entity) -> int:
+        """Perform attack roll and apply damage."""
+        sink, rng = self.sink, self.rng
+        timed = METRICS.enabled
+        clock = perf_counter() if timed else 0.0
+        modifier = attacker.get_modifier("STR")
+        attack_roll: int = roll(20, 1, sink=sink, rng=rng) + modifier
+        if timed:
+            clock = _lap("attack_roll", clock)
+
+        if sink.enabled:
+            sink.emit(
+                AttackEvent(
+                    attacker.name, defender.name, attack_roll, defender.armor_class
+                )
+            )
+            if timed:
+                clock = _lap("logging", clock)
+
+        if attack_roll >= defender.armor_class:
+            damage: int = self.damage_dice.roll(sink, rng, roll) + modifier
+            damage = max(1, damage)
+            defender.take_damage(damage)
+            if timed:
+                clock = _lap("damage", clock)
+
+            if self.combat_log.detail & LogDetail.PER_ATTACK:
+                self.combat_log.record(
+                    LogCode.HIT, attacker.name, defender.name, damage
+                )
+            if sink.enabled:
+                sink.emit(HitEvent(attacker.name, defender.name, damage))
+            if timed:
+                _lap("logging", clock)
+                METRICS.inc("hits")
+            return damage
+        else:
+            if self.combat_log.detail & LogDetail.PER_ATTACK:
+                self.combat_log.record(LogCode.MISS, attacker.name, defender.name)
+            if sink.enabled:
+                sink.emit(MissEvent(attacker.name, defender.name))
+            if timed:
+                _lap("logging", clock)
+                METRICS.inc("misses")
+            return 0
 
 
-class Combat:
+def _lap(phase: str, start: float) -> float:
+    """Charge the time since ``start`` to a phase and restart the clock."""
+    now = perf_counter()
+    METRICS.add_time(phase, now - start)
+    return now
+
+
+class Combat(CombatBase):
     """Manages turn-based combat."""
 
-    def __init__(self, player: Entity, enemy: Entity) -> None:
+    def __init__(
+        self,
+        player: Entity,
+        enemy: Entity,
+        sink: Optional[EventSink] = None,
+        rng: Optional[RandomSource] = None,
+        log: Optional[CombatLog] = None,
+        damage_dice: Union[str, DiceExpression] = DEFAULT_DAMAGE_DICE,
+    ) -> None:
+        super().__init__(sink, rng, log, damage_dice)
         self.player: Entity = player
         self.enemy: Entity = enemy
-        self.round: int = 0
         self.initiative_order: list[Entity] = []
-        self.combat_log: list[str] = []
 
     def roll_initiative(self) -> list[Entity]:
         """Roll initiative for turn order."""
-        player_init: int = roll(20, 1) + self.player.get_modifier("DEX")
-        enemy_init: int = roll(20, 1) + self.enemy.get_modifier("DEX")
-
-        print(f"\n{self.player.name} initiative: {player_init}")
-        print(f"{self.enemy.name} initiative: {enemy_init}")
+        sink, rng = self.sink, self.rng
+        clock = perf_counter() if METRICS.enabled else 0.0
+        player_init: int = roll(20, 1, sink=sink, rng=rng)
+        player_init += self.player.get_modifier("DEX")
+        enemy_init: int = roll(20, 1, sink=sink, rng=rng)
+        enemy_init += self.enemy.get_modifier("DEX")
 
         if player_init >= enemy_init:
             self.initiative_order = [self.player, self.enemy]
-            print(f"{self.player.name} goes first!\n")
         else:
             self.initiative_order = [self.enemy, self.player]
-            print(f"{self.enemy.name} goes first!\n")
 
+        if sink.enabled:
+            sink.emit(
+                InitiativeEvent(
+                    self.player.name,
+                    player_init,
+                    self.enemy.name,
+                    enemy_init,
+                    self.initiative_order[0].name,
+                )
+            )
+        if METRICS.enabled:
+            _lap("initiative", clock)
         return self.initiative_order
 
-    def attack(self, attacker: Entity, defender: Entity) -> int:
-        """Perform attack roll and apply damage."""
-        attack_roll: int = roll(20, 1) + attacker.get_modifier("STR")
-
-        print(f"{attacker.name} attacks {defender.name}!")
-        print(f"Attack roll: {attack_roll} vs AC {defender.armor_class}")
-
-        if attack_roll >= defender.armor_class:
-            damage: int = roll(6, 1) + attacker.get_modifier("STR")
-            damage = max(1, damage)
-            defender.take_damage(damage)
-
-            log = f"{attacker.name} hit for {damage} damage!"
-            print(log)
-            self.combat_log.append(log)
-            return damage
-        else:
-            log = f"{attacker.name} missed!"
-            print(log)
-            self.combat_log.append(log)
-            return 0
-
     def execute_round(self) -> bool:
         """Execute one combat round. Returns True if combat continues."""
+        sink = self.sink
         self.round += 1
-        print(f"\n{'='*40}")
-        print(f"ROUND {self.round}")
-        print(f"{'='*40}")
+        if METRICS.enabled:
+            METRICS.inc("rounds")
+        if sink.enabled:
+            sink.emit(RoundStartEvent(self.round))
 
         for entity in self.initiative_order:
             if not entity.is_alive():
@@ -69,23 +169,37 @@ class Combat:
             if not opponent.is_alive():
                 break
 
-            print(f"\n{entity.name}'s turn:")
+            if sink.enabled:
+                sink.emit(TurnEvent(entity.name))
             self.attack(entity, opponent)
 
-            print(f"\n{self.player.name} HP: {self.player.hp}/{self.player.max_hp}")
-            print(f"{self.enemy.name} HP: {self.enemy.hp}/{self.enemy.max_hp}")
+            if sink.enabled:
+                sink.emit(
+                    StatusEvent(
+                        self.player.name,
+                        self.player.hp,
+                        self.player.max_hp,
+                        self.enemy.name,
+                        self.enemy.hp,
+                        self.enemy.max_hp,
+                    )
+                )
 
             if not opponent.is_alive():
-                print(f"\n{opponent.name} defeated!")
+                if self.combat_log.detail & LogDetail.SUMMARY:
+                    self.combat_log.record(LogCode.DEFEAT, entity.name, opponent.name)
+                if sink.enabled:
+                    sink.emit(DefeatEvent(opponent.name))
                 return False
 
         return True
 
     def run_combat(self) -> Optional[Entity]:
         """Run complete combat. Returns winner."""
-        print(f"\n{'='*40}")
-        print(f"COMBAT: {self.player.name} vs {self.enemy.name}")
-        print(f"{'='*40}")
+        if METRICS.enabled:
+            METRICS.inc("combats")
+        if self.sink.enabled:
+            self.sink.emit(CombatStartEvent(self.player.name, self.enemy.name))
 
         self.roll_initiative()
 
@@ -93,9 +207,12 @@ class Combat:
             if not self.execute_round():
                 break
 
-        if self.player.is_alive():
-            print(f"\n{self.player.name} is victorious!")
-            return self.player
-        else:
-            print(f"\n{self.player.name} has fallen!")
-            return self.enemy
+        winner = self.player if self.player.is_alive() else self.enemy
+        loser = self.enemy if winner is self.player else self.player
+        if self.combat_log.detail & LogDetail.SUMMARY:
+            self.combat_log.record(LogCode.VICTORY, winner.name, loser.name)
+        if self.sink.enabled:
+            self.sink.emit(
+                CombatEndEvent(self.player.name, winner.name, winner is self.player)
+            )
+        return winner
@@ -0,0 +1,219 @@
+"""Compact combat log.
+
+Records are packed arrays: an event code, actor id, target id and value
+per entry. Combatant names are interned into a small table and the
+familiar messages ("Goblin hit for 4 damage!") are rendered only when the
+log is read, so recording an attack formats no strings. The log is a ring
+buffer that keeps only the most recent ``capacity`` records, and names no
+kept record refers to are dropped from the table, so a fight uses the same
+memory no matter how long it runs. The default capacity is far more than a
+one-on-one fight writes, so the default log reads like the plain list it
+replaces; pass ``capacity=None`` to keep every record.
+
+Example:
+    >>> log = CombatLog(capacity=64, detail=LogDetail.SUMMARY)
+    >>> Combat(hero, goblin, log=log).run_combat()
+    >>> list(log)
+    ['Goblin defeated!', 'Hero is victorious!']
+"""
+
+from array import array
+from enum import IntEnum, IntFlag
+from typing import Iterator, NamedTuple, Optional, Union, overload
+
+
+DEFAULT_CAPACITY: int = 1024
+
+
+class LogDetail(IntFlag):
+    """Which records a combat log keeps.
+
+    PER_ATTACK (hits and misses) is what the classic log held; SUMMARY
+    adds defeats and the winner only when asked for.
+    """
+
+    OFF = 0
+    SUMMARY = 1
+    PER_ATTACK = 2
+    FULL = SUMMARY | PER_ATTACK
+
+
+class LogCode(IntEnum):
+    """Kinds of log records."""
+
+    HIT = 1
+    MISS = 2
+    DEFEAT = 3
+    VICTORY = 4
+
+
+_TEMPLATES: dict[int, str] = {
+    LogCode.HIT: "{actor} hit for {value} damage!",
+    LogCode.MISS: "{actor} missed!",
+    LogCode.DEFEAT: "{target} defeated!",
+    LogCode.VICTORY: "{actor} is victorious!",
+}
+
+
+class LogRecord(NamedTuple):
+    """One decoded log entry."""
+
+    code: LogCode
+    actor: str
+    target: str
+    value: int
+
+
+class CombatLog:
+    """Compact log of combat records in a fixed-size ring buffer.
+
+    Reading the log (iteration, indexing) yields rendered messages, oldest
+    first, like the plain list it replaces.
+
+    Attributes:
+        capacity: Most records kept, older ones being overwritten; None
+            keeps every record
+        detail: Which records are kept at all
+        total: Records written over the log's lifetime
+    """
+
+    __slots__ = (
+        "capacity",
+        "detail",
+        "total",
+        "_codes",
+        "_actors",
+        "_targets",
+        "_values",
+        "_names",
+        "_ids",
+    )
+
+    def __init__(
+        self,
+        capacity: Optional[int] = DEFAULT_CAPACITY,
+        detail: LogDetail = LogDetail.PER_ATTACK,
+    ) -> None:
+        if capacity is not None and capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.capacity: Optional[int] = capacity
+        self.detail: LogDetail = detail
+        self.total: int = 0
+        # Columns grow up to the capacity, then wrap around.
+        self._codes: "array[int]" = array("B")
+        self._actors: "array[int]" = array("i")
+        self._targets: "array[int]" = array("i")
+        self._values: "array[int]" = array("i")
+        self._names: list[str] = []
+        self._ids: dict[str, int] = {}
+
+    def intern(self, name: str) -> int:
+        """Get the id for a combatant name, adding it if new."""
+        name_id = self._ids.get(name)
+        if name_id is None:
+            name_id = len(self._names)
+            self._names.append(name)
+            self._ids[name] = name_id
+        return name_id
+
+    def record(self, code: LogCode, actor: str, target: str, value: int = 0) -> None:
+        """Append a record, overwriting the oldest one when full."""
+        capacity = self.capacity
+        if capacity is None or self.total < capacity:
+            self._codes.append(code)
+            self._actors.append(self.intern(actor))
+            self._targets.append(self.intern(target))
+            self._values.append(value)
+        else:
+            # Kept records name at most 2 * capacity combatants, so the
+            # table only needs pruning after that many new names.
+            if len(self._names) + 2 > 4 * capacity:
+                self._prune_names()
+            slot = self.total % capacity
+            self._codes[slot] = code
+            self._actors[slot] = self.intern(actor)
+            self._targets[slot] = self.intern(target)
+            self._values[slot] = value
+        self.total += 1
+
+    def _prune_names(self) -> None:
+        """Drop names no kept record refers to and renumber the rest."""
+        old_names = self._names
+        self._names = []
+        self._ids = {}
+        for column in (self._actors, self._targets):
+            for slot, name_id in enumerate(column):
+                column[slot] = self.intern(old_names[name_id])
+
+    @property
+    def dropped(self) -> int:
+        """Records overwritten because the log was full."""
+        return self.total - len(self)
+
+    def clear(self) -> None:
+        """Forget all records and interned names."""
+        self.total = 0
+        self._names.clear()
+        self._ids.clear()
+        for column in (self._codes, self._actors, self._targets, self._values):
+            del column[:]
+
+    def __len__(self) -> int:
+        if self.capacity is None:
+            return self.total
+        return min(self.total, self.capacity)
+
+    def _slot(self, index: int) -> int:
+        """Map a position (0 = oldest kept) to its buffer slot."""
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("combat log index out of range")
+        if self.capacity is None:
+            return index
+        return (self.total - size + index) % self.capacity
+
+    def _decode(self, slot: int) -> LogRecord:
+        return LogRecord(
+            LogCode(self._codes[slot]),
+            self._names[self._actors[slot]],
+            self._names[self._targets[slot]],
+            self._values[slot],
+        )
+
+    def records(self) -> Iterator[LogRecord]:
+        """Decoded records, oldest first."""
+        for index in range(len(self)):
+            yield self._decode(self._slot(index))
+
+    @staticmethod
+    def render(record: LogRecord) -> str:
+        """Format a record as its log message."""
+        return _TEMPLATES[record.code].format(
+            actor=record.actor, target=record.target, value=record.value
+        )
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, list[str]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return self.render(self._decode(self._slot(index)))
+
+    def __iter__(self) -> Iterator[str]:
+        return (self.render(record) for record in self.records())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (CombatLog, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"CombatLog({list(self)!r})"
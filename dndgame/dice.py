@@ -1,47 +1,81 @@
 """Dice rolling utilities for D&D mechanics."""
 
 import random
+from typing import Optional
 
+from dndgame.events import EventSink, RollEvent, get_default_sink
+from dndgame.metrics import METRICS
+from dndgame.rng import RandomSource
 
-def roll(dice_type: int, number_of_dice: int) -> int:
+
+def roll(
+    dice_type: int,
+    number_of_dice: int,
+    sink: Optional[EventSink] = None,
+    rng: Optional[RandomSource] = None,
+) -> int:
     """Roll dice and return sum.
 
     Args:
         dice_type: Type of dice (6 for d6, 20 for d20)
         number_of_dice: How many dice to roll
+        sink: Where to report the roll (default sink if omitted)
+        rng: Random source to roll with (global ``random`` if omitted)
 
     Returns:
         Sum of all rolls
     """
+    if METRICS.enabled:
+        METRICS.count_roll(dice_type, number_of_dice)
+    if sink is None:
+        sink = get_default_sink()
+    randint = rng.randint if rng is not None else random.randint
     total: int = 0
+    if not sink.enabled:
+        for _ in range(number_of_dice):
+            total += randint(1, dice_type)
+        return total
+
     rolls: list[int] = []
     for _ in range(number_of_dice):
-        result: int = random.randint(1, dice_type)
+        result: int = randint(1, dice_type)
         rolls.append(result)
         total += result
-    print(f"Rolling {number_of_dice}d{dice_type}: {rolls} = {total}")
+    sink.emit(RollEvent(dice_type, number_of_dice, tuple(rolls), total))
     return total
 
 
-def roll_with_advantage(dice_type: int) -> int:
+def roll_with_advantage(
+    dice_type: int,
+    sink: Optional[EventSink] = None,
+    rng: Optional[RandomSource] = None,
+) -> int:
     """Roll twice, take highest.
 
     Args:
         dice_type: Type of dice to roll
+        sink: Where to report the rolls
+        rng: Random source to roll with
 
     Returns:
         Higher of two rolls
     """
-    return max(roll(dice_type, 1), roll(dice_type, 1))
+    return max(roll(dice_type, 1, sink, rng), roll(dice_type, 1, sink, rng))
 
 
-def roll_with_disadvantage(dice_type: int) -> int:
+def roll_with_disadvantage(
+    dice_type: int,
+    sink: Optional[EventSink] = None,
+    rng: Optional[RandomSource] = None,
+) -> int:
     """Roll twice, take lowest.
 
     Args:
         dice_type: Type of dice to roll
+        sink: Where to report the rolls
+        rng: Random source to roll with
 
     Returns:
         Lower of two rolls
     """
-    return min(roll(dice_type, 1), roll(dice_type, 1))
+    return min(roll(dice_type, 1, sink, rng), roll(dice_type, 1, sink, rng))
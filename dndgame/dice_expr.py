@@ -0,0 +1,455 @@
+"""Dice notation compiled into cached evaluators.
+
+Supported notation, combined with ``+``, ``-``, parentheses and ``*`` or
+``/`` by a whole number (``/`` rounds down):
+
+* ``2d6``, ``d20``: roll and add up dice
+* ``4d6kh3``, ``4d6kl1`` (``k3`` is ``kh3``): keep the highest/lowest dice
+* ``1d20adv``, ``1d20dis``: roll the dice twice, keep the higher/lower total
+
+:func:`compile_dice` parses an expression once and caches the result, so
+looking up "2d6+3" again costs a dictionary hit. A compiled
+:class:`DiceExpression` rolls through :func:`dndgame.dice.roll` (so sinks,
+random sources and metrics work as usual) and knows its exact
+distribution, mean and range without rolling.
+
+Example:
+    >>> fireball = compile_dice("8d6/2")
+    >>> fireball.minimum, fireball.maximum, fireball.mean
+    (4, 24, 13.75)
+    >>> damage = fireball.roll(rng=random.Random(7))
+"""
+
+import re
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from itertools import combinations_with_replacement
+from math import factorial, prod
+from typing import TYPE_CHECKING, Callable, Optional, Union
+
+from dndgame.dice import roll
+from dndgame.events import EventSink
+from dndgame.rng import RandomSource
+
+
+if TYPE_CHECKING:
+    from fractions import Fraction
+
+# roll(dice_type, number_of_dice, sink, rng) -> total
+Roller = Callable[[int, int, Optional[EventSink], Optional[RandomSource]], int]
+
+# Compiled node: (sink, rng, roller) -> total
+Evaluator = Callable[[Optional[EventSink], Optional[RandomSource], Roller], int]
+
+# Outcome counts and the number of equally likely outcomes they add up to.
+Counts = tuple[dict[int, int], int]
+
+CACHE_SIZE: int = 4096
+
+_TOKEN = re.compile(
+    r"(?P<dice>(?P<count>\d*)d(?P<sides>\d+)"
+    r"(?:(?P<keep>kh|kl|k)(?P<kept>\d+))?(?P<mode>adv|dis)?)"
+    r"|(?P<number>\d+)"
+    r"|(?P<op>[-+*/()])"
+)
+
+
+class DiceSyntaxError(ValueError):
+    """Raised for dice notation that can't be parsed."""
+
+
+class _Node(ABC):
+    """Parsed expression node."""
+
+    @abstractmethod
+    def compile(self) -> Evaluator:
+        """Build a closure that rolls this node."""
+
+    @abstractmethod
+    def counts(self) -> Counts:
+        """Exact outcome counts of this node."""
+
+    @abstractmethod
+    def bounds(self) -> tuple[int, int]:
+        """Smallest and largest possible total."""
+
+
+class _Constant(_Node):
+    """A whole number."""
+
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+    def compile(self) -> Evaluator:
+        value = self.value
+        return lambda sink, rng, roller: value
+
+    def counts(self) -> Counts:
+        return {self.value: 1}, 1
+
+    def bounds(self) -> tuple[int, int]:
+        return self.value, self.value
+
+
+class _Dice(_Node):
+    """A group of dice, with optional keep and advantage rules."""
+
+    def __init__(
+        self,
+        count: int,
+        sides: int,
+        keep: Optional[str],
+        kept: int,
+        mode: Optional[str],
+    ) -> None:
+        if sides < 1:
+            raise DiceSyntaxError(f"Dice need at least one side, got d{sides}")
+        if keep is not None and not 0 <= kept <= count:
+            raise DiceSyntaxError(f"Can't keep {kept} of {count} dice")
+        self.count = count
+        self.sides = sides
+        self.keep = keep
+        self.kept = kept if keep is not None else count
+        self.mode = mode
+
+    def _group(self) -> Evaluator:
+        count, sides, kept = self.count, self.sides, self.kept
+        if self.keep is None:
+            return lambda sink, rng, roller: roller(sides, count, sink, rng)
+        highest = self.keep == "kh"
+
+        def keep(
+            sink: Optional[EventSink], rng: Optional[RandomSource], roller: Roller
+        ) -> int:
+            rolls = sorted(roller(sides, 1, sink, rng) for _ in range(count))
+            return sum(rolls[count - kept :] if highest else rolls[:kept])
+
+        return keep
+
+    def compile(self) -> Evaluator:
+        group = self._group()
+        if self.mode is None:
+            return group
+        pick = max if self.mode == "adv" else min
+        return lambda sink, rng, roller: pick(
+            group(sink, rng, roller), group(sink, rng, roller)
+        )
+
+    def _group_counts(self) -> Counts:
+        count, sides, kept = self.count, self.sides, self.kept
+        if self.keep is None:
+            die: Counts = ({face: 1 for face in range(1, sides + 1)}, sides)
+            result: Counts = ({0: 1}, 1)
+            for _ in range(count):
+                result = _combine(result, die)
+            return result
+        # Walk sorted rolls once each, weighted by how many orders give them.
+        outcomes: dict[int, int] = {}
+        for rolls in combinations_with_replacement(range(1, sides + 1), count):
+            ways = factorial(count) // prod(
+                factorial(rolls.count(face)) for face in set(rolls)
+            )
+            total = sum(rolls[count - kept :] if self.keep == "kh" else rolls[:kept])
+            outcomes[total] = outcomes.get(total, 0) + ways
+        return outcomes, sides**count
+
+    def counts(self) -> Counts:
+        outcomes, total = self._group_counts()
+        if self.mode is None:
+            return outcomes, total
+        # P(max <= t) = F(t)^2 and P(min >= t) = (1 - F(t - 1))^2, in counts.
+        result: dict[int, int] = {}
+        below = 0
+        for value in sorted(outcomes):
+            at_most = below + outcomes[value]
+            if self.mode == "adv":
+                result[value] = at_most * at_most - below * below
+            else:
+                result[value] = (total - below) ** 2 - (total - at_most) ** 2
+            below = at_most
+        return result, total * total
+
+    def bounds(self) -> tuple[int, int]:
+        return self.kept, self.kept * self.sides
+
+
+class _Negate(_Node):
+    """Unary minus."""
+
+    def __init__(self, operand: _Node) -> None:
+        self.operand = operand
+
+    def compile(self) -> Evaluator:
+        operand = self.operand.compile()
+        return lambda sink, rng, roller: -operand(sink, rng, roller)
+
+    def counts(self) -> Counts:
+        outcomes, total = self.operand.counts()
+        return {-value: ways for value, ways in outcomes.items()}, total
+
+    def bounds(self) -> tuple[int, int]:
+        low, high = self.operand.bounds()
+        return -high, -low
+
+
+class _Sum(_Node):
+    """Sum or difference of two nodes."""
+
+    def __init__(self, left: _Node, right: _Node, sign: int) -> None:
+        self.left = left
+        self.right = right
+        self.sign = sign
+
+    def compile(self) -> Evaluator:
+        left, sign = self.left.compile(), self.sign
+        if isinstance(self.right, _Constant):
+            offset = sign * self.right.value
+            return lambda sink, rng, roller: left(sink, rng, roller) + offset
+        right = self.right.compile()
+        if sign > 0:
+            return lambda sink, rng, roller: left(sink, rng, roller) + right(
+                sink, rng, roller
+            )
+        return lambda sink, rng, roller: left(sink, rng, roller) - right(
+            sink, rng, roller
+        )
+
+    def counts(self) -> Counts:
+        right = self.right if self.sign > 0 else _Negate(self.right)
+        return _combine(self.left.counts(), right.counts())
+
+    def bounds(self) -> tuple[int, int]:
+        left_low, left_high = self.left.bounds()
+        right_low, right_high = self.right.bounds()
+        if self.sign > 0:
+            return left_low + right_low, left_high + right_high
+        return left_low - right_high, left_high - right_low
+
+
+class _Scale(_Node):
+    """Multiplication or floor division by a whole number."""
+
+    def __init__(self, operand: _Node, op: str, factor: int) -> None:
+        if op == "/" and factor == 0:
+            raise DiceSyntaxError("Division by zero")
+        self.operand = operand
+        self.op = op
+        self.factor = factor
+
+    def _apply(self, value: int) -> int:
+        return value * self.factor if self.op == "*" else value // self.factor
+
+    def compile(self) -> Evaluator:
+        operand, factor = self.operand.compile(), self.factor
+        if self.op == "*":
+            return lambda sink, rng, roller: operand(sink, rng, roller) * factor
+        return lambda sink, rng, roller: operand(sink, rng, roller) // factor
+
+    def counts(self) -> Counts:
+        outcomes, total = self.operand.counts()
+        result: dict[int, int] = {}
+        for value, ways in outcomes.items():
+            scaled = self._apply(value)
+            result[scaled] = result.get(scaled, 0) + ways
+        return result, total
+
+    def bounds(self) -> tuple[int, int]:
+        low, high = (self._apply(value) for value in self.operand.bounds())
+        return min(low, high), max(low, high)
+
+
+def _combine(left: Counts, right: Counts) -> Counts:
+    """Counts of the sum of two independent nodes."""
+    result: dict[int, int] = {}
+    for a, a_ways in left[0].items():
+        for b, b_ways in right[0].items():
+            result[a + b] = result.get(a + b, 0) + a_ways * b_ways
+    return result, left[1] * right[1]
+
+
+class _Parser:
+    """Recursive-descent parser over the tokens of one expression."""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.tokens: list[re.Match[str]] = []
+        position = 0
+        while position < len(text):
+            # Whitespace only separates tokens: "2d6 3" is not "2d63".
+            if text[position].isspace():
+                position += 1
+                continue
+            match = _TOKEN.match(text, position)
+            if match is None:
+                raise DiceSyntaxError(
+                    f"Unexpected {text[position:]!r} in dice expression {text!r}"
+                )
+            self.tokens.append(match)
+            position = match.end()
+        self.index = 0
+
+    def _peek_op(self) -> Optional[str]:
+        if self.index < len(self.tokens):
+            return self.tokens[self.index].group("op")
+        return None
+
+    def parse(self) -> _Node:
+        if not self.tokens:
+            raise DiceSyntaxError("Empty dice expression")
+        node = self._sum()
+        if self.index < len(self.tokens):
+            raise DiceSyntaxError(
+                f"Unexpected {self.tokens[self.index].group()!r} in {self.text!r}"
+            )
+        return node
+
+    def _sum(self) -> _Node:
+        node = self._product()
+        while self._peek_op() in ("+", "-"):
+            sign = 1 if self.tokens[self.index].group("op") == "+" else -1
+            self.index += 1
+            node = _Sum(node, self._product(), sign)
+        return node
+
+    def _product(self) -> _Node:
+        node = self._factor()
+        while self._peek_op() in ("*", "/"):
+            op = self.tokens[self.index].group("op")
+            self.index += 1
+            factor = self._factor()
+            if not isinstance(factor, _Constant):
+                raise DiceSyntaxError(
+                    f"Can only {'multiply' if op == '*' else 'divide'} by a "
+                    f"number in {self.text!r}"
+                )
+            node = _Scale(node, op, factor.value)
+        return node
+
+    def _factor(self) -> _Node:
+        if self.index >= len(self.tokens):
+            raise DiceSyntaxError(f"Dice expression {self.text!r} ends too early")
+        token = self.tokens[self.index]
+        self.index += 1
+        if token.group("dice"):
+            return _Dice(
+                int(token.group("count") or 1),
+                int(token.group("sides")),
+                {"k": "kh"}.get(token.group("keep"), token.group("keep")),
+                int(token.group("kept") or 0),
+                token.group("mode"),
+            )
+        if token.group("number"):
+            return _Constant(int(token.group("number")))
+        op = token.group("op")
+        if op == "-":
+            operand = self._factor()
+            if isinstance(operand, _Constant):
+                return _Constant(-operand.value)
+            return _Negate(operand)
+        if op == "(":
+            node = self._sum()
+            if self._peek_op() != ")":
+                raise DiceSyntaxError(f"Missing ')' in {self.text!r}")
+            self.index += 1
+            return node
+        raise DiceSyntaxError(f"Unexpected {op!r} in {self.text!r}")
+
+
+class DiceExpression:
+    """A compiled dice expression.
+
+    Attributes:
+        text: Normalized notation (lower case, no spaces)
+        minimum: Smallest possible total
+        maximum: Largest possible total
+    """
+
+    __slots__ = ("text", "minimum", "maximum", "_node", "_evaluate", "_distribution")
+
+    def __init__(self, text: str) -> None:
+        parser = _Parser(text)
+        self._node: _Node = parser.parse()
+        # Parsed expressions never hold two operands in a row, so joining
+        # the tokens can't merge them.
+        self.text: str = "".join(token.group() for token in parser.tokens)
+        self._evaluate: Evaluator = self._node.compile()
+        self.minimum, self.maximum = self._node.bounds()
+        self._distribution: Optional[dict[int, "Fraction"]] = None
+
+    def __repr__(self) -> str:
+        return f"DiceExpression({self.text!r})"
+
+    def roll(
+        self,
+        sink: Optional[EventSink] = None,
+        rng: Optional[RandomSource] = None,
+        roller: Roller = roll,
+    ) -> int:
+        """Roll the expression.
+
+        Args:
+            sink: Where to report the dice rolls (default sink if omitted)
+            rng: Random source to roll with (global ``random`` if omitted)
+            roller: Function rolling each group of dice
+
+        Returns:
+            The total
+        """
+        return self._evaluate(sink, rng, roller)
+
+    def distribution(self) -> dict[int, "Fraction"]:
+        """Exact probability of every possible total, lowest first.
+
+        Computed on first use and kept; treat it as read-only.
+        """
+        if self._distribution is None:
+            from fractions import Fraction
+
+            outcomes, total = self._node.counts()
+            self._distribution = {
+                value: Fraction(outcomes[value], total)
+                for value in sorted(outcomes)
+                if outcomes[value]
+            }
+        return self._distribution
+
+    def probability(self, total: int) -> float:
+        """Chance of rolling exactly ``total``."""
+        return float(self.distribution().get(total, 0))
+
+    @property
+    def mean(self) -> float:
+        """Expected total."""
+        return float(sum(value * p for value, p in self.distribution().items()))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _compile(text: str) -> DiceExpression:
+    expression = DiceExpression(text)
+    if expression.text != text:
+        # Share one instance between every spelling of the same notation.
+        return _compile(expression.text)
+    return expression
+
+
+def compile_dice(expression: Union[str, DiceExpression]) -> DiceExpression:
+    """Parse dice notation once; later calls return the cached result.
+
+    Args:
+        expression: Notation such as "2d6+3", or an already compiled one
+
+    Raises:
+        DiceSyntaxError: If the notation can't be parsed
+    """
+    if isinstance(expression, DiceExpression):
+        return expression
+    return _compile(" ".join(expression.lower().split()))
+
+
+def roll_dice(
+    expression: Union[str, DiceExpression],
+    sink: Optional[EventSink] = None,
+    rng: Optional[RandomSource] = None,
+) -> int:
+    """Roll dice notation such as "1d20adv+5"."""
+    return compile_dice(expression).roll(sink, rng)
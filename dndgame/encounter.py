@@ -0,0 +1,203 @@
+"""Team-vs-team encounters with a heap-based initiative scheduler.
+
+:class:`Encounter` generalizes :class:`~dndgame.combat.Combat` from one
+player and one enemy to a party and a horde of any size, using the same
+attack rules. Turns come off a heap keyed by (round, initiative), so each
+turn costs O(log n); fallen combatants are dropped from the heap lazily
+when their turn comes up, and targets are drawn from an index of living
+members with O(1) removal.
+
+Example:
+    >>> party = [Character(f"Hero {i}", "Human", 12) for i in range(6)]
+    >>> horde = [Enemy("Goblin", f"Goblin {i}") for i in range(1000)]
+    >>> winner = Encounter(party, horde, sink=NullSink()).run_combat()
+"""
+
+import heapq
+import random
+from time import perf_counter
+from typing import Optional, Sequence, Union
+
+from dndgame.combat import DEFAULT_DAMAGE_DICE, CombatBase
+from dndgame.combat_log import CombatLog, LogCode, LogDetail
+from dndgame.dice import roll
+from dndgame.dice_expr import DiceExpression
+from dndgame.entity import Entity
+from dndgame.events import (
+    CombatEndEvent,
+    CombatStartEvent,
+    DefeatEvent,
+    EventSink,
+    RoundStartEvent,
+    TurnEvent,
+)
+from dndgame.metrics import METRICS
+from dndgame.rng import RandomSource
+
+
+class Team:
+    """One side of an encounter with an index of its living members.
+
+    Attributes:
+        name: Team name used in events
+        members: Every member, living or not
+    """
+
+    __slots__ = ("name", "members", "_living", "_position")
+
+    def __init__(self, name: str, members: Sequence[Entity]) -> None:
+        self.name: str = name
+        self.members: list[Entity] = list(members)
+        self._living: list[int] = [
+            i for i, member in enumerate(self.members) if member.is_alive()
+        ]
+        self._position: list[int] = [-1] * len(self.members)
+        for slot, index in enumerate(self._living):
+            self._position[index] = slot
+
+    def living_count(self) -> int:
+        """Number of members still standing."""
+        return len(self._living)
+
+    def is_defeated(self) -> bool:
+        """Check if no member is standing."""
+        return not self._living
+
+    def living(self) -> list[Entity]:
+        """Members still standing (in no particular order)."""
+        return [self.members[i] for i in self._living]
+
+    def random_living(self, rng: Optional[RandomSource]) -> int:
+        """Pick a standing member's index uniformly at random."""
+        randint = rng.randint if rng is not None else random.randint
+        return self._living[randint(0, len(self._living) - 1)]
+
+    def remove(self, index: int) -> None:
+        """Drop a fallen member from the living index in O(1)."""
+        slot = self._position[index]
+        if slot < 0:
+            return
+        last = self._living.pop()
+        if last != index:
+            self._living[slot] = last
+            self._position[last] = slot
+        self._position[index] = -1
+
+
+class Encounter(CombatBase):
+    """Manages turn-based combat between two teams.
+
+    Each combatant rolls initiative once and acts in that order every
+    round, attacking a random standing member of the other team. Ties go
+    to the party, then to the earlier member, as in :class:`Combat`.
+
+    Attributes:
+        party: The player side
+        horde: The enemy side
+    """
+
+    def __init__(
+        self,
+        party: Sequence[Entity],
+        horde: Sequence[Entity],
+        sink: Optional[EventSink] = None,
+        rng: Optional[RandomSource] = None,
+        party_name: str = "Party",
+        horde_name: str = "Horde",
+        log: Optional[CombatLog] = None,
+        damage_dice: Union[str, DiceExpression] = DEFAULT_DAMAGE_DICE,
+    ) -> None:
+        super().__init__(sink, rng, log, damage_dice)
+        self.party: Team = Team(party_name, party)
+        self.horde: Team = Team(horde_name, horde)
+        # (round, -initiative, order, team, member) for every pending turn.
+        self._queue: list[tuple[int, int, int, int, int]] = []
+        self._teams: tuple[Team, Team] = (self.party, self.horde)
+
+    def roll_initiative(self) -> None:
+        """Roll initiative for every combatant and schedule round one."""
+        sink, rng = self.sink, self.rng
+        clock = perf_counter() if METRICS.enabled else 0.0
+        queue: list[tuple[int, int, int, int, int]] = []
+        order = 0
+        for side, team in enumerate(self._teams):
+            for index, member in enumerate(team.members):
+                if not member.is_alive():
+                    continue
+                initiative = roll(20, 1, sink=sink, rng=rng)
+                initiative += member.get_modifier("DEX")
+                queue.append((1, -initiative, order, side, index))
+                order += 1
+        heapq.heapify(queue)
+        self._queue = queue
+        if METRICS.enabled:
+            METRICS.add_time("initiative", perf_counter() - clock)
+
+    def execute_round(self) -> bool:
+        """Execute one combat round. Returns True if combat continues."""
+        sink, rng, queue = self.sink, self.rng, self._queue
+        self.round += 1
+        if METRICS.enabled:
+            METRICS.inc("rounds")
+        if sink.enabled:
+            sink.emit(RoundStartEvent(self.round))
+
+        while queue and queue[0][0] == self.round:
+            _, neg_initiative, order, side, index = heapq.heappop(queue)
+            team = self._teams[side]
+            actor = team.members[index]
+            if not actor.is_alive():
+                # Lazy removal: a fallen combatant simply isn't rescheduled.
+                continue
+
+            opponents = self._teams[1 - side]
+            target_index = opponents.random_living(rng)
+            target = opponents.members[target_index]
+            if sink.enabled:
+                sink.emit(TurnEvent(actor.name))
+            self.attack(actor, target)
+            next_turn = (self.round + 1, neg_initiative, order, side, index)
+            heapq.heappush(queue, next_turn)
+
+            if not target.is_alive():
+                opponents.remove(target_index)
+                if self.combat_log.detail & LogDetail.SUMMARY:
+                    self.combat_log.record(LogCode.DEFEAT, actor.name, target.name)
+                if sink.enabled:
+                    sink.emit(DefeatEvent(target.name))
+                if opponents.is_defeated():
+                    return False
+
+        return True
+
+    def run_combat(self, max_rounds: Optional[int] = None) -> Optional[Team]:
+        """Run complete combat.
+
+        Args:
+            max_rounds: Stop after this many rounds (no limit if omitted)
+
+        Returns:
+            The winning team, or None if the round limit was reached
+        """
+        if METRICS.enabled:
+            METRICS.inc("combats")
+        if self.sink.enabled:
+            self.sink.emit(CombatStartEvent(self.party.name, self.horde.name))
+
+        self.roll_initiative()
+
+        while not self.party.is_defeated() and not self.horde.is_defeated():
+            if max_rounds is not None and self.round >= max_rounds:
+                return None
+            if not self.execute_round():
+                break
+
+        winner = self.horde if self.party.is_defeated() else self.party
+        loser = self.party if winner is self.horde else self.horde
+        if self.combat_log.detail & LogDetail.SUMMARY:
+            self.combat_log.record(LogCode.VICTORY, winner.name, loser.name)
+        if self.sink.enabled:
+            self.sink.emit(
+                CombatEndEvent(self.party.name, winner.name, winner is self.party)
+            )
+        return winner
@@ -23,6 +23,8 @@ ENEMY_TEMPLATES: dict[str, dict[str, Any]] = {
 class Enemy(Entity):
     """Enemy creature from template."""
 
+    __slots__ = ("enemy_type",)
+
     available_types: ClassVar[list[str]] = list(ENEMY_TEMPLATES.keys())
 
     def __init__(self, enemy_type: str, name: str | None = None) -> None:
@@ -41,4 +43,4 @@ class Enemy(Entity):
 
         self.enemy_type: str = enemy_type
         if isinstance(template["stats"], dict):
-            self.stats = template["stats"].copy()
+            self.stats = template["stats"]
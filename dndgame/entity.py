@@ -1,40 +1,126 @@
 """Base entity class for all combat participants."""
 
 from abc import ABC
+from array import array
+from enum import IntEnum
+from typing import Iterator, Mapping, MutableMapping, Union
+
+
+class Ability(IntEnum):
+    """Ability scores, in the fixed order they are stored in."""
+
+    STR = 0
+    DEX = 1
+    CON = 2
+    INT = 3
+    WIS = 4
+    CHA = 5
+
+
+ABILITY_NAMES: tuple[str, ...] = tuple(ability.name for ability in Ability)
+
+_COUNT: int = len(ABILITY_NAMES)
+
+# Slot of each score and of its modifier in the packed block. Keys accept
+# "STR" as well as Ability.STR (which hashes like the int 0).
+_INDEX: dict[Union[str, int], int] = {
+    **{ability.name: ability.value for ability in Ability},
+    **{ability.value: ability.value for ability in Ability},
+}
+_MOD_INDEX: dict[Union[str, int], int] = {
+    key: _COUNT + index for key, index in _INDEX.items()
+}
+
+_DEFAULT_BLOCK: "array[int]" = array("h", [10] * _COUNT + [0] * _COUNT)
+
+
+class StatBlock(MutableMapping[str, int]):
+    """Dict-like view of an entity's ability scores.
+
+    Reads and writes go straight to the entity's packed score array, so
+    ``entity.stats["STR"] = 16`` keeps the cached modifier in sync.
+    """
+
+    __slots__ = ("_entity",)
+
+    def __init__(self, entity: "Entity") -> None:
+        self._entity = entity
+
+    def __getitem__(self, stat: str) -> int:
+        return self._entity._block[_INDEX[stat]]
+
+    def __setitem__(self, stat: str, value: int) -> None:
+        self._entity.set_score(stat, value)
+
+    def __delitem__(self, stat: str) -> None:
+        raise TypeError("Ability scores cannot be removed")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(ABILITY_NAMES)
+
+    def __len__(self) -> int:
+        return _COUNT
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
 
 
 class Entity(ABC):
     """Base class for all entities in combat.
 
+    Ability scores live in one packed ``array`` alongside their modifiers,
+    which are recomputed whenever a score changes rather than on every
+    lookup. ``stats`` remains available as a dict-like view.
+
     Attributes:
         name: Entity name
-        stats: Ability scores dict
+        stats: Ability scores (dict-like view)
         hp: Current hit points
         max_hp: Maximum hit points
         armor_class: Defense rating
         level: Entity level
     """
 
+    __slots__ = ("name", "_block", "hp", "max_hp", "armor_class", "level")
+
     def __init__(
         self, name: str, max_hp: int, armor_class: int = 10, level: int = 1
     ) -> None:
         self.name: str = name
-        self.stats: dict[str, int] = {
-            "STR": 10,
-            "DEX": 10,
-            "CON": 10,
-            "INT": 10,
-            "WIS": 10,
-            "CHA": 10,
-        }
+        # Scores in slots 0-5, their modifiers in slots 6-11.
+        self._block: array[int] = array("h", _DEFAULT_BLOCK)
         self.hp: int = max_hp
         self.max_hp: int = max_hp
         self.armor_class: int = armor_class
         self.level: int = level
 
-    def get_modifier(self, stat: str) -> int:
+    @property
+    def stats(self) -> MutableMapping[str, int]:
+        """Ability scores by name, as a :class:`StatBlock` view."""
+        return StatBlock(self)
+
+    @stats.setter
+    def stats(self, scores: Mapping[str, int]) -> None:
+        """Replace all scores; abilities not given reset to 10."""
+        # Copy first: ``scores`` may be this entity's own StatBlock view.
+        values = dict(scores)
+        self._block[:] = _DEFAULT_BLOCK
+        for stat, value in values.items():
+            self.set_score(stat, value)
+
+    def scores(self) -> tuple[int, ...]:
+        """Ability scores in :class:`Ability` order."""
+        return tuple(self._block[:_COUNT])
+
+    def set_score(self, stat: Union[str, int], value: int) -> None:
+        """Set one ability score and refresh its modifier."""
+        index = _INDEX[stat]
+        self._block[index] = value
+        self._block[_COUNT + index] = (value - 10) // 2
+
+    def get_modifier(self, stat: Union[str, int]) -> int:
         """Calculate ability modifier from stat."""
-        return (self.stats[stat] - 10) // 2
+        return self._block[_MOD_INDEX[stat]]
 
     def is_alive(self) -> bool:
         """Check if entity is alive."""
@@ -0,0 +1,396 @@
+"""Structured game events and the sinks that consume them.
+
+Dice, combat and character code report what happens as event objects
+instead of printing. A sink decides what to do with them: print the
+classic text, drop them, keep them in memory or write JSON lines. Callers
+check :attr:`EventSink.enabled` before building an event, so with a
+:class:`NullSink` no event objects or strings are created at all.
+
+Example:
+    >>> combat = Combat(hero, goblin, sink=NullSink())  # silent fight
+"""
+
+import sys
+from abc import ABC, abstractmethod
+from typing import Any, ClassVar, Optional, TextIO
+
+
+class Event(ABC):
+    """Base class for all events.
+
+    Events are immutable and compare equal when they are the same kind with
+    the same field values. Each kind lists its fields in ``__slots__``;
+    these are plain slotted classes rather than dataclasses so importing
+    this module stays cheap for short-lived scripted runs.
+    """
+
+    __slots__: tuple[str, ...] = ()
+
+    kind: ClassVar[str] = "event"
+
+    def __init__(self, *values: Any) -> None:
+        for name, value in zip(self.__slots__, values, strict=True):
+            object.__setattr__(self, name, value)
+
+    @abstractmethod
+    def render(self) -> str:
+        """Human-readable text for the event."""
+
+    def _values(self) -> tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"cannot delete field {name!r}")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Event) or type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self) -> int:
+        return hash(self._values())
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    def __reduce__(self) -> tuple[type["Event"], tuple[Any, ...]]:
+        return type(self), self._values()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain-data form with the event kind included."""
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data["event"] = self.kind
+        return data
+
+
+class RollEvent(Event):
+    """Dice were rolled."""
+
+    __slots__ = ("dice_type", "number_of_dice", "rolls", "total")
+    kind: ClassVar[str] = "roll"
+    dice_type: int
+    number_of_dice: int
+    rolls: tuple[int, ...]
+    total: int
+
+    def __init__(
+        self, dice_type: int, number_of_dice: int, rolls: tuple[int, ...], total: int
+    ) -> None:
+        super().__init__(dice_type, number_of_dice, rolls, total)
+
+    def render(self) -> str:
+        dice = f"{self.number_of_dice}d{self.dice_type}"
+        return f"Rolling {dice}: {list(self.rolls)} = {self.total}"
+
+
+class StatsRollEvent(Event):
+    """A character started rolling ability scores."""
+
+    __slots__ = ("character",)
+    kind: ClassVar[str] = "stats_roll"
+    character: str
+
+    def __init__(self, character: str) -> None:
+        super().__init__(character)
+
+    def render(self) -> str:
+        return "Rolling stats...\n"
+
+
+class StatRollEvent(Event):
+    """A single ability score is about to be rolled."""
+
+    __slots__ = ("character", "stat")
+    kind: ClassVar[str] = "stat_roll"
+    character: str
+    stat: str
+
+    def __init__(self, character: str, stat: str) -> None:
+        super().__init__(character, stat)
+
+    def render(self) -> str:
+        return f"Rolling {self.stat}..."
+
+
+class CombatStartEvent(Event):
+    """A fight begins."""
+
+    __slots__ = ("player", "enemy")
+    kind: ClassVar[str] = "combat_start"
+    player: str
+    enemy: str
+
+    def __init__(self, player: str, enemy: str) -> None:
+        super().__init__(player, enemy)
+
+    def render(self) -> str:
+        return f"\n{'='*40}\nCOMBAT: {self.player} vs {self.enemy}\n{'='*40}"
+
+
+class InitiativeEvent(Event):
+    """Initiative was rolled and decided who acts first."""
+
+    __slots__ = ("player", "player_initiative", "enemy", "enemy_initiative", "first")
+    kind: ClassVar[str] = "initiative"
+    player: str
+    player_initiative: int
+    enemy: str
+    enemy_initiative: int
+    first: str
+
+    def __init__(
+        self,
+        player: str,
+        player_initiative: int,
+        enemy: str,
+        enemy_initiative: int,
+        first: str,
+    ) -> None:
+        super().__init__(player, player_initiative, enemy, enemy_initiative, first)
+
+    def render(self) -> str:
+        return (
+            f"\n{self.player} initiative: {self.player_initiative}\n"
+            f"{self.enemy} initiative: {self.enemy_initiative}\n"
+            f"{self.first} goes first!\n"
+        )
+
+
+class RoundStartEvent(Event):
+    """A new combat round begins."""
+
+    __slots__ = ("round",)
+    kind: ClassVar[str] = "round_start"
+    round: int
+
+    def __init__(self, round: int) -> None:
+        super().__init__(round)
+
+    def render(self) -> str:
+        return f"\n{'='*40}\nROUND {self.round}\n{'='*40}"
+
+
+class TurnEvent(Event):
+    """A combatant takes their turn."""
+
+    __slots__ = ("combatant",)
+    kind: ClassVar[str] = "turn"
+    combatant: str
+
+    def __init__(self, combatant: str) -> None:
+        super().__init__(combatant)
+
+    def render(self) -> str:
+        return f"\n{self.combatant}'s turn:"
+
+
+class AttackEvent(Event):
+    """An attack roll was made."""
+
+    __slots__ = ("attacker", "defender", "attack_roll", "armor_class")
+    kind: ClassVar[str] = "attack"
+    attacker: str
+    defender: str
+    attack_roll: int
+    armor_class: int
+
+    def __init__(
+        self, attacker: str, defender: str, attack_roll: int, armor_class: int
+    ) -> None:
+        super().__init__(attacker, defender, attack_roll, armor_class)
+
+    def render(self) -> str:
+        return (
+            f"{self.attacker} attacks {self.defender}!\n"
+            f"Attack roll: {self.attack_roll} vs AC {self.armor_class}"
+        )
+
+
+class HitEvent(Event):
+    """An attack hit and dealt damage."""
+
+    __slots__ = ("attacker", "defender", "damage")
+    kind: ClassVar[str] = "hit"
+    attacker: str
+    defender: str
+    damage: int
+
+    def __init__(self, attacker: str, defender: str, damage: int) -> None:
+        super().__init__(attacker, defender, damage)
+
+    def render(self) -> str:
+        return f"{self.attacker} hit for {self.damage} damage!"
+
+
+class MissEvent(Event):
+    """An attack missed."""
+
+    __slots__ = ("attacker", "defender")
+    kind: ClassVar[str] = "miss"
+    attacker: str
+    defender: str
+
+    def __init__(self, attacker: str, defender: str) -> None:
+        super().__init__(attacker, defender)
+
+    def render(self) -> str:
+        return f"{self.attacker} missed!"
+
+
+class StatusEvent(Event):
+    """Both combatants' HP after a turn."""
+
+    __slots__ = (
+        "player",
+        "player_hp",
+        "player_max_hp",
+        "enemy",
+        "enemy_hp",
+        "enemy_max_hp",
+    )
+    kind: ClassVar[str] = "status"
+    player: str
+    player_hp: int
+    player_max_hp: int
+    enemy: str
+    enemy_hp: int
+    enemy_max_hp: int
+
+    def __init__(
+        self,
+        player: str,
+        player_hp: int,
+        player_max_hp: int,
+        enemy: str,
+        enemy_hp: int,
+        enemy_max_hp: int,
+    ) -> None:
+        super().__init__(
+            player, player_hp, player_max_hp, enemy, enemy_hp, enemy_max_hp
+        )
+
+    def render(self) -> str:
+        return (
+            f"\n{self.player} HP: {self.player_hp}/{self.player_max_hp}\n"
+            f"{self.enemy} HP: {self.enemy_hp}/{self.enemy_max_hp}"
+        )
+
+
+class DefeatEvent(Event):
+    """A combatant dropped to 0 HP."""
+
+    __slots__ = ("combatant",)
+    kind: ClassVar[str] = "defeat"
+    combatant: str
+
+    def __init__(self, combatant: str) -> None:
+        super().__init__(combatant)
+
+    def render(self) -> str:
+        return f"\n{self.combatant} defeated!"
+
+
+class CombatEndEvent(Event):
+    """A fight is over."""
+
+    __slots__ = ("player", "winner", "player_won")
+    kind: ClassVar[str] = "combat_end"
+    player: str
+    winner: str
+    player_won: bool
+
+    def __init__(self, player: str, winner: str, player_won: bool) -> None:
+        super().__init__(player, winner, player_won)
+
+    def render(self) -> str:
+        if self.player_won:
+            return f"\n{self.player} is victorious!"
+        return f"\n{self.player} has fallen!"
+
+
+class EventSink(ABC):
+    """Receives events from the game.
+
+    Attributes:
+        enabled: False if events would be discarded, letting callers skip
+            building them
+    """
+
+    enabled: bool = True
+
+    @abstractmethod
+    def emit(self, event: Event) -> None:
+        """Handle one event."""
+
+
+class NullSink(EventSink):
+    """Discards everything."""
+
+    enabled = False
+
+    def emit(self, event: Event) -> None:
+        pass
+
+
+class StdoutSink(EventSink):
+    """Prints each event's text, reproducing the classic console output."""
+
+    def __init__(self, stream: Optional[TextIO] = None) -> None:
+        self.stream: Optional[TextIO] = stream
+
+    def emit(self, event: Event) -> None:
+        print(event.render(), file=self.stream if self.stream else sys.stdout)
+
+
+class MemorySink(EventSink):
+    """Keeps events in a list, mainly for tests and analysis."""
+
+    def __init__(self) -> None:
+        self.events: list[Event] = []
+
+    def emit(self, event: Event) -> None:
+        self.events.append(event)
+
+    def of_kind(self, kind: str) -> list[Event]:
+        """Get recorded events of one kind."""
+        return [e for e in self.events if e.kind == kind]
+
+    def clear(self) -> None:
+        """Forget recorded events."""
+        self.events.clear()
+
+
+class JsonLinesSink(EventSink):
+    """Writes one JSON object per event to a text stream."""
+
+    def __init__(self, stream: TextIO) -> None:
+        self.stream: TextIO = stream
+
+    def emit(self, event: Event) -> None:
+        import json  # deferred: only needed once JSON output is in use
+
+        self.stream.write(json.dumps(event.to_dict()) + "\n")
+
+
+_default_sink: EventSink = StdoutSink()
+
+
+def get_default_sink() -> EventSink:
+    """Get the sink used when none is passed explicitly."""
+    return _default_sink
+
+
+def set_default_sink(sink: EventSink) -> EventSink:
+    """Replace the default sink.
+
+    Returns:
+        The previous default, so callers can restore it
+    """
+    global _default_sink
+    previous = _default_sink
+    _default_sink = sink
+    return previous
@@ -0,0 +1,217 @@
+"""Load-test client for :mod:`dndgame.server`.
+
+Drives many simulated players through the menu flow at once and reports
+the latency of each kind of action (p50, p99 and worst case), measured
+from sending a line to receiving the server's complete reply.
+
+Example:
+    $ python -m dndgame.loadtest --serve --players 2000 --concurrency 500
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Optional, Sequence
+
+from dndgame.server import (
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    END_OF_RESPONSE,
+    END_OF_SESSION,
+    GameServer,
+)
+
+
+# Menu choices and the action names latencies are reported under.
+ACTIONS: dict[str, str] = {
+    "1": "fight",
+    "2": "fight",
+    "3": "view",
+    "4": "rest",
+    "5": "quit",
+}
+
+
+def player_script(name: str, race: str = "1", fights: int = 3) -> list[tuple[str, str]]:
+    """Build the (action, line) steps of one simulated player.
+
+    The player creates a character, alternates fighting a Goblin and
+    resting, views the character and quits.
+    """
+    steps = [("name", name), ("race", race)]
+    for _ in range(fights):
+        steps += [("fight", "1"), ("rest", "4")]
+    steps += [("view", "3"), ("quit", "5")]
+    return steps
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of samples (q between 0 and 100)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+@dataclass
+class LoadReport:
+    """Latencies gathered during a load test.
+
+    Attributes:
+        latencies: Seconds per request, by action
+        sessions: Players that ran to the end of their session
+        errors: Players whose connection failed
+        elapsed: Wall-clock seconds for the whole test
+    """
+
+    latencies: dict[str, list[float]] = field(default_factory=dict)
+    sessions: int = 0
+    errors: int = 0
+    elapsed: float = 0.0
+
+    def record(self, action: str, seconds: float) -> None:
+        """Add one latency sample."""
+        self.latencies.setdefault(action, []).append(seconds)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Count and p50/p99/max latency in milliseconds per action."""
+        return {
+            action: {
+                "count": len(samples),
+                "p50_ms": percentile(samples, 50) * 1000,
+                "p99_ms": percentile(samples, 99) * 1000,
+                "max_ms": max(samples) * 1000,
+            }
+            for action, samples in self.latencies.items()
+        }
+
+    def format(self) -> str:
+        """Render the summary as a table."""
+        requests = sum(len(samples) for samples in self.latencies.values())
+        lines = [
+            f"{self.sessions} sessions, {self.errors} errors, {requests} requests "
+            f"in {self.elapsed:.2f}s ({requests / max(self.elapsed, 1e-9):.0f} req/s)",
+            f"{'action':<10}{'count':>8}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}",
+        ]
+        for action, row in self.summary().items():
+            lines.append(
+                f"{action:<10}{row['count']:>8.0f}{row['p50_ms']:>10.2f}"
+                f"{row['p99_ms']:>10.2f}{row['max_ms']:>10.2f}"
+            )
+        return "\n".join(lines)
+
+
+async def run_player(
+    host: str, port: int, steps: Sequence[tuple[str, str]], report: LoadReport
+) -> None:
+    """Play one session, recording the latency of every step.
+
+    The session may end early, e.g. if the character loses a fight.
+    """
+    start = time.perf_counter()
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        await reader.readuntil(END_OF_RESPONSE)
+        report.record("connect", time.perf_counter() - start)
+        for action, line in steps:
+            start = time.perf_counter()
+            writer.write(line.encode() + b"\n")
+            await writer.drain()
+            reply = await reader.readuntil(END_OF_RESPONSE)
+            report.record(action, time.perf_counter() - start)
+            if reply.endswith(END_OF_SESSION + END_OF_RESPONSE):
+                break
+        report.sessions += 1
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+async def run_load_test(
+    host: str,
+    port: int,
+    players: int,
+    concurrency: int = 1000,
+    fights: int = 3,
+) -> LoadReport:
+    """Run ``players`` sessions with at most ``concurrency`` at once."""
+    report = LoadReport()
+    limit = asyncio.Semaphore(concurrency)
+
+    async def play(index: int) -> None:
+        async with limit:
+            try:
+                steps = player_script(f"Player {index}", str(index % 5 + 1), fights)
+                await run_player(host, port, steps, report)
+            except (OSError, asyncio.IncompleteReadError):
+                report.errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(play(i) for i in range(players)))
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+async def _serve_and_test(
+    players: int, concurrency: int, fights: int, seed: Optional[int]
+) -> LoadReport:
+    """Start an in-process server on a free port and load-test it."""
+    server = GameServer(port=0, seed=seed)
+    await server.start()
+    try:
+        return await run_load_test(
+            server.host, server.port, players, concurrency, fights
+        )
+    finally:
+        await server.close()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Run a load test from the command line."""
+    parser = argparse.ArgumentParser(description="Load-test the game server.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--players", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=1000)
+    parser.add_argument("--fights", type=int, default=3)
+    parser.add_argument(
+        "--serve", action="store_true", help="start a server in this process"
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--json", action="store_true", help="print JSON results")
+    args = parser.parse_args(argv)
+
+    if args.serve:
+        coroutine = _serve_and_test(
+            args.players, args.concurrency, args.fights, args.seed
+        )
+    else:
+        coroutine = run_load_test(
+            args.host, args.port, args.players, args.concurrency, args.fights
+        )
+    report = asyncio.run(coroutine)
+
+    if args.json:
+        print(
+            json.dumps(
+                {
+                    "sessions": report.sessions,
+                    "errors": report.errors,
+                    "elapsed": report.elapsed,
+                    "actions": report.summary(),
+                }
+            )
+        )
+    else:
+        print(report.format())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""Memoized matchup odds keyed by combat-relevant numbers.
+
+Only a few numbers decide a one-on-one fight: each side's HP, AC and STR
+and DEX modifiers. :class:`MatchupCache` keys :func:`~dndgame.solver.
+solve_combat` results on exactly those (plus the solver settings), so any
+two matchups with the same numbers share one entry regardless of names,
+races or object identity. Entries live in an in-process LRU and,
+optionally, in a SQLite file shared across runs and processes.
+
+Example:
+    >>> cache = MatchupCache(maxsize=10_000, path="matchups.sqlite")
+    >>> odds = cache.get(hero, Enemy("Goblin"))   # solved once
+    >>> odds = cache.get(other_hero, Enemy("Goblin"))  # dict lookup
+"""
+
+import json
+import sqlite3
+from collections import OrderedDict
+from dataclasses import asdict
+from pathlib import Path
+from typing import NamedTuple, Optional, Union
+
+from dndgame.entity import Entity
+from dndgame.solver import CombatOdds, solve_combat
+
+
+DEFAULT_MAXSIZE: int = 4096
+
+
+class CombatantKey(NamedTuple):
+    """The numbers of one combatant that affect a fight."""
+
+    hp: int
+    armor_class: int
+    strength: int
+    dexterity: int
+
+
+class MatchupKey(NamedTuple):
+    """Canonical description of a matchup and the solver settings."""
+
+    player: CombatantKey
+    enemy: CombatantKey
+    max_rounds: int
+    tolerance: float
+
+
+def combatant_key(entity: Entity) -> CombatantKey:
+    """Reduce a combatant to the numbers combat reads.
+
+    HP at or below zero all mean "already down", so they share a key.
+    """
+    return CombatantKey(
+        max(entity.hp, 0),
+        entity.armor_class,
+        entity.get_modifier("STR"),
+        entity.get_modifier("DEX"),
+    )
+
+
+def matchup_key(
+    player: Entity, enemy: Entity, max_rounds: int = 200, tolerance: float = 1e-12
+) -> MatchupKey:
+    """Build the cache key of a matchup."""
+    return MatchupKey(
+        combatant_key(player), combatant_key(enemy), max_rounds, tolerance
+    )
+
+
+class MatchupCache:
+    """LRU of solved matchups with an optional on-disk tier.
+
+    Returned :class:`~dndgame.solver.CombatOdds` objects are shared between
+    callers, so treat them as read-only.
+
+    Attributes:
+        maxsize: Most entries kept in memory
+        path: SQLite file of the persistent tier (memory only if omitted)
+        hits: Lookups answered from memory
+        disk_hits: Lookups answered from the persistent tier
+        misses: Lookups that had to solve the matchup
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAXSIZE,
+        path: Optional[Union[str, Path]] = None,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.maxsize: int = maxsize
+        self.path: Optional[Path] = Path(path) if path is not None else None
+        self.hits: int = 0
+        self.disk_hits: int = 0
+        self.misses: int = 0
+        self._entries: OrderedDict[MatchupKey, CombatOdds] = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        if self.path is not None:
+            self._db = sqlite3.connect(self.path)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS matchups "
+                "(key TEXT PRIMARY KEY, odds TEXT NOT NULL)"
+            )
+            self._db.commit()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def get(
+        self,
+        player: Entity,
+        enemy: Entity,
+        max_rounds: int = 200,
+        tolerance: float = 1e-12,
+    ) -> CombatOdds:
+        """Get the odds of a matchup, solving it only if it's new.
+
+        Args:
+            player: Player combatant
+            enemy: Enemy combatant
+            max_rounds: Passed to ``solve_combat``
+            tolerance: Passed to ``solve_combat``
+
+        Returns:
+            Exact outcome statistics
+        """
+        key = matchup_key(player, enemy, max_rounds, tolerance)
+        entries = self._entries
+        odds = entries.get(key)
+        if odds is not None:
+            entries.move_to_end(key)
+            self.hits += 1
+            return odds
+
+        odds = self._load(key)
+        if odds is not None:
+            self.disk_hits += 1
+        else:
+            self.misses += 1
+            odds = solve_combat(player, enemy, max_rounds, tolerance)
+            self._store(key, odds)
+
+        entries[key] = odds
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+        return odds
+
+    def _load(self, key: MatchupKey) -> Optional[CombatOdds]:
+        """Read an entry from the persistent tier."""
+        if self._db is None:
+            return None
+        row = self._db.execute(
+            "SELECT odds FROM matchups WHERE key = ?", (_encode_key(key),)
+        ).fetchone()
+        return CombatOdds(**json.loads(row[0])) if row is not None else None
+
+    def _store(self, key: MatchupKey, odds: CombatOdds) -> None:
+        """Write an entry to the persistent tier."""
+        if self._db is None:
+            return
+        self._db.execute(
+            "INSERT OR REPLACE INTO matchups VALUES (?, ?)",
+            (_encode_key(key), json.dumps(asdict(odds))),
+        )
+        self._db.commit()
+
+    def clear(self, persistent: bool = False) -> None:
+        """Empty the in-memory tier, and the on-disk one if asked."""
+        self._entries.clear()
+        if persistent and self._db is not None:
+            self._db.execute("DELETE FROM matchups")
+            self._db.commit()
+
+    def close(self) -> None:
+        """Close the persistent tier."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+def _encode_key(key: MatchupKey) -> str:
+    """Stable text form of a key for the persistent tier."""
+    return json.dumps(
+        [list(key.player), list(key.enemy), key.max_rounds, key.tolerance]
+    )
@@ -0,0 +1,148 @@
+"""Opt-in counters and phase timers for dice and combat.
+
+Instrumented code checks :data:`METRICS.enabled <METRICS>` before doing
+any work, the same way it checks ``sink.enabled`` before building events,
+so while collection is off (the default) the only cost is that attribute
+check. Turn collection on around the code of interest::
+
+    >>> with collecting() as metrics:
+    ...     Combat(hero, Enemy("Orc"), sink=NullSink()).run_combat()
+    >>> metrics.snapshot()["counters"]["hits"]  # doctest: +SKIP
+    3
+    >>> print(metrics.to_prometheus())  # doctest: +SKIP
+
+Counters: ``rolls`` (roll calls), dice rolled per die type, ``hits``,
+``misses``, ``rounds`` and ``combats``. Timers accumulate seconds per
+phase: ``initiative``, ``attack_roll``, ``damage`` and ``logging`` (the
+combat log and event sink).
+"""
+
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Iterator, Union
+
+
+PHASES: tuple[str, ...] = ("initiative", "attack_roll", "damage", "logging")
+
+
+class Metrics:
+    """Counters and cumulative phase timers.
+
+    Attributes:
+        enabled: Whether instrumented code records anything
+        counters: Event counts by name
+        dice: Dice rolled by number of sides
+        timers: Seconds spent per phase
+        timer_counts: Timed spans per phase
+    """
+
+    __slots__ = ("enabled", "counters", "dice", "timers", "timer_counts")
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled: bool = enabled
+        self.counters: dict[str, int] = {}
+        self.dice: dict[int, int] = {}
+        self.timers: dict[str, float] = {}
+        self.timer_counts: dict[str, int] = {}
+
+    def inc(self, name: str, amount: int = 1) -> None:
+        """Add to a counter."""
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def count_roll(self, dice_type: int, number_of_dice: int) -> None:
+        """Count one roll call of ``number_of_dice`` dice."""
+        self.counters["rolls"] = self.counters.get("rolls", 0) + 1
+        self.dice[dice_type] = self.dice.get(dice_type, 0) + number_of_dice
+
+    def add_time(self, phase: str, seconds: float) -> None:
+        """Add a timed span to a phase."""
+        self.timers[phase] = self.timers.get(phase, 0.0) + seconds
+        self.timer_counts[phase] = self.timer_counts.get(phase, 0) + 1
+
+    @contextmanager
+    def timer(self, phase: str) -> Iterator[None]:
+        """Time a block as part of a phase (if enabled)."""
+        if not self.enabled:
+            yield
+            return
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(phase, perf_counter() - start)
+
+    def reset(self) -> None:
+        """Clear every counter and timer."""
+        self.counters.clear()
+        self.dice.clear()
+        self.timers.clear()
+        self.timer_counts.clear()
+
+    def snapshot(self) -> dict[str, dict[str, Union[int, float]]]:
+        """Copy of all current values.
+
+        Returns:
+            ``counters``, ``dice`` (keyed "d6", "d20", ...), ``timers``
+            (seconds) and ``timer_counts``
+        """
+        return {
+            "counters": dict(self.counters),
+            "dice": {f"d{sides}": count for sides, count in sorted(self.dice.items())},
+            "timers": dict(self.timers),
+            "timer_counts": dict(self.timer_counts),
+        }
+
+    def to_prometheus(self, prefix: str = "dndgame") -> str:
+        """Render all values in the Prometheus text exposition format."""
+        lines = []
+        for name, value in sorted(self.counters.items()):
+            metric = f"{prefix}_{name}_total"
+            lines += [f"# TYPE {metric} counter", f"{metric} {value}"]
+        if self.dice:
+            metric = f"{prefix}_dice_rolled_total"
+            lines.append(f"# TYPE {metric} counter")
+            for sides, count in sorted(self.dice.items()):
+                lines.append(f'{metric}{{die="d{sides}"}} {count}')
+        if self.timers:
+            seconds = f"{prefix}_phase_seconds_total"
+            spans = f"{prefix}_phase_spans_total"
+            lines.append(f"# TYPE {seconds} counter")
+            for phase, total in sorted(self.timers.items()):
+                lines.append(f'{seconds}{{phase="{phase}"}} {total!r}')
+            lines.append(f"# TYPE {spans} counter")
+            for phase, count in sorted(self.timer_counts.items()):
+                lines.append(f'{spans}{{phase="{phase}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+
+METRICS: Metrics = Metrics()
+"""The process-wide collector used by dice and combat."""
+
+
+def enable_metrics() -> Metrics:
+    """Start collecting into :data:`METRICS`."""
+    METRICS.enabled = True
+    return METRICS
+
+
+def disable_metrics() -> Metrics:
+    """Stop collecting (values are kept until reset)."""
+    METRICS.enabled = False
+    return METRICS
+
+
+@contextmanager
+def collecting(reset: bool = True) -> Iterator[Metrics]:
+    """Collect metrics for the duration of a block.
+
+    Args:
+        reset: Clear earlier values first
+    """
+    previous = METRICS.enabled
+    if reset:
+        METRICS.reset()
+    METRICS.enabled = True
+    try:
+        yield METRICS
+    finally:
+        METRICS.enabled = previous
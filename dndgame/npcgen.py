@@ -0,0 +1,282 @@
+"""Bulk NPC generation as NumPy structured arrays.
+
+:func:`generate_npcs` creates any number of characters at once with the
+same rules as ``Character.roll_stats`` followed by
+``apply_racial_bonuses``: 3d6 per ability, racial bonuses from ``RACES``
+and max HP of ``base_hp`` plus the final CON modifier. The result is a
+compact structured array; ``Character`` objects are only built for the
+rows you ask for. :func:`iter_npcs` produces the same data in chunks, and
+a :class:`StatReport` can follow along to summarize stat and modifier
+distributions per race without keeping every NPC in memory.
+
+Example:
+    >>> npcs = generate_npcs(1_000_000, rng=np.random.default_rng(7))
+    >>> strong = np.flatnonzero(npcs.records["stats"][:, 0] >= 17)
+    >>> hero = npcs.character(int(strong[0]))
+"""
+
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from dndgame.character import RACES, Character
+from dndgame.entity import ABILITY_NAMES, Ability
+
+
+NPC_DTYPE: np.dtype[Any] = np.dtype(
+    [
+        ("race", "u1"),
+        ("stats", "i1", (6,)),
+        ("modifiers", "i1", (6,)),
+        ("max_hp", "<i2"),
+    ]
+)
+
+DEFAULT_CHUNK_SIZE: int = 1 << 18
+
+# Ability scores fall in 3..18 before bonuses; leave room for large ones.
+_HISTOGRAM_SIZE: int = 64
+_MODIFIER_OFFSET: int = 32
+
+
+def racial_bonus_matrix(races: Sequence[str]) -> npt.NDArray[np.int8]:
+    """Bonuses of each race as a (races, abilities) matrix."""
+    matrix = np.zeros((len(races), len(ABILITY_NAMES)), dtype=np.int8)
+    for row, race in enumerate(races):
+        for stat, bonus in RACES[race].items():
+            matrix[row, Ability[stat]] = bonus
+    return matrix
+
+
+@dataclass
+class NpcBatch:
+    """A block of generated NPCs.
+
+    Attributes:
+        records: One NPC_DTYPE row per NPC; ``race`` indexes ``races``
+        races: Race names in code order
+        base_hp: Base HP every NPC was generated with
+        start: Index of the first NPC across all chunks (for naming)
+    """
+
+    records: npt.NDArray[Any]
+    races: tuple[str, ...]
+    base_hp: int = 10
+    start: int = 0
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def race_of(self, index: int) -> str:
+        """Race name of one NPC."""
+        return self.races[int(self.records["race"][index])]
+
+    def of_race(self, race: str) -> npt.NDArray[np.intp]:
+        """Indices of every NPC of a race."""
+        return np.flatnonzero(self.records["race"] == self.races.index(race))
+
+    def character(self, index: int, name: Optional[str] = None) -> Character:
+        """Build a ``Character`` for one row.
+
+        Args:
+            index: Row in this batch
+            name: Character name ("NPC <n>" if omitted)
+        """
+        row = self.records[index]
+        character = Character(
+            name or f"NPC {self.start + index}", self.race_of(index), self.base_hp
+        )
+        for ability, score in zip(ABILITY_NAMES, row["stats"].tolist()):
+            character.set_score(ability, score)
+        character.max_hp = character.hp = int(row["max_hp"])
+        return character
+
+    def characters(
+        self, indices: Optional[Sequence[int]] = None
+    ) -> Iterator[Character]:
+        """Build characters lazily for the given rows (all rows if omitted)."""
+        rows = range(len(self)) if indices is None else indices
+        for index in rows:
+            yield self.character(int(index))
+
+
+def _generate(
+    count: int,
+    codes: npt.NDArray[np.uint8],
+    bonuses: npt.NDArray[np.int8],
+    base_hp: int,
+    rng: np.random.Generator,
+) -> npt.NDArray[Any]:
+    """Roll one chunk of NPCs."""
+    records = np.empty(count, dtype=NPC_DTYPE)
+    dice = rng.integers(1, 7, size=(count, len(ABILITY_NAMES), 3), dtype=np.int8)
+    stats = dice.sum(axis=2, dtype=np.int8)
+    if len(codes) > 1:
+        race = rng.choice(codes, size=count)
+    else:
+        race = np.full(count, codes[0], dtype=np.uint8)
+    stats += bonuses[race]
+    modifiers = (stats - 10) // 2
+    records["race"] = race
+    records["stats"] = stats
+    records["modifiers"] = modifiers
+    records["max_hp"] = base_hp + modifiers[:, Ability.CON].astype(np.int16)
+    return records
+
+
+def _setup(
+    races: Optional[Sequence[str]],
+) -> tuple[tuple[str, ...], npt.NDArray[np.uint8], npt.NDArray[np.int8]]:
+    """Resolve race codes and the bonus matrix."""
+    names = tuple(RACES)
+    chosen = names if races is None else tuple(races)
+    for race in chosen:
+        if race not in RACES:
+            raise ValueError(f"Invalid race: {race}. Must be one of {list(names)}")
+    if not chosen:
+        raise ValueError("At least one race is required")
+    codes = np.array([names.index(race) for race in chosen], dtype=np.uint8)
+    return names, codes, racial_bonus_matrix(names)
+
+
+def iter_npcs(
+    count: int,
+    races: Optional[Sequence[str]] = None,
+    base_hp: int = 10,
+    rng: Optional[np.random.Generator] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    report: Optional["StatReport"] = None,
+) -> Iterator[NpcBatch]:
+    """Generate NPCs in chunks.
+
+    Args:
+        count: Total NPCs to generate
+        races: Races to pick from uniformly (every race if omitted)
+        base_hp: Base HP before the CON modifier
+        rng: Generator to draw from (a fresh one if omitted)
+        chunk_size: Most NPCs per chunk
+        report: Updated with every chunk before it is yielded
+
+    Yields:
+        Batches of at most ``chunk_size`` NPCs
+    """
+    if count < 0:
+        raise ValueError(f"count must be non-negative, got {count}")
+    names, codes, bonuses = _setup(races)
+    if rng is None:
+        rng = np.random.default_rng()
+    done = 0
+    while done < count:
+        size = min(chunk_size, count - done)
+        batch = NpcBatch(
+            _generate(size, codes, bonuses, base_hp, rng), names, base_hp, done
+        )
+        if report is not None:
+            report.update(batch)
+        yield batch
+        done += size
+
+
+def generate_npcs(
+    count: int,
+    races: Optional[Sequence[str]] = None,
+    base_hp: int = 10,
+    rng: Optional[np.random.Generator] = None,
+    report: Optional["StatReport"] = None,
+) -> NpcBatch:
+    """Generate ``count`` NPCs as one batch (see :func:`iter_npcs`)."""
+    names, codes, bonuses = _setup(races)
+    if count < 0:
+        raise ValueError(f"count must be non-negative, got {count}")
+    if rng is None:
+        rng = np.random.default_rng()
+    records = _generate(count, codes, bonuses, base_hp, rng)
+    batch = NpcBatch(records, names, base_hp)
+    if report is not None:
+        report.update(batch)
+    return batch
+
+
+class StatReport:
+    """Running per-race distributions of ability scores and modifiers.
+
+    Only histograms are kept, so the report costs the same however many
+    NPCs stream through it.
+
+    Attributes:
+        races: Race names in code order
+        counts: NPCs seen per race
+        stat_histograms: (race, ability, score) counts
+        modifier_histograms: (race, ability, modifier + 32) counts
+    """
+
+    def __init__(self, races: Optional[Sequence[str]] = None) -> None:
+        self.races: tuple[str, ...] = tuple(RACES if races is None else races)
+        shape = (len(self.races), len(ABILITY_NAMES), _HISTOGRAM_SIZE)
+        self.counts: npt.NDArray[np.int64] = np.zeros(len(self.races), np.int64)
+        self.stat_histograms: npt.NDArray[np.int64] = np.zeros(shape, dtype=np.int64)
+        self.modifier_histograms: npt.NDArray[np.int64] = np.zeros(
+            shape, dtype=np.int64
+        )
+
+    def update(self, batch: NpcBatch) -> None:
+        """Add a batch of NPCs."""
+        if batch.races != self.races:
+            raise ValueError("Batch races don't match the report")
+        records = batch.records
+        race = records["race"].astype(np.intp)
+        self.counts += np.bincount(race, minlength=len(self.races))
+        # Flatten (race, ability, value) into one index and count them all.
+        cell = race[:, None] * len(ABILITY_NAMES) + np.arange(len(ABILITY_NAMES))
+        cell *= _HISTOGRAM_SIZE
+        size = self.stat_histograms.size
+        for target, values, offset in (
+            (self.stat_histograms, records["stats"], 0),
+            (self.modifier_histograms, records["modifiers"], _MODIFIER_OFFSET),
+        ):
+            bins = np.clip(values.astype(np.intp) + offset, 0, _HISTOGRAM_SIZE - 1)
+            counts = np.bincount((cell + bins).ravel(), minlength=size)
+            target += counts.reshape(target.shape)
+
+    def stat_distribution(self, race: str, ability: str) -> dict[int, int]:
+        """Count of NPCs by score for one race and ability."""
+        row = self.stat_histograms[self.races.index(race), Ability[ability]]
+        return {int(score): int(row[score]) for score in np.flatnonzero(row)}
+
+    def modifier_distribution(self, race: str, ability: str) -> dict[int, int]:
+        """Count of NPCs by modifier for one race and ability."""
+        row = self.modifier_histograms[self.races.index(race), Ability[ability]]
+        return {
+            int(index) - _MODIFIER_OFFSET: int(row[index])
+            for index in np.flatnonzero(row)
+        }
+
+    def means(self) -> dict[str, dict[str, float]]:
+        """Mean score per ability for each race seen."""
+        scores = np.arange(_HISTOGRAM_SIZE)
+        result = {}
+        for code, race in enumerate(self.races):
+            if not self.counts[code]:
+                continue
+            totals = self.stat_histograms[code] @ scores
+            result[race] = {
+                ability: float(totals[i] / self.counts[code])
+                for i, ability in enumerate(ABILITY_NAMES)
+            }
+        return result
+
+    def format(self) -> str:
+        """Render mean scores per race as a table."""
+        header = f"{'race':<10}{'count':>10}" + "".join(
+            f"{ability:>7}" for ability in ABILITY_NAMES
+        )
+        lines = [header]
+        for race, means in self.means().items():
+            count = int(self.counts[self.races.index(race)])
+            lines.append(
+                f"{race:<10}{count:>10}"
+                + "".join(f"{means[ability]:>7.2f}" for ability in ABILITY_NAMES)
+            )
+        return "\n".join(lines)
@@ -0,0 +1,253 @@
+"""Multi-process sharded combat simulation.
+
+A workload of fights is cut into fixed-size shards. Each shard has its own
+seed derived from the master seed and its index, so results don't depend on
+how many workers run them. Workers receive small combatant templates rather
+than pickled entities, resolved in the parent down to final scores, HP and
+AC so that workers never consult their own ``RACES`` or
+``ENEMY_TEMPLATES``. They build the combatants locally and send back a
+:class:`~dndgame.simulation.SimulationResult` that is merged with the
+others.
+
+Example:
+    >>> runner = ShardedRunner(
+    ...     CombatantTemplate.character("Orc"), CombatantTemplate.enemy("Goblin")
+    ... )
+    >>> result = runner.run(10_000_000, master_seed=42)
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from functools import lru_cache, reduce
+from typing import Any, Optional
+
+from dndgame.character import Character
+from dndgame.enemy import Enemy
+from dndgame.entity import ABILITY_NAMES, Entity
+from dndgame.rng import RngStreams
+from dndgame.simulation import CombatSimulator, SimulationResult
+
+
+DEFAULT_SHARD_SIZE: int = 100_000
+
+# (player, enemy, fights, master_seed, shard_index, max_rounds)
+ShardTask = tuple["CombatantTemplate", "CombatantTemplate", int, int, int, int]
+
+
+@dataclass(frozen=True)
+class CombatantTemplate:
+    """Picklable recipe for building a combatant.
+
+    Attributes:
+        kind: "character" or "enemy"
+        type_name: Race for characters, enemy type for enemies
+        name: Display name (race or enemy type if omitted)
+        stats: Final ability scores in STR, DEX, CON, INT, WIS, CHA order
+        hp: HP override (current and max)
+        armor_class: AC override
+        base_hp: Base HP for characters
+        level: Level override
+    """
+
+    kind: str
+    type_name: str
+    name: Optional[str] = None
+    stats: Optional[tuple[int, ...]] = None
+    hp: Optional[int] = None
+    armor_class: Optional[int] = None
+    base_hp: int = 10
+    level: Optional[int] = None
+
+    @classmethod
+    def character(cls, race: str, **overrides: Any) -> "CombatantTemplate":
+        """Template for a character of ``race``."""
+        return cls("character", race, **overrides)
+
+    @classmethod
+    def enemy(cls, enemy_type: str, **overrides: Any) -> "CombatantTemplate":
+        """Template for an enemy of ``enemy_type``."""
+        return cls("enemy", enemy_type, **overrides)
+
+    @property
+    def resolved(self) -> bool:
+        """Whether the template fixes every value it builds from."""
+        return None not in (self.stats, self.hp, self.armor_class, self.level)
+
+    def resolve(self) -> "CombatantTemplate":
+        """Copy with the scores, HP, AC and level the template builds now.
+
+        A resolved template builds the same combatant in any process and
+        no longer reads ``RACES`` or ``ENEMY_TEMPLATES``, so later edits to
+        those don't change it.
+        """
+        if self.resolved:
+            return self
+        entity = self.build()
+        return replace(
+            self,
+            stats=entity.scores(),
+            hp=entity.max_hp,
+            armor_class=entity.armor_class,
+            level=entity.level,
+        )
+
+    def build(self) -> Entity:
+        """Create a fresh combatant from the template.
+
+        Characters without explicit stats get 10 in every ability plus
+        their racial bonuses, i.e. an average unrolled character.
+        """
+        if self.resolved:
+            return self._build_resolved()
+        entity: Entity
+        if self.kind == "character":
+            name = self.name or self.type_name
+            character = Character(name, self.type_name, self.base_hp)
+            if self.stats is None:
+                character.apply_racial_bonuses()
+            else:
+                character.stats = dict(zip(ABILITY_NAMES, self.stats))
+                character.max_hp = character.base_hp + character.get_modifier("CON")
+                character.hp = character.max_hp
+            entity = character
+        elif self.kind == "enemy":
+            entity = Enemy(self.type_name, self.name)
+            if self.stats is not None:
+                entity.stats = dict(zip(ABILITY_NAMES, self.stats))
+        else:
+            raise ValueError(f"Invalid combatant kind: {self.kind}")
+
+        if self.hp is not None:
+            entity.max_hp = entity.hp = self.hp
+        if self.armor_class is not None:
+            entity.armor_class = self.armor_class
+        if self.level is not None:
+            entity.level = self.level
+        return entity
+
+    def _build_resolved(self) -> Entity:
+        """Build from the template's own values, skipping the definitions."""
+        assert self.stats is not None and self.hp is not None
+        assert self.armor_class is not None and self.level is not None
+        entity: Entity
+        if self.kind == "character":
+            character = Character.__new__(Character)
+            character.race = self.type_name
+            character.base_hp = self.base_hp
+            entity = character
+        elif self.kind == "enemy":
+            enemy = Enemy.__new__(Enemy)
+            enemy.enemy_type = self.type_name
+            entity = enemy
+        else:
+            raise ValueError(f"Invalid combatant kind: {self.kind}")
+        Entity.__init__(
+            entity, self.name or self.type_name, self.hp, self.armor_class, self.level
+        )
+        entity.stats = dict(zip(ABILITY_NAMES, self.stats))
+        return entity
+
+
+@lru_cache(maxsize=64)
+def _simulator(
+    player: CombatantTemplate, enemy: CombatantTemplate, max_rounds: int
+) -> CombatSimulator:
+    """Build (once per process) the simulator for a resolved matchup.
+
+    Keys are resolved templates, so changed definitions get a new entry.
+    """
+    return CombatSimulator(player.build(), enemy.build(), max_rounds)
+
+
+def run_shard(
+    player: CombatantTemplate,
+    enemy: CombatantTemplate,
+    fights: int,
+    master_seed: int,
+    shard_index: int,
+    max_rounds: int = 1000,
+) -> SimulationResult:
+    """Simulate one shard with its own derived seed.
+
+    Args:
+        player: Template for the player side
+        enemy: Template for the enemy side
+        fights: Fights in this shard
+        master_seed: Seed of the whole workload
+        shard_index: Position of the shard in the workload
+        max_rounds: Round limit per fight
+
+    Returns:
+        The shard's partial result
+    """
+    rng = RngStreams(master_seed).generator(shard_index)
+    return _simulator(player.resolve(), enemy.resolve(), max_rounds).run(fights, rng)
+
+
+def _run_shard_args(args: ShardTask) -> SimulationResult:
+    """Unpack a task tuple for :meth:`ProcessPoolExecutor.map`."""
+    return run_shard(*args)
+
+
+class ShardedRunner:
+    """Spreads a matchup's fights across a pool of worker processes.
+
+    Attributes:
+        player: Template for the player side
+        enemy: Template for the enemy side
+        workers: Worker processes (all CPUs if omitted; 1 runs in-process)
+        shard_size: Fights per shard; fixes the seed layout, so keep it the
+            same when comparing runs
+        max_rounds: Round limit per fight
+    """
+
+    def __init__(
+        self,
+        player: CombatantTemplate,
+        enemy: CombatantTemplate,
+        workers: Optional[int] = None,
+        shard_size: int = DEFAULT_SHARD_SIZE,
+        max_rounds: int = 1000,
+    ) -> None:
+        if shard_size < 1:
+            raise ValueError(f"shard_size must be positive, got {shard_size}")
+        self.player: CombatantTemplate = player
+        self.enemy: CombatantTemplate = enemy
+        self.workers: int = workers or os.cpu_count() or 1
+        self.shard_size: int = shard_size
+        self.max_rounds: int = max_rounds
+
+    def shards(self, fights: int, master_seed: int) -> list[ShardTask]:
+        """Split a workload into shard tasks with resolved templates."""
+        player, enemy = self.player.resolve(), self.enemy.resolve()
+        return [
+            (
+                player,
+                enemy,
+                min(self.shard_size, fights - start),
+                master_seed,
+                index,
+                self.max_rounds,
+            )
+            for index, start in enumerate(range(0, fights, self.shard_size))
+        ]
+
+    def run(self, fights: int, master_seed: int) -> SimulationResult:
+        """Simulate ``fights`` fights and merge the shard results.
+
+        The same ``master_seed`` and ``shard_size`` give identical results
+        for any number of workers.
+        """
+        tasks = self.shards(fights, master_seed)
+        if not tasks:
+            player, enemy = self.player.resolve(), self.enemy.resolve()
+            return _simulator(player, enemy, self.max_rounds).run(0)
+
+        if self.workers == 1 or len(tasks) == 1:
+            parts = [_run_shard_args(task) for task in tasks]
+        else:
+            workers = min(self.workers, len(tasks))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                parts = list(pool.map(_run_shard_args, tasks))
+        return reduce(SimulationResult.merge, parts)
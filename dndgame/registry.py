@@ -0,0 +1,410 @@
+"""Data-driven race and enemy definitions.
+
+A :class:`Registry` reads race and enemy definitions from JSON or TOML
+files the first time one is looked up. Each definition is validated and
+compiled once into an immutable prototype, and enemies are spawned from
+their prototype by copying a packed score block, skipping the checks in
+``Enemy.__init__``. Compiled files can be cached on disk, keyed by the
+source file's size and modification time, so unchanged files aren't
+parsed again on the next start.
+
+File format (JSON files use the same structure)::
+
+    [races.Gnome]
+    bonuses = { INT = 2, DEX = 1 }
+
+    [enemies.Kobold]
+    hp = 5
+    ac = 12
+    level = 1
+    stats = { STR = 7, DEX = 15 }   # missing abilities default to 10
+
+Example:
+    >>> registry = Registry(["content/"], cache_dir=".dndcache")
+    >>> kobolds = registry.spawn_many("Kobold", 1000)
+    >>> hero = registry.create_character("Pip", "Gnome", 10)
+    >>> registry.uninstall()  # put RACES and ENEMY_TEMPLATES back
+"""
+
+import hashlib
+import json
+import marshal
+import tomllib
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Optional, Union
+
+from dndgame.character import RACES, Character
+from dndgame.enemy import ENEMY_TEMPLATES, Enemy
+from dndgame.entity import ABILITY_NAMES
+
+
+CACHE_VERSION: int = 1
+
+SUFFIXES: tuple[str, ...] = (".json", ".toml")
+
+# Compiled forms, as stored in the cache:
+# race: (name, ((stat, bonus), ...))
+# enemy: (name, hp, armor_class, level, (STR, DEX, CON, INT, WIS, CHA))
+CompiledRace = tuple[str, tuple[tuple[str, int], ...]]
+CompiledEnemy = tuple[str, int, int, int, tuple[int, ...]]
+
+
+class RegistryError(ValueError):
+    """A definition file or entry is invalid."""
+
+
+@dataclass(frozen=True)
+class RacePrototype:
+    """Compiled race definition.
+
+    Attributes:
+        name: Race name
+        bonuses: Ability score bonuses
+    """
+
+    name: str
+    bonuses: tuple[tuple[str, int], ...]
+
+    def as_dict(self) -> dict[str, int]:
+        """Bonuses in the ``RACES`` format."""
+        return dict(self.bonuses)
+
+
+@dataclass(frozen=True)
+class EnemyPrototype:
+    """Compiled enemy definition that spawns enemies by cloning.
+
+    Attributes:
+        enemy_type: Type name
+        hp: Maximum hit points
+        armor_class: Armor class
+        level: Level
+        scores: Ability scores in STR, DEX, CON, INT, WIS, CHA order
+    """
+
+    enemy_type: str
+    hp: int
+    armor_class: int
+    level: int
+    scores: tuple[int, ...]
+    # Scores and modifiers packed like Entity._block, copied on spawn.
+    _block: "array[int]" = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        block = array("h", self.scores + tuple((s - 10) // 2 for s in self.scores))
+        object.__setattr__(self, "_block", block)
+
+    def spawn(self, name: Optional[str] = None) -> Enemy:
+        """Create an enemy without revalidating the definition."""
+        enemy = Enemy.__new__(Enemy)
+        enemy.name = name if name else self.enemy_type
+        enemy._block = array("h", self._block)
+        enemy.hp = enemy.max_hp = self.hp
+        enemy.armor_class = self.armor_class
+        enemy.level = self.level
+        enemy.enemy_type = self.enemy_type
+        return enemy
+
+    def as_template(self) -> dict[str, Any]:
+        """Definition in the ``ENEMY_TEMPLATES`` format."""
+        return {
+            "hp": self.hp,
+            "ac": self.armor_class,
+            "level": self.level,
+            "stats": dict(zip(ABILITY_NAMES, self.scores)),
+        }
+
+
+def _require_int(value: object, what: str, low: int, high: int) -> int:
+    """Check a value is an integer within bounds."""
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise RegistryError(f"{what} must be an integer, got {value!r}")
+    if not low <= value <= high:
+        raise RegistryError(f"{what} must be between {low} and {high}, got {value}")
+    return value
+
+
+def _require_table(value: object, what: str) -> dict[str, Any]:
+    """Check a value is a table (dict)."""
+    if not isinstance(value, dict):
+        raise RegistryError(f"{what} must be a table, got {type(value).__name__}")
+    return value
+
+
+def compile_race(name: str, data: object) -> CompiledRace:
+    """Validate a race definition.
+
+    Raises:
+        RegistryError: If the definition is malformed
+    """
+    entry = _require_table(data, f"race {name}")
+    unknown = set(entry) - {"bonuses"}
+    if unknown:
+        raise RegistryError(f"race {name}: unknown keys {sorted(unknown)}")
+    bonuses = _require_table(entry.get("bonuses", {}), f"race {name} bonuses")
+    compiled = []
+    for stat, bonus in bonuses.items():
+        if stat not in ABILITY_NAMES:
+            raise RegistryError(f"race {name}: unknown ability {stat!r}")
+        compiled.append((stat, _require_int(bonus, f"race {name} {stat}", -10, 10)))
+    return name, tuple(compiled)
+
+
+def compile_enemy(name: str, data: object) -> CompiledEnemy:
+    """Validate an enemy definition.
+
+    Raises:
+        RegistryError: If the definition is malformed
+    """
+    entry = _require_table(data, f"enemy {name}")
+    unknown = set(entry) - {"hp", "ac", "level", "stats"}
+    if unknown:
+        raise RegistryError(f"enemy {name}: unknown keys {sorted(unknown)}")
+    if "hp" not in entry:
+        raise RegistryError(f"enemy {name}: missing hp")
+    hp = _require_int(entry["hp"], f"enemy {name} hp", 1, 1 << 30)
+    armor_class = _require_int(entry.get("ac", 10), f"enemy {name} ac", -100, 100)
+    level = _require_int(entry.get("level", 1), f"enemy {name} level", 1, 1000)
+    stats = _require_table(entry.get("stats", {}), f"enemy {name} stats")
+    for stat in stats:
+        if stat not in ABILITY_NAMES:
+            raise RegistryError(f"enemy {name}: unknown ability {stat!r}")
+    scores = tuple(
+        _require_int(stats.get(stat, 10), f"enemy {name} {stat}", 1, 100)
+        for stat in ABILITY_NAMES
+    )
+    return name, hp, armor_class, level, scores
+
+
+def compile_document(
+    document: dict[str, Any], source: str
+) -> tuple[list[CompiledRace], list[CompiledEnemy]]:
+    """Validate every definition in a parsed file."""
+    unknown = set(document) - {"races", "enemies"}
+    if unknown:
+        raise RegistryError(f"{source}: unknown sections {sorted(unknown)}")
+    try:
+        races = _require_table(document.get("races", {}), "races")
+        enemies = _require_table(document.get("enemies", {}), "enemies")
+        return (
+            [compile_race(name, data) for name, data in races.items()],
+            [compile_enemy(name, data) for name, data in enemies.items()],
+        )
+    except RegistryError as error:
+        raise RegistryError(f"{source}: {error}") from None
+
+
+def parse_file(path: Path) -> dict[str, Any]:
+    """Parse a JSON or TOML definition file."""
+    try:
+        if path.suffix == ".toml":
+            with open(path, "rb") as file:
+                return tomllib.load(file)
+        document = json.loads(path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, tomllib.TOMLDecodeError) as error:
+        raise RegistryError(f"{path}: {error}") from None
+    return _require_table(document, str(path))
+
+
+class Registry:
+    """Lazily loaded race and enemy prototypes.
+
+    Sources are files or directories of ``.json`` / ``.toml`` files. Later
+    sources override earlier definitions with the same name, and the
+    built-in ``RACES`` and ``ENEMY_TEMPLATES`` come first unless disabled.
+
+    Attributes:
+        sources: Files and directories to load from
+        cache_dir: Where compiled files are cached (no cache if omitted)
+        parsed: Source files parsed so far (as opposed to read from cache)
+    """
+
+    def __init__(
+        self,
+        sources: Iterable[Union[str, Path]] = (),
+        cache_dir: Optional[Union[str, Path]] = None,
+        include_builtins: bool = True,
+    ) -> None:
+        self.sources: list[Path] = [Path(source) for source in sources]
+        self.cache_dir: Optional[Path] = Path(cache_dir) if cache_dir else None
+        self.include_builtins: bool = include_builtins
+        self.parsed: int = 0
+        self._loaded: bool = False
+        self._compiled_races: dict[str, CompiledRace] = {}
+        self._compiled_enemies: dict[str, CompiledEnemy] = {}
+        self._races: dict[str, RacePrototype] = {}
+        self._enemies: dict[str, EnemyPrototype] = {}
+        # What each install replaced (None: the name was new), for uninstall.
+        self._replaced_races: dict[str, Optional[dict[str, int]]] = {}
+        self._replaced_enemies: dict[str, Optional[dict[str, Any]]] = {}
+
+    def add_source(self, source: Union[str, Path]) -> None:
+        """Add a file or directory, loaded on the next lookup."""
+        self.sources.append(Path(source))
+        self._loaded = False
+        self._races.clear()
+        self._enemies.clear()
+
+    def _files(self) -> list[Path]:
+        files = []
+        for source in self.sources:
+            if source.is_dir():
+                files += sorted(
+                    path for path in source.iterdir() if path.suffix in SUFFIXES
+                )
+            else:
+                files.append(source)
+        return files
+
+    def _load(self) -> None:
+        """Read every source (from cache where possible), once."""
+        if self._loaded:
+            return
+        races: dict[str, CompiledRace] = {}
+        enemies: dict[str, CompiledEnemy] = {}
+        if self.include_builtins:
+            for name, bonuses in RACES.items():
+                races[name] = (name, tuple(bonuses.items()))
+            for name, template in ENEMY_TEMPLATES.items():
+                enemies[name] = compile_enemy(name, template)
+        for path in self._files():
+            file_races, file_enemies = self._compile_file(path)
+            races.update((race[0], race) for race in file_races)
+            enemies.update((enemy[0], enemy) for enemy in file_enemies)
+        self._compiled_races = races
+        self._compiled_enemies = enemies
+        self._races.clear()
+        self._enemies.clear()
+        self._loaded = True
+
+    def _cache_path(self, path: Path) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.blake2b(str(path.resolve()).encode(), digest_size=16)
+        return self.cache_dir / f"{digest.hexdigest()}.bin"
+
+    def _compile_file(
+        self, path: Path
+    ) -> tuple[list[CompiledRace], list[CompiledEnemy]]:
+        """Compile one file, using the on-disk cache if it's current."""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            raise RegistryError(f"{path}: no such file") from None
+        stamp = (CACHE_VERSION, str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+        cache_path = self._cache_path(path)
+        if cache_path is not None and cache_path.exists():
+            try:
+                cached = marshal.loads(cache_path.read_bytes())
+            except (EOFError, ValueError, TypeError):
+                cached = None
+            if isinstance(cached, tuple) and cached[:4] == stamp:
+                return list(cached[4]), list(cached[5])
+
+        races, enemies = compile_document(parse_file(path), str(path))
+        self.parsed += 1
+        if cache_path is not None:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            data = marshal.dumps((*stamp, tuple(races), tuple(enemies)))
+            temporary = cache_path.with_suffix(".tmp")
+            temporary.write_bytes(data)
+            temporary.replace(cache_path)
+        return races, enemies
+
+    def race_names(self) -> list[str]:
+        """Names of every known race."""
+        self._load()
+        return list(self._compiled_races)
+
+    def enemy_types(self) -> list[str]:
+        """Names of every known enemy type."""
+        self._load()
+        return list(self._compiled_enemies)
+
+    def race(self, name: str) -> RacePrototype:
+        """Get a race prototype.
+
+        Raises:
+            KeyError: If no source defines the race
+        """
+        prototype = self._races.get(name)
+        if prototype is None:
+            self._load()
+            compiled = self._compiled_races[name]
+            prototype = RacePrototype(*compiled)
+            self._races[name] = prototype
+        return prototype
+
+    def enemy(self, enemy_type: str) -> EnemyPrototype:
+        """Get an enemy prototype.
+
+        Raises:
+            KeyError: If no source defines the enemy type
+        """
+        prototype = self._enemies.get(enemy_type)
+        if prototype is None:
+            self._load()
+            prototype = EnemyPrototype(*self._compiled_enemies[enemy_type])
+            self._enemies[enemy_type] = prototype
+        return prototype
+
+    def spawn(self, enemy_type: str, name: Optional[str] = None) -> Enemy:
+        """Create one enemy from its prototype."""
+        return self.enemy(enemy_type).spawn(name)
+
+    def spawn_many(self, enemy_type: str, count: int) -> list[Enemy]:
+        """Create ``count`` enemies named "<type> 1", "<type> 2", ..."""
+        prototype = self.enemy(enemy_type)
+        return [prototype.spawn(f"{enemy_type} {i}") for i in range(1, count + 1)]
+
+    def install_race(self, name: str) -> RacePrototype:
+        """Make a race usable by ``Character`` (and the game menu).
+
+        The change is global until :meth:`uninstall` is called.
+        """
+        prototype = self.race(name)
+        self._replaced_races.setdefault(name, RACES.get(name))
+        if name not in RACES:
+            Character.available_races.append(name)
+        RACES[name] = prototype.as_dict()
+        return prototype
+
+    def install_enemy(self, enemy_type: str) -> EnemyPrototype:
+        """Make an enemy type usable by ``Enemy(enemy_type)``.
+
+        The change is global until :meth:`uninstall` is called.
+        """
+        prototype = self.enemy(enemy_type)
+        self._replaced_enemies.setdefault(enemy_type, ENEMY_TEMPLATES.get(enemy_type))
+        if enemy_type not in ENEMY_TEMPLATES:
+            Enemy.available_types.append(enemy_type)
+        ENEMY_TEMPLATES[enemy_type] = prototype.as_template()
+        return prototype
+
+    def create_character(self, name: str, race: str, base_hp: int) -> Character:
+        """Create a character of a registry race, installing it if needed."""
+        if race not in RACES:
+            self.install_race(race)
+        return Character(name, race, base_hp)
+
+    def uninstall(self) -> None:
+        """Undo every install made through this registry.
+
+        Races and enemy types it added are removed again, and built-in
+        entries it overrode get their original definitions back.
+        """
+        for name, race in self._replaced_races.items():
+            if race is not None:
+                RACES[name] = race
+            elif RACES.pop(name, None) is not None:
+                Character.available_races.remove(name)
+        for enemy_type, template in self._replaced_enemies.items():
+            if template is not None:
+                ENEMY_TEMPLATES[enemy_type] = template
+            elif ENEMY_TEMPLATES.pop(enemy_type, None) is not None:
+                Enemy.available_types.remove(enemy_type)
+        self._replaced_races.clear()
+        self._replaced_enemies.clear()
@@ -0,0 +1,220 @@
+"""Non-interactive, scripted game sessions.
+
+Runs the ``main.py`` flow (name, race, then menu choices) from a fixed
+list of input lines instead of ``input()``, through
+:class:`~dndgame.session.GameSession`. Any number of sessions run in one
+process, and each produces a JSON-ready :class:`ScriptResult`. This is
+what ``python main.py --inputs ...`` and ``python main.py --script ...``
+use.
+
+Example:
+    $ python main.py --inputs Aria 2 1 4 5 --sessions 1000 --seed 7 --summary
+    $ python main.py --script smoke.txt --transcript
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import Any, Iterator, NamedTuple, Optional, Sequence
+
+from dndgame.rng import RandomSource, RngStreams
+from dndgame.session import GameSession
+
+
+class ScriptResult(NamedTuple):
+    """How one scripted session ended.
+
+    Attributes:
+        session: Index of the session in its batch
+        outcome: "quit", "defeated" or "incomplete" (inputs ran out)
+        fights_won: Fights won before the end
+        inputs_used: Input lines consumed
+        race: The character's race, if one was created
+        hp: Current HP at the end, if a character was created
+        max_hp: Maximum HP, if a character was created
+        transcript: Everything the game printed, if requested
+    """
+
+    session: int
+    outcome: str
+    fights_won: int
+    inputs_used: int
+    race: Optional[str] = None
+    hp: Optional[int] = None
+    max_hp: Optional[int] = None
+    transcript: Optional[str] = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain-data form, leaving out a transcript that wasn't kept."""
+        data = {
+            "session": self.session,
+            "outcome": self.outcome,
+            "fights_won": self.fights_won,
+            "inputs_used": self.inputs_used,
+            "race": self.race,
+            "hp": self.hp,
+            "max_hp": self.max_hp,
+        }
+        if self.transcript is not None:
+            data["transcript"] = self.transcript
+        return data
+
+
+def run_script(
+    inputs: Sequence[str],
+    rng: Optional[RandomSource] = None,
+    transcript: bool = False,
+    session: int = 0,
+) -> ScriptResult:
+    """Play one session from input lines.
+
+    Input after the session ends is ignored.
+
+    Args:
+        inputs: Lines the player would type, in order
+        rng: Random source for stat rolls and fights
+        transcript: Keep everything the game printed
+        session: Index reported in the result
+
+    Returns:
+        How the session ended
+    """
+    game = GameSession(rng)
+    output = [game.start()]
+    used = 0
+    for line in inputs:
+        if game.finished:
+            break
+        output.append(game.feed(line))
+        used += 1
+
+    player = game.player
+    if not game.finished:
+        outcome = "incomplete"
+    elif player is not None and player.is_alive():
+        outcome = "quit"
+    else:
+        outcome = "defeated"
+    return ScriptResult(
+        session,
+        outcome,
+        game.won,
+        used,
+        player.race if player is not None else None,
+        player.hp if player is not None else None,
+        player.max_hp if player is not None else None,
+        "".join(output) if transcript else None,
+    )
+
+
+def run_scripts(
+    inputs: Sequence[str],
+    sessions: int,
+    seed: Optional[int] = None,
+    transcript: bool = False,
+) -> Iterator[ScriptResult]:
+    """Play the same script in many sessions.
+
+    Args:
+        inputs: Lines the player would type, in order
+        sessions: How many sessions to run
+        seed: Master seed; session ``i`` uses stream ``i`` (global
+            ``random`` if omitted)
+        transcript: Keep everything the game printed
+
+    Yields:
+        One result per session, in order
+    """
+    streams = RngStreams(seed) if seed is not None else None
+    for index in range(sessions):
+        rng = streams.stream(index) if streams is not None else None
+        yield run_script(inputs, rng, transcript, index)
+
+
+def summarize(results: Sequence[ScriptResult]) -> dict[str, Any]:
+    """Aggregate counts over a batch of results."""
+    outcomes: dict[str, int] = {}
+    for result in results:
+        outcomes[result.outcome] = outcomes.get(result.outcome, 0) + 1
+    return {
+        "sessions": len(results),
+        "outcomes": outcomes,
+        "fights_won": sum(result.fights_won for result in results),
+    }
+
+
+def read_script(path: str) -> list[str]:
+    """Read input lines from a file ("-" for stdin)."""
+    if path == "-":
+        return sys.stdin.read().splitlines()
+    with open(path, encoding="utf-8") as file:
+        return file.read().splitlines()
+
+
+class _HelpFormatter(argparse.HelpFormatter):
+    """Help formatter that sizes itself to the terminal only when used.
+
+    argparse builds a formatter for every ``add_argument`` call, and the
+    stock one imports :mod:`shutil` to measure the terminal each time;
+    that import alone is a noticeable share of a short scripted run.
+    """
+
+    def __init__(self, prog: str) -> None:
+        super().__init__(prog, width=80)
+
+    def format_help(self) -> str:
+        import shutil
+
+        width = shutil.get_terminal_size().columns - 2
+        self._width = width
+        self._max_help_position = min(
+            self._max_help_position, max(width - 20, self._indent_increment * 2)
+        )
+        return super().format_help()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run scripted sessions from the command line.
+
+    Prints one JSON object per session, or one summary object with
+    ``--summary``.
+
+    Returns:
+        Exit status: 0, or 1 if any session ran out of input
+    """
+    parser = argparse.ArgumentParser(
+        prog="main.py",
+        description="Play D&D Adventure from a script.",
+        formatter_class=_HelpFormatter,
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
+        "--script", metavar="FILE", help="file of input lines ('-' for stdin)"
+    )
+    source.add_argument("--inputs", nargs="+", metavar="LINE", help="input lines")
+    parser.add_argument("--sessions", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--transcript", action="store_true", help="include the game text"
+    )
+    parser.add_argument(
+        "--summary", action="store_true", help="print only aggregate results"
+    )
+    args = parser.parse_args(argv)
+
+    inputs = read_script(args.script) if args.script else args.inputs
+    start = time.perf_counter()
+    kept: list[ScriptResult] = []
+    incomplete = False
+    for result in run_scripts(inputs, args.sessions, args.seed, args.transcript):
+        incomplete = incomplete or result.outcome == "incomplete"
+        if args.summary:
+            kept.append(result)
+        else:
+            print(json.dumps(result.to_dict()))
+    if args.summary:
+        summary = summarize(kept)
+        summary["elapsed_ms"] = (time.perf_counter() - start) * 1000
+        print(json.dumps(summary))
+    return 1 if incomplete else 0
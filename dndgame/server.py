@@ -0,0 +1,149 @@
+"""Asyncio TCP server hosting many game sessions in one process.
+
+Each connection gets its own :class:`~dndgame.session.GameSession`; the
+server reads a line, feeds it to the session and writes back the reply,
+all on one event loop with no thread per player. Every reply ends with
+:data:`END_OF_RESPONSE` so clients know when to send the next line, and
+the last reply of a session also carries :data:`END_OF_SESSION` before
+the server closes the connection.
+
+Example:
+    $ python -m dndgame.server --port 8765
+    $ nc localhost 8765
+"""
+
+import argparse
+import asyncio
+from typing import Optional, Sequence
+
+from dndgame.rng import RngStreams
+from dndgame.session import GameSession
+
+
+DEFAULT_HOST: str = "127.0.0.1"
+DEFAULT_PORT: int = 8765
+
+END_OF_RESPONSE: bytes = b"\0"
+END_OF_SESSION: bytes = b"\x04"
+
+MAX_LINE: int = 1024
+
+
+class GameServer:
+    """Serves the console game over TCP.
+
+    Attributes:
+        host: Interface to listen on
+        port: Port to listen on (0 picks a free one, see :attr:`port` after
+            :meth:`start`)
+        seed: Master seed for per-session random streams (unseeded if
+            omitted)
+        backlog: Pending connections the listener queues
+        active: Sessions currently connected
+        completed: Sessions that have ended
+    """
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        seed: Optional[int] = None,
+        backlog: int = 4096,
+    ) -> None:
+        self.host: str = host
+        self.port: int = port
+        self.seed: Optional[int] = seed
+        self.backlog: int = backlog
+        self.active: int = 0
+        self.completed: int = 0
+        self._streams: Optional[RngStreams] = (
+            RngStreams(seed) if seed is not None else None
+        )
+        self._sessions_started: int = 0
+        self._server: Optional[asyncio.Server] = None
+
+    def new_session(self) -> GameSession:
+        """Create the session for a new connection."""
+        index = self._sessions_started
+        self._sessions_started += 1
+        rng = self._streams.stream(index) if self._streams is not None else None
+        return GameSession(rng=rng)
+
+    async def start(self) -> None:
+        """Start listening."""
+        self._server = await asyncio.start_server(
+            self._handle, self.host, self.port, backlog=self.backlog, limit=MAX_LINE
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """Start listening (if needed) and serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop accepting connections and wait for the listener to close."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Run one session for the lifetime of a connection."""
+        session = self.new_session()
+        self.active += 1
+        try:
+            writer.write(session.start().encode() + END_OF_RESPONSE)
+            await writer.drain()
+            while not session.finished:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    break
+                if not line:
+                    break
+                reply = session.feed(line.decode(errors="replace")).encode()
+                if session.finished:
+                    reply += END_OF_SESSION
+                writer.write(reply + END_OF_RESPONSE)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.active -= 1
+            self.completed += 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Run the game server from the command line."""
+    parser = argparse.ArgumentParser(description="Host D&D Adventure over TCP.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    server = GameServer(args.host, args.port, args.seed)
+
+    async def run() -> None:
+        await server.start()
+        print(f"Serving D&D Adventure on {server.host}:{server.port}")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+
+
+if __name__ == "__main__":
+    main()
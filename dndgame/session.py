@@ -0,0 +1,203 @@
+"""Input-driven game session, independent of how input arrives.
+
+:class:`GameSession` is the game's flow (create a character, then fight,
+view, rest or quit from the menu) as a state machine: each line of player
+input goes in through :meth:`GameSession.feed` and the text to print comes
+back as a string. ``main.py`` plays it on the console; nothing blocks, so
+one process can also hold any number of sessions, whether they are driven
+by a network server, a script or a test.
+
+Example:
+    >>> session = GameSession()
+    >>> text = session.start()
+    >>> for line in ["Aria", "2", "1", "4", "5"]:
+    ...     text = session.feed(line)
+    >>> session.finished
+    True
+"""
+
+import io
+from enum import Enum
+from typing import Optional
+
+from dndgame.character import Character
+from dndgame.combat import Combat
+from dndgame.enemy import Enemy
+from dndgame.events import EventSink, StdoutSink
+from dndgame.rng import RandomSource
+
+
+RULE: str = "=" * 40
+
+MENU_OPTIONS: list[str] = ["1", "2", "3", "4", "5"]
+
+MENU_ENEMIES: dict[str, str] = {"1": "Goblin", "2": "Orc"}
+
+
+class SessionState(Enum):
+    """Where a session is in the game flow."""
+
+    NEW = "new"
+    NAME = "name"
+    RACE = "race"
+    MENU = "menu"
+    FINISHED = "finished"
+
+
+class GameSession:
+    """One player's game, advanced one input line at a time.
+
+    Attributes:
+        state: Current point in the flow
+        player: The player's character once created
+        won: Fights won so far
+        rng: Random source for stat rolls and fights (global ``random`` if
+            omitted)
+    """
+
+    def __init__(self, rng: Optional[RandomSource] = None) -> None:
+        self.state: SessionState = SessionState.NEW
+        self.player: Optional[Character] = None
+        self.won: int = 0
+        self.rng: Optional[RandomSource] = rng
+        self._name: str = ""
+        self._out: io.StringIO = io.StringIO()
+        self._sink: EventSink = StdoutSink(self._out)
+
+    @property
+    def finished(self) -> bool:
+        """Check if the session has ended."""
+        return self.state is SessionState.FINISHED
+
+    def start(self) -> str:
+        """Begin the session.
+
+        Returns:
+            The welcome text and the first prompt
+        """
+        if self.state is not SessionState.NEW:
+            raise RuntimeError("Session already started")
+        self._print("Welcome to D&D Adventure!")
+        self._print(RULE)
+        self._prompt("\nEnter character name: ")
+        self.state = SessionState.NAME
+        return self._flush()
+
+    def feed(self, line: str) -> str:
+        """Handle one line of player input.
+
+        Returns:
+            Everything the game prints in response, ending with the next
+            prompt unless the session finished
+        """
+        choice = line.strip()
+        if self.state is SessionState.NAME:
+            self._handle_name(choice)
+        elif self.state is SessionState.RACE:
+            self._handle_race(choice)
+        elif self.state is SessionState.MENU:
+            self._handle_menu(choice)
+        else:
+            raise RuntimeError(f"Session is {self.state.value}, not awaiting input")
+        return self._flush()
+
+    def _print(self, text: str = "") -> None:
+        self._out.write(text + "\n")
+
+    def _prompt(self, text: str) -> None:
+        self._out.write(text)
+
+    def _flush(self) -> str:
+        text = self._out.getvalue()
+        self._out.seek(0)
+        self._out.truncate()
+        return text
+
+    def _race_prompt(self) -> None:
+        count = len(Character.available_races)
+        self._prompt(f"Enter choice (1-{count}): ")
+
+    def _handle_name(self, name: str) -> None:
+        if not name:
+            self._print("Cannot be empty. Try again.")
+            self._prompt("\nEnter character name: ")
+            return
+        self._name = name
+        self._print("\nChoose your race:")
+        for i, race in enumerate(Character.available_races, 1):
+            desc = Character.get_race_description(race)
+            self._print(f"{i}. {race} ({desc})")
+        self._race_prompt()
+        self.state = SessionState.RACE
+
+    def _handle_race(self, choice: str) -> None:
+        races = Character.available_races
+        options = [str(i) for i in range(1, len(races) + 1)]
+        if choice not in options:
+            self._print(f"Invalid. Choose from: {', '.join(options)}")
+            self._race_prompt()
+            return
+        race = races[int(choice) - 1]
+        self._print(f"\nCreating {self._name} the {race}...\n")
+
+        player = Character(self._name, race, 10)
+        player.roll_stats(sink=self._sink, rng=self.rng)
+        player.apply_racial_bonuses()
+        self.player = player
+        self._print("\nCharacter created!")
+        self._display_character()
+        self._menu()
+        self.state = SessionState.MENU
+
+    def _handle_menu(self, choice: str) -> None:
+        player = self.player
+        assert player is not None
+        if choice not in MENU_OPTIONS:
+            self._print(f"Invalid. Choose from: {', '.join(MENU_OPTIONS)}")
+            self._prompt("Enter choice (1-5): ")
+            return
+
+        if choice in MENU_ENEMIES:
+            enemy = Enemy(MENU_ENEMIES[choice])
+            winner = Combat(player, enemy, sink=self._sink, rng=self.rng).run_combat()
+            if winner != player:
+                self._print("\nGame Over!")
+                self.state = SessionState.FINISHED
+                return
+            self.won += 1
+        elif choice == "3":
+            self._display_character()
+        elif choice == "4":
+            player.heal(player.max_hp)
+            self._print(f"\n{player.name} rests!")
+            self._print(f"HP: {player.hp}/{player.max_hp}")
+        else:
+            self._print("\nThanks for playing!")
+            self.state = SessionState.FINISHED
+            return
+        self._menu()
+
+    def _display_character(self) -> None:
+        player = self.player
+        assert player is not None
+        self._print(f"\n{RULE}")
+        self._print(f"{player.name} the {player.race}")
+        self._print(RULE)
+        self._print(f"Level: {player.level}")
+        self._print(f"HP: {player.hp}/{player.max_hp}")
+        self._print(f"AC: {player.armor_class}")
+        self._print("\nAbility Scores:")
+        for stat, value in player.stats.items():
+            mod = player.get_modifier(stat)
+            self._print(f"  {stat}: {value:2d} ({'+' if mod >= 0 else ''}{mod})")
+
+    def _menu(self) -> None:
+        self._print("\n" + RULE)
+        self._print("What would you like to do?")
+        self._print(RULE)
+        self._print("1. Fight a Goblin")
+        self._print("2. Fight an Orc")
+        self._print("3. View character")
+        self._print("4. Rest (restore HP)")
+        self._print("5. Quit")
+        self._prompt("Enter choice (1-5): ")
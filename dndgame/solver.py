@@ -0,0 +1,310 @@
+"""Exact outcome distributions for one-on-one combat.
+
+The rules in :class:`dndgame.combat.Combat` form a small Markov chain over
+(player HP, enemy HP) with a fixed attack order decided by initiative.
+Instead of sampling fights, the solver walks that chain once and returns
+exact win probabilities, survivor HP distributions and mean fight length,
+plus the round-count distribution up to a negligible tail.
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+import numpy as np
+import numpy.typing as npt
+
+from dndgame.entity import Entity
+
+
+FloatArray = npt.NDArray[np.float64]
+
+
+@lru_cache(maxsize=None)
+def dice_distribution(dice_type: int, number_of_dice: int) -> tuple[float, ...]:
+    """Probability of each total when rolling NdX.
+
+    Args:
+        dice_type: Type of dice (6 for d6, 20 for d20)
+        number_of_dice: How many dice to roll
+
+    Returns:
+        Tuple indexed by total, so ``dist[7]`` is P(total == 7)
+
+    Example:
+        >>> round(dice_distribution(6, 2)[7], 4)
+        0.1667
+    """
+    if dice_type < 1 or number_of_dice < 0:
+        raise ValueError(f"Invalid dice: {number_of_dice}d{dice_type}")
+    die = np.full(dice_type + 1, 1.0 / dice_type)
+    die[0] = 0.0
+    dist = np.array([1.0])
+    for _ in range(number_of_dice):
+        dist = np.convolve(dist, die)
+    return tuple(float(p) for p in dist)
+
+
+def hit_probability(attack_modifier: int, armor_class: int) -> float:
+    """Chance that d20 + ``attack_modifier`` meets ``armor_class``."""
+    faces = sum(1 for face in range(1, 21) if face + attack_modifier >= armor_class)
+    return faces / 20
+
+
+def attack_damage_distribution(
+    attack_modifier: int, armor_class: int
+) -> tuple[tuple[int, float], ...]:
+    """Damage dealt by one attack, with 0 standing for a miss.
+
+    Damage is 1d6 + the attacker's STR modifier with a minimum of 1, as in
+    :meth:`dndgame.combat.Combat.attack`.
+
+    Returns:
+        ``(damage, probability)`` pairs with non-zero probability
+    """
+    p_hit = hit_probability(attack_modifier, armor_class)
+    outcomes: dict[int, float] = {}
+    if p_hit < 1:
+        outcomes[0] = 1 - p_hit
+    if p_hit > 0:
+        for total, p in enumerate(dice_distribution(6, 1)):
+            if p:
+                damage = max(1, total + attack_modifier)
+                outcomes[damage] = outcomes.get(damage, 0.0) + p_hit * p
+    return tuple(sorted(outcomes.items()))
+
+
+def initiative_probability(player_dex: int, enemy_dex: int) -> float:
+    """Chance the player acts first (ties go to the player)."""
+    wins = sum(
+        1
+        for player_roll in range(1, 21)
+        for enemy_roll in range(1, 21)
+        if player_roll + player_dex >= enemy_roll + enemy_dex
+    )
+    return wins / 400
+
+
+@dataclass
+class CombatOdds:
+    """Exact outcome of a one-on-one fight.
+
+    Attributes:
+        player_win_probability: Chance the player wins
+        enemy_win_probability: Chance the enemy wins
+        stalemate_probability: Chance neither side can ever land a hit
+        player_first_probability: Chance the player wins initiative
+        mean_rounds: Expected number of rounds (excluding stalemates)
+        rounds_distribution: P(fight ends in round r), indexed by r
+        rounds_tail: Probability mass beyond the last listed round
+        player_hp_distribution: P(player wins with h HP left), indexed by h
+        enemy_hp_distribution: P(enemy wins with h HP left), indexed by h
+    """
+
+    player_win_probability: float
+    enemy_win_probability: float
+    stalemate_probability: float
+    player_first_probability: float
+    mean_rounds: float
+    rounds_distribution: list[float] = field(default_factory=list)
+    rounds_tail: float = 0.0
+    player_hp_distribution: list[float] = field(default_factory=list)
+    enemy_hp_distribution: list[float] = field(default_factory=list)
+
+
+class _Ordered:
+    """Outcome of the chain for one fixed attack order.
+
+    ``first`` attacks ``second`` at the start of every round.
+    """
+
+    def __init__(
+        self,
+        first_hp: int,
+        second_hp: int,
+        first_damage: tuple[tuple[int, float], ...],
+        second_damage: tuple[tuple[int, float], ...],
+    ) -> None:
+        self.first_hp_dist: list[float] = [0.0] * (first_hp + 1)
+        self.second_hp_dist: list[float] = [0.0] * (second_hp + 1)
+        self.stalemate: float = 0.0
+        self.expected_rounds: float = 0.0
+        self._solve(first_hp, second_hp, first_damage, second_damage)
+
+    def _solve(
+        self,
+        first_hp: int,
+        second_hp: int,
+        first_damage: tuple[tuple[int, float], ...],
+        second_damage: tuple[tuple[int, float], ...],
+    ) -> None:
+        """Push probability mass through states in decreasing HP order.
+
+        Every non-looping transition lowers at least one HP total, so each
+        state is final once reached in this order. The "both miss" self-loop
+        is folded in by dividing by its complement.
+        """
+        miss_first = dict(first_damage).get(0, 0.0)
+        miss_second = dict(second_damage).get(0, 0.0)
+        loop = miss_first * miss_second
+
+        mass = [[0.0] * (second_hp + 1) for _ in range(first_hp + 1)]
+        mass[first_hp][second_hp] = 1.0
+        for a in range(first_hp, 0, -1):
+            row = mass[a]
+            for b in range(second_hp, 0, -1):
+                m = row[b]
+                if not m:
+                    continue
+                if loop >= 1.0:
+                    self.stalemate += m
+                    continue
+                scale = m / (1.0 - loop)
+                self.expected_rounds += scale
+                for d1, p1 in first_damage:
+                    if d1 >= b:
+                        self.first_hp_dist[a] += scale * p1
+                        continue
+                    nb = b - d1
+                    for d2, p2 in second_damage:
+                        if not d1 and not d2:
+                            continue
+                        p = scale * p1 * p2
+                        if d2 >= a:
+                            self.second_hp_dist[nb] += p
+                        else:
+                            mass[a - d2][nb] += p
+
+
+def _rounds_distribution(
+    first_hp: int,
+    second_hp: int,
+    first_damage: tuple[tuple[int, float], ...],
+    second_damage: tuple[tuple[int, float], ...],
+    max_rounds: int,
+    tolerance: float,
+) -> tuple[FloatArray, float]:
+    """Round-by-round forward pass for one attack order.
+
+    Returns:
+        P(fight ends in round r) for r in 0..max_rounds, and leftover mass
+    """
+    ended = np.zeros(max_rounds + 1)
+    state = np.zeros((first_hp + 1, second_hp + 1))
+    state[first_hp, second_hp] = 1.0
+    for r in range(1, max_rounds + 1):
+        after_first = np.zeros_like(state)
+        for d1, p1 in first_damage:
+            if d1:
+                ended[r] += p1 * state[:, 1 : d1 + 1].sum()
+                after_first[:, 1:-d1] += p1 * state[:, d1 + 1 :]
+            else:
+                after_first += p1 * state
+        after_second = np.zeros_like(state)
+        for d2, p2 in second_damage:
+            if d2:
+                ended[r] += p2 * after_first[1 : d2 + 1, :].sum()
+                after_second[1:-d2, :] += p2 * after_first[d2 + 1 :, :]
+            else:
+                after_second += p2 * after_first
+        state = after_second
+        if state.sum() < tolerance:
+            break
+    return ended, float(state.sum())
+
+
+def solve_combat(
+    player: Entity,
+    enemy: Entity,
+    max_rounds: int = 200,
+    tolerance: float = 1e-12,
+) -> CombatOdds:
+    """Compute the exact outcome distribution of ``Combat(player, enemy)``.
+
+    Args:
+        player: Player combatant (not modified)
+        enemy: Enemy combatant (not modified)
+        max_rounds: Longest fight tracked in the round distribution
+        tolerance: Stop tracking rounds once this much mass is left
+
+    Returns:
+        Exact win, survivor HP and round statistics
+
+    Example:
+        >>> odds = solve_combat(hero, Enemy("Goblin"))
+        >>> round(odds.player_win_probability, 3)  # doctest: +SKIP
+        0.977
+    """
+    player_hp = max(player.hp, 0)
+    enemy_hp = max(enemy.hp, 0)
+    if player_hp == 0 or enemy_hp == 0:
+        # Combat.run_combat never enters a round and the player wins if alive.
+        player_wins = player_hp > 0
+        player_dist = [0.0] * (player_hp + 1)
+        enemy_dist = [0.0] * (enemy_hp + 1)
+        if player_wins:
+            player_dist[player_hp] = 1.0
+        else:
+            enemy_dist[enemy_hp] = 1.0
+        return CombatOdds(
+            player_win_probability=float(player_wins),
+            enemy_win_probability=float(not player_wins),
+            stalemate_probability=0.0,
+            player_first_probability=initiative_probability(
+                player.get_modifier("DEX"), enemy.get_modifier("DEX")
+            ),
+            mean_rounds=0.0,
+            rounds_distribution=[1.0],
+            player_hp_distribution=player_dist,
+            enemy_hp_distribution=enemy_dist,
+        )
+
+    player_damage = attack_damage_distribution(
+        player.get_modifier("STR"), enemy.armor_class
+    )
+    enemy_damage = attack_damage_distribution(
+        enemy.get_modifier("STR"), player.armor_class
+    )
+    p_first = initiative_probability(
+        player.get_modifier("DEX"), enemy.get_modifier("DEX")
+    )
+
+    player_weights = np.zeros(player_hp + 1)
+    enemy_weights = np.zeros(enemy_hp + 1)
+    rounds = np.zeros(max_rounds + 1)
+    stalemate = mean_rounds = tail = 0.0
+    for weight, player_first in ((p_first, True), (1.0 - p_first, False)):
+        if not weight:
+            continue
+        if player_first:
+            order = (player_hp, enemy_hp, player_damage, enemy_damage)
+        else:
+            order = (enemy_hp, player_hp, enemy_damage, player_damage)
+        chain = _Ordered(*order)
+        first_dist = np.array(chain.first_hp_dist)
+        second_dist = np.array(chain.second_hp_dist)
+        if player_first:
+            player_weights += weight * first_dist
+            enemy_weights += weight * second_dist
+        else:
+            enemy_weights += weight * first_dist
+            player_weights += weight * second_dist
+        stalemate += weight * chain.stalemate
+        mean_rounds += weight * chain.expected_rounds
+
+        ended, left = _rounds_distribution(*order, max_rounds, tolerance)
+        rounds += weight * ended
+        tail += weight * left
+
+    resolved = 1.0 - stalemate
+    last = int(np.flatnonzero(rounds)[-1]) + 1 if rounds.any() else 1
+    return CombatOdds(
+        player_win_probability=float(player_weights.sum()),
+        enemy_win_probability=float(enemy_weights.sum()),
+        stalemate_probability=stalemate,
+        player_first_probability=p_first,
+        mean_rounds=mean_rounds / resolved if resolved > 0 else 0.0,
+        rounds_distribution=[float(p) for p in rounds[:last]],
+        rounds_tail=tail,
+        player_hp_distribution=[float(p) for p in player_weights],
+        enemy_hp_distribution=[float(p) for p in enemy_weights],
+    )
@@ -1,7 +1,38 @@
-"""Spell system for D&D game."""
+"""Spell system for D&D game.
 
-from typing import Optional
+Damage spells roll ``spell_power`` d6. Each target makes a saving throw,
+d20 plus the modifier of the ability its school tests, against a DC of
+8 + spell level + the caster's INT modifier, and takes half damage
+(rounded down) on a success. :meth:`Spell.cast_area` resolves one cast
+against any number of targets with NumPy, rolling every save and damage
+total at once and writing HP back in one pass.
+"""
+
+from bisect import bisect_left
+from operator import itemgetter
+from typing import TYPE_CHECKING, Iterable, Optional, Sequence
+from dndgame.dice import roll
 from dndgame.entity import Entity
+from dndgame.events import EventSink
+from dndgame.rng import RandomSource
+
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+
+# Ability each school's saving throw tests; other schools test DEX.
+SAVE_ABILITIES: dict[str, str] = {
+    "Evocation": "DEX",
+    "Conjuration": "DEX",
+    "Necromancy": "CON",
+    "Transmutation": "CON",
+    "Enchantment": "WIS",
+    "Divination": "WIS",
+    "Illusion": "INT",
+    "Abjuration": "CHA",
+}
 
 
 class Spell:
@@ -13,33 +44,262 @@ class Spell:
         self.school: str = school
         self.spell_power: int = spell_power
 
-    def cast(self, caster: Optional[Entity], target: Optional[Entity]) -> None:
-        """Cast spell (placeholder)."""
-        pass
+    @property
+    def save_ability(self) -> str:
+        """Ability targets save with."""
+        return SAVE_ABILITIES.get(self.school, "DEX")
+
+    def save_dc(self, caster: Optional[Entity]) -> int:
+        """Difficulty of the saving throw against this spell."""
+        bonus = caster.get_modifier("INT") if caster is not None else 0
+        return 8 + self.level + bonus
+
+    def cast(
+        self,
+        caster: Optional[Entity],
+        target: Optional[Entity],
+        sink: Optional[EventSink] = None,
+        rng: Optional[RandomSource] = None,
+    ) -> int:
+        """Cast spell at one target.
+
+        Args:
+            caster: Entity casting the spell (no INT bonus if omitted)
+            target: Entity hit by the spell (nothing happens if omitted)
+            sink: Where to report the dice rolls
+            rng: Random source to roll with
+
+        Returns:
+            Damage dealt
+        """
+        if target is None:
+            return 0
+        save = roll(20, 1, sink, rng) + target.get_modifier(self.save_ability)
+        saved = save >= self.save_dc(caster)
+        damage = roll(6, max(self.spell_power, 0), sink, rng)
+        if saved:
+            damage //= 2
+        target.take_damage(damage)
+        return damage
+
+    def resolve_area(
+        self,
+        caster: Optional[Entity],
+        hp: "npt.NDArray[np.int64]",
+        save_modifiers: "npt.NDArray[np.int64]",
+        rng: Optional["np.random.Generator"] = None,
+    ) -> "npt.NDArray[np.int64]":
+        """Resolve a cast against targets stored as arrays.
+
+        Args:
+            caster: Entity casting the spell
+            hp: Current HP of each target, reduced in place (not below 0)
+            save_modifiers: Each target's modifier for :attr:`save_ability`
+            rng: Generator to draw from
+
+        Returns:
+            Damage dealt to each target
+        """
+        import numpy as np
+
+        from dndgame.batch_dice import roll_totals
+
+        count = len(hp)
+        saves = roll_totals(20, 1, count, rng, np.int64) + save_modifiers
+        damage = roll_totals(6, max(self.spell_power, 0), count, rng, np.int64)
+        damage[saves >= self.save_dc(caster)] //= 2
+        np.maximum(hp - damage, 0, out=hp)
+        return damage
+
+    def cast_area(
+        self,
+        caster: Optional[Entity],
+        targets: Sequence[Entity],
+        rng: Optional["np.random.Generator"] = None,
+    ) -> "npt.NDArray[np.int64]":
+        """Cast spell at many targets in one vectorized pass.
+
+        Follows the same rules as :meth:`cast` for every target.
+
+        Args:
+            caster: Entity casting the spell
+            targets: Entities in the area
+            rng: Generator to draw from
+
+        Returns:
+            Damage dealt to each target, in ``targets`` order
+        """
+        import numpy as np
+
+        count = len(targets)
+        ability = self.save_ability
+        hp = np.fromiter((target.hp for target in targets), np.int64, count)
+        save_modifiers = np.fromiter(
+            (target.get_modifier(ability) for target in targets), np.int64, count
+        )
+        damage = self.resolve_area(caster, hp, save_modifiers, rng)
+        for target, remaining in zip(targets, hp.tolist()):
+            target.hp = remaining
+        return damage
 
 
 class SpellBook:
-    """Container for managing spells."""
+    """Container for managing spells.
+
+    Spells are indexed as they are added and removed: a hash index by
+    school and by name, and level and power indexes kept sorted so that
+    threshold queries are answered with a binary search and a slice instead
+    of a scan. Results keep the order spells were added in, and the same
+    spell may be added more than once. Indexes read a spell's attributes
+    when it is added, so remove and re-add a spell after changing its
+    level, school or power.
+    """
 
     def __init__(self) -> None:
-        self.spells: list[Spell] = []
+        self._added: int = 0
+        # Every entry by the order it was added in, and each spell's entries.
+        self._entries: dict[int, Spell] = {}
+        self._orders: dict[Spell, list[int]] = {}
+        self._by_school: dict[str, dict[int, Spell]] = {}
+        self._by_name: dict[str, dict[int, Spell]] = {}
+        # Sorted (level, order) and (power, order) keys.
+        self._level_keys: list[tuple[int, int]] = []
+        self._power_keys: list[tuple[int, int]] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, spell: object) -> bool:
+        return spell in self._orders
+
+    @property
+    def spells(self) -> list[Spell]:
+        """Every spell in the book, in the order they were added."""
+        return list(self._entries.values())
 
     def add_spell(self, spell: Spell) -> None:
         """Add spell to book."""
-        self.spells.append(spell)
+        order = self._added
+        self._added += 1
+        self._entries[order] = spell
+        self._orders.setdefault(spell, []).append(order)
+        self._by_school.setdefault(spell.school, {})[order] = spell
+        self._by_name.setdefault(spell.name, {})[order] = spell
+        key = (spell.level, order)
+        self._level_keys.insert(bisect_left(self._level_keys, key), key)
+        key = (spell.spell_power, order)
+        self._power_keys.insert(bisect_left(self._power_keys, key), key)
+
+    def remove_spell(self, spell: Spell) -> None:
+        """Remove spell from book (its first copy, if added more than once).
+
+        Raises:
+            ValueError: If the spell isn't in the book
+        """
+        orders = self._orders.get(spell)
+        if orders is None:
+            raise ValueError(f"{spell.name} is not in the spell book")
+        order = orders.pop(0)
+        if not orders:
+            del self._orders[spell]
+        del self._entries[order]
+        _discard(self._by_school, spell.school, order)
+        _discard(self._by_name, spell.name, order)
+        del self._level_keys[bisect_left(self._level_keys, (spell.level, order))]
+        del self._power_keys[bisect_left(self._power_keys, (spell.spell_power, order))]
+
+    def _in_order(self, keys: list[tuple[int, int]]) -> list[Spell]:
+        """Spells for a slice of index keys, in the order they were added."""
+        entries = self._entries
+        if len(keys) == len(entries):
+            return list(entries.values())
+        # Keys within one level (or power) are already in order, so this
+        # sort only merges a few runs.
+        return [entries[order] for _, order in sorted(keys, key=itemgetter(1))]
+
+    def get_spell(self, name: str) -> Optional[Spell]:
+        """Get the first spell added with this name, if any."""
+        spells = self._by_name.get(name)
+        return next(iter(spells.values())) if spells else None
 
     def get_available_spells(self, spell_level: int) -> list[Spell]:
-        """Get spells up to level (list comprehension)."""
-        return [s for s in self.spells if s.level <= spell_level]
+        """Get spells up to level."""
+        end = bisect_left(self._level_keys, (spell_level + 1,))
+        return self._in_order(self._level_keys[:end])
 
     def get_spells_by_school(self, school: str) -> list[Spell]:
-        """Get spells from school (list comprehension)."""
-        return [s for s in self.spells if s.school == school]
+        """Get spells from school."""
+        return list(self._by_school.get(school, {}).values())
 
     def get_spell_names(self) -> list[str]:
-        """Get all spell names (map)."""
-        return list(map(lambda s: s.name, self.spells))
+        """Get all spell names."""
+        return [spell.name for spell in self._entries.values()]
 
     def get_powerful_spells(self, min_power: int) -> list[Spell]:
-        """Get spells above power threshold (filter)."""
-        return list(filter(lambda s: s.spell_power >= min_power, self.spells))
+        """Get spells above power threshold."""
+        start = bisect_left(self._power_keys, (min_power,))
+        return self._in_order(self._power_keys[start:])
+
+    def query(
+        self,
+        school: Optional[str] = None,
+        max_level: Optional[int] = None,
+        min_power: Optional[int] = None,
+    ) -> list[Spell]:
+        """Get spells matching every given condition.
+
+        The most selective index is used to pick candidates and only those
+        are checked against the remaining conditions.
+
+        Args:
+            school: Required school
+            max_level: Highest spell level allowed
+            min_power: Lowest spell power allowed
+
+        Returns:
+            Matching spells, in the order they were added
+        """
+        school_spells = self._by_school.get(school, {}) if school is not None else None
+        level_end = (
+            bisect_left(self._level_keys, (max_level + 1,))
+            if max_level is not None
+            else None
+        )
+        power_start = (
+            bisect_left(self._power_keys, (min_power,))
+            if min_power is not None
+            else None
+        )
+
+        # Pick the smallest candidate set before copying anything.
+        source, size = "all", len(self._entries)
+        if school_spells is not None and len(school_spells) < size:
+            source, size = "school", len(school_spells)
+        if level_end is not None and level_end < size:
+            source, size = "level", level_end
+        if power_start is not None and len(self._power_keys) - power_start < size:
+            source = "power"
+
+        candidates: Iterable[Spell] = self._entries.values()
+        if source == "school":
+            candidates = school_spells.values() if school_spells else ()
+        elif source == "level":
+            candidates = self._in_order(self._level_keys[:level_end])
+        elif source == "power":
+            candidates = self._in_order(self._power_keys[power_start:])
+
+        return [
+            spell
+            for spell in candidates
+            if (school is None or spell.school == school)
+            and (max_level is None or spell.level <= max_level)
+            and (min_power is None or spell.spell_power >= min_power)
+        ]
+
+
+def _discard(index: dict[str, dict[int, Spell]], key: str, order: int) -> None:
+    """Remove an entry from a hash index bucket, dropping empty buckets."""
+    bucket = index[key]
+    del bucket[order]
+    if not bucket:
+        del index[key]
@@ -0,0 +1,418 @@
+"""Streaming, bounded-memory statistics for combat output.
+
+Simulations can produce billions of outcomes, so nothing here keeps the
+values themselves:
+
+* :class:`RunningStats`: count, mean, variance (Welford), min and max
+* :class:`Histogram`: exact counts per integer value, for small ranges
+  such as HP or damage, with exact quantiles
+* :class:`QuantileSketch`: approximate quantiles of unbounded values with
+  a fixed relative error, in memory logarithmic in the value range
+
+Every class has ``merge``, so shards aggregated in separate processes
+combine into the same result as one big run. :class:`CombatStats` gathers
+rounds per fight and damage per hit, and :class:`StatsSink` feeds it from
+the events of :class:`~dndgame.combat.Combat` fights.
+
+Example:
+    >>> stats = CombatStats()
+    >>> sink = StatsSink(stats)
+    >>> for _ in range(10_000):
+    ...     Combat(hero(), Enemy("Goblin"), sink=sink).run_combat()
+    >>> stats.rounds_sketch.quantile(0.99)  # doctest: +SKIP
+    9.02
+"""
+
+import math
+from typing import TYPE_CHECKING, Iterable, Optional
+
+from dndgame.events import CombatEndEvent, Event, EventSink, HitEvent, RoundStartEvent
+
+
+if TYPE_CHECKING:
+    from dndgame.simulation import SimulationResult
+
+
+class RunningStats:
+    """Count, mean and variance of a stream, updated one value at a time.
+
+    Attributes:
+        count: Values seen
+        mean: Mean of the values
+        minimum: Smallest value (``inf`` if empty)
+        maximum: Largest value (``-inf`` if empty)
+    """
+
+    __slots__ = ("count", "mean", "_m2", "minimum", "maximum")
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.mean: float = 0.0
+        self._m2: float = 0.0
+        self.minimum: float = math.inf
+        self.maximum: float = -math.inf
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Add a value, ``count`` times."""
+        if count <= 0:
+            return
+        total = self.count + count
+        delta = value - self.mean
+        self.mean += delta * count / total
+        self._m2 += delta * delta * self.count * count / total
+        self.count = total
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+
+    def update(self, values: Iterable[float]) -> None:
+        """Add every value of an iterable."""
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        """Fold another stream's statistics into this one (Chan et al.).
+
+        Returns:
+            This object, for chaining
+        """
+        if other.count:
+            total = self.count + other.count
+            delta = other.mean - self.mean
+            self.mean += delta * other.count / total
+            self._m2 += other._m2 + delta * delta * self.count * other.count / total
+            self.count = total
+            self.minimum = min(self.minimum, other.minimum)
+            self.maximum = max(self.maximum, other.maximum)
+        return self
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (0 for fewer than two values)."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def population_variance(self) -> float:
+        """Population variance (0 if empty)."""
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def stdev(self) -> float:
+        """Sample standard deviation."""
+        return math.sqrt(self.variance)
+
+
+class Histogram:
+    """Exact counts of integer values.
+
+    Memory grows with the number of distinct values, not the number of
+    values, so use it for small ranges.
+
+    Attributes:
+        counts: Occurrences by value
+        total: Values seen
+    """
+
+    __slots__ = ("counts", "total")
+
+    def __init__(self) -> None:
+        self.counts: dict[int, int] = {}
+        self.total: int = 0
+
+    def add(self, value: int, count: int = 1) -> None:
+        """Count a value, ``count`` times."""
+        self.counts[value] = self.counts.get(value, 0) + count
+        self.total += count
+
+    def update(self, values: Iterable[int]) -> None:
+        """Count every value of an iterable."""
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: "Histogram") -> "Histogram":
+        """Add another histogram's counts.
+
+        Returns:
+            This object, for chaining
+        """
+        counts = self.counts
+        for value, count in other.counts.items():
+            counts[value] = counts.get(value, 0) + count
+        self.total += other.total
+        return self
+
+    @property
+    def mean(self) -> float:
+        """Mean value (0 if empty)."""
+        if not self.total:
+            return 0.0
+        return sum(value * count for value, count in self.counts.items()) / self.total
+
+    def quantile(self, q: float) -> int:
+        """Exact nearest-rank quantile (q between 0 and 1).
+
+        Raises:
+            ValueError: If the histogram is empty
+        """
+        if not self.total:
+            raise ValueError("Quantile of an empty histogram")
+        rank = max(1, math.ceil(q * self.total))
+        seen = 0
+        for value in sorted(self.counts):
+            seen += self.counts[value]
+            if seen >= rank:
+                return value
+        return max(self.counts)
+
+
+class QuantileSketch:
+    """Mergeable quantile sketch with relative-error guarantees (DDSketch).
+
+    Values fall into logarithmic buckets, so any quantile is returned
+    within ``relative_accuracy`` of the true value, and a sketch of values
+    between 1 and 10^9 needs about a thousand buckets at 1% accuracy. If
+    more than ``max_buckets`` are needed, the lowest buckets are collapsed,
+    giving up accuracy only for the smallest values.
+
+    Attributes:
+        relative_accuracy: Relative error bound of quantiles
+        max_buckets: Most buckets per sign
+        count: Values seen
+    """
+
+    __slots__ = (
+        "relative_accuracy",
+        "max_buckets",
+        "count",
+        "zeros",
+        "_gamma",
+        "_log_gamma",
+        "_positive",
+        "_negative",
+    )
+
+    def __init__(
+        self, relative_accuracy: float = 0.01, max_buckets: int = 2048
+    ) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(
+                f"relative_accuracy must be between 0 and 1, got {relative_accuracy}"
+            )
+        self.relative_accuracy: float = relative_accuracy
+        self.max_buckets: int = max_buckets
+        self.count: int = 0
+        self.zeros: int = 0
+        self._gamma: float = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma: float = math.log(self._gamma)
+        self._positive: dict[int, int] = {}
+        self._negative: dict[int, int] = {}
+
+    def _key(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _value(self, key: int) -> float:
+        # Midpoint of the bucket in relative terms.
+        return 2 * self._gamma**key / (self._gamma + 1)
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Add a value, ``count`` times."""
+        if value > 0:
+            store = self._positive
+            key = self._key(value)
+        elif value < 0:
+            store = self._negative
+            key = self._key(-value)
+        else:
+            self.zeros += count
+            self.count += count
+            return
+        store[key] = store.get(key, 0) + count
+        self.count += count
+        if len(store) > self.max_buckets:
+            self._collapse(store)
+
+    def update(self, values: Iterable[float]) -> None:
+        """Add every value of an iterable."""
+        for value in values:
+            self.add(value)
+
+    def _collapse(self, store: dict[int, int]) -> None:
+        """Merge the lowest buckets until the store fits."""
+        keys = sorted(store)
+        excess = keys[: len(keys) - self.max_buckets]
+        target = keys[len(excess)]
+        for key in excess:
+            store[target] += store.pop(key)
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Add another sketch with the same accuracy.
+
+        Returns:
+            This object, for chaining
+
+        Raises:
+            ValueError: If the accuracies differ
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Can only merge sketches with the same accuracy")
+        for mine, theirs in (
+            (self._positive, other._positive),
+            (self._negative, other._negative),
+        ):
+            for key, count in theirs.items():
+                mine[key] = mine.get(key, 0) + count
+            if len(mine) > self.max_buckets:
+                self._collapse(mine)
+        self.zeros += other.zeros
+        self.count += other.count
+        return self
+
+    def quantile(self, q: float) -> float:
+        """Approximate quantile (q between 0 and 1).
+
+        Raises:
+            ValueError: If the sketch is empty
+        """
+        if not self.count:
+            raise ValueError("Quantile of an empty sketch")
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for key in sorted(self._negative, reverse=True):
+            seen += self._negative[key]
+            if seen >= rank:
+                return -self._value(key)
+        seen += self.zeros
+        if seen >= rank:
+            return 0.0
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen >= rank:
+                return self._value(key)
+        return self._value(max(self._positive))
+
+    @property
+    def buckets(self) -> int:
+        """Buckets in use, a measure of memory."""
+        return len(self._positive) + len(self._negative)
+
+
+class CombatStats:
+    """Aggregate outcomes of many fights in constant memory.
+
+    Attributes:
+        fights: Fights recorded
+        player_wins: Fights won by the player side
+        rounds: Running statistics of rounds per fight
+        rounds_sketch: Quantiles of rounds per fight
+        damage: Running statistics of damage per hit
+        damage_histogram: Exact damage-per-hit counts
+    """
+
+    __slots__ = (
+        "fights",
+        "player_wins",
+        "rounds",
+        "rounds_sketch",
+        "damage",
+        "damage_histogram",
+    )
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        self.fights: int = 0
+        self.player_wins: int = 0
+        self.rounds: RunningStats = RunningStats()
+        self.rounds_sketch: QuantileSketch = QuantileSketch(relative_accuracy)
+        self.damage: RunningStats = RunningStats()
+        self.damage_histogram: Histogram = Histogram()
+
+    @property
+    def player_win_rate(self) -> float:
+        """Fraction of fights won by the player side."""
+        return self.player_wins / self.fights if self.fights else 0.0
+
+    def record_fight(self, rounds: int, player_won: bool, count: int = 1) -> None:
+        """Record the outcome of ``count`` identical fights."""
+        self.fights += count
+        if player_won:
+            self.player_wins += count
+        self.rounds.add(rounds, count)
+        self.rounds_sketch.add(rounds, count)
+
+    def record_hit(self, damage: int, count: int = 1) -> None:
+        """Record the damage of ``count`` identical hits."""
+        self.damage.add(damage, count)
+        self.damage_histogram.add(damage, count)
+
+    def add_simulation(self, result: "SimulationResult") -> None:
+        """Fold in the fights of a vectorized simulation.
+
+        Only per-fight outcomes are available there, so hits are not
+        recorded.
+        """
+        for rounds, count in enumerate(result.rounds_histogram.tolist()):
+            if count:
+                self.record_fight(rounds, False, count)
+        self.player_wins += result.player_wins
+
+    def merge(self, other: "CombatStats") -> "CombatStats":
+        """Fold in the statistics of another shard.
+
+        Returns:
+            This object, for chaining
+        """
+        self.fights += other.fights
+        self.player_wins += other.player_wins
+        self.rounds.merge(other.rounds)
+        self.rounds_sketch.merge(other.rounds_sketch)
+        self.damage.merge(other.damage)
+        self.damage_histogram.merge(other.damage_histogram)
+        return self
+
+    def summary(self) -> dict[str, float]:
+        """Headline numbers: win rate, round and damage percentiles."""
+        result = {"fights": float(self.fights), "player_win_rate": self.player_win_rate}
+        if self.fights:
+            result.update(
+                rounds_mean=self.rounds.mean,
+                rounds_stdev=self.rounds.stdev,
+                rounds_p50=self.rounds_sketch.quantile(0.5),
+                rounds_p99=self.rounds_sketch.quantile(0.99),
+            )
+        if self.damage.count:
+            result.update(
+                damage_mean=self.damage.mean,
+                damage_p50=float(self.damage_histogram.quantile(0.5)),
+                damage_p99=float(self.damage_histogram.quantile(0.99)),
+            )
+        return result
+
+
+class StatsSink(EventSink):
+    """Feeds combat events into a :class:`CombatStats`.
+
+    Pass it as a fight's ``sink``. Each ``combat_end`` event records the
+    fight with the last round number seen, and each ``hit`` its damage.
+
+    Attributes:
+        stats: Where outcomes are recorded
+        forward: Optional sink that also receives every event
+    """
+
+    def __init__(
+        self, stats: Optional[CombatStats] = None, forward: Optional[EventSink] = None
+    ) -> None:
+        self.stats: CombatStats = stats if stats is not None else CombatStats()
+        self.forward: Optional[EventSink] = forward
+        self._round: int = 0
+
+    def emit(self, event: Event) -> None:
+        if isinstance(event, HitEvent):
+            self.stats.record_hit(event.damage)
+        elif isinstance(event, RoundStartEvent):
+            self._round = event.round
+        elif isinstance(event, CombatEndEvent):
+            self.stats.record_fight(self._round, event.player_won)
+            self._round = 0
+        if self.forward is not None:
+            self.forward.emit(event)
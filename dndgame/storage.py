@@ -0,0 +1,312 @@
+"""Compact binary storage for characters and enemies.
+
+Entities are saved as fixed-width 36-byte records after a 16-byte header,
+so record ``i`` lives at a known offset and whole files can be memory
+mapped as a NumPy structured array. Names are kept once each in a sidecar
+table (``<path>.names``) and referenced by id; the same sidecar holds the
+file's race and enemy type tables.
+
+Record layout (little endian)::
+
+    kind        uint8    0 = Character, 1 = Enemy
+    type_code   uint8    index into the file's race or enemy type table
+    level       uint16
+    armor_class int16
+    reserved    int16
+    hp          int32
+    max_hp      int32
+    base_hp     int32    characters only, 0 for enemies
+    stats       6*int16  STR, DEX, CON, INT, WIS, CHA
+    name_id     uint32   index into the name table
+
+Sidecar entries are a tag (0 = name, 1 = race, 2 = enemy type), a uint16
+length and the UTF-8 text. A race or enemy type gets the next code of its
+table the first time it is saved, so records keep decoding to the same
+names however ``RACES`` and ``ENEMY_TEMPLATES`` change later; reading a
+record whose race or type is no longer defined raises :class:`StorageError`.
+
+Example:
+    >>> with EntityStore("world.dnd") as store:
+    ...     store.append(hero)
+    ...     records = store.records()
+    ...     hurt = records[(records["kind"] == KIND_CHARACTER)
+    ...                    & (2 * records["hp"] < records["max_hp"])]
+"""
+
+import struct
+from pathlib import Path
+from types import TracebackType
+from typing import IO, TYPE_CHECKING, Any, Optional, Union
+
+from dndgame.character import RACES, Character
+from dndgame.enemy import ENEMY_TEMPLATES, Enemy
+from dndgame.entity import Entity
+
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+MAGIC: bytes = b"DNDS"
+VERSION: int = 2
+HEADER = struct.Struct("<4sHH8x")
+RECORD = struct.Struct("<BBHhhiii6hI")
+TABLE_ENTRY = struct.Struct("<BH")
+
+KIND_CHARACTER: int = 0
+KIND_ENEMY: int = 1
+
+# Sidecar tables: entity names, and the type table of each record kind.
+TAG_NAME: int = 0
+TAG_RACE: int = 1
+TAG_ENEMY_TYPE: int = 2
+TAGS: tuple[int, ...] = (TAG_NAME, TAG_RACE, TAG_ENEMY_TYPE)
+KIND_TAGS: dict[int, int] = {KIND_CHARACTER: TAG_RACE, KIND_ENEMY: TAG_ENEMY_TYPE}
+
+
+def record_dtype() -> "np.dtype[Any]":
+    """NumPy structured dtype matching the on-disk record layout."""
+    import numpy as np
+
+    dtype = np.dtype(
+        [
+            ("kind", "u1"),
+            ("type_code", "u1"),
+            ("level", "<u2"),
+            ("armor_class", "<i2"),
+            ("reserved", "<i2"),
+            ("hp", "<i4"),
+            ("max_hp", "<i4"),
+            ("base_hp", "<i4"),
+            ("stats", "<i2", (6,)),
+            ("name_id", "<u4"),
+        ]
+    )
+    assert dtype.itemsize == RECORD.size
+    return dtype
+
+
+class StorageError(ValueError):
+    """A store file is malformed or a record can't be encoded."""
+
+
+class EntityStore:
+    """Append-only file of fixed-width entity records.
+
+    Attributes:
+        path: Record file; the name table lives next to it
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path: Path = Path(path)
+        self._names_path: Path = self.path.with_name(self.path.name + ".names")
+        # Sidecar tables by tag: entries in id order, and the id of each.
+        self._tables: dict[int, list[str]] = {tag: [] for tag in TAGS}
+        self._ids: dict[int, dict[str, int]] = {tag: {} for tag in TAGS}
+
+        if not self.path.exists():
+            self.path.write_bytes(HEADER.pack(MAGIC, VERSION, RECORD.size))
+        self._file: IO[bytes] = open(self.path, "r+b")
+        magic, version, record_size = HEADER.unpack(self._file.read(HEADER.size))
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+            self._file.close()
+            raise StorageError(f"{self.path} is not a version {VERSION} entity store")
+
+        self._names_path.touch()
+        try:
+            self._load_tables()
+        except StorageError:
+            self._file.close()
+            raise
+        self._names_file: IO[bytes] = open(self._names_path, "ab")
+
+    def _load_tables(self) -> None:
+        """Read the whole sidecar into memory."""
+        data = self._names_path.read_bytes()
+        offset = 0
+        while offset < len(data):
+            try:
+                tag, length = TABLE_ENTRY.unpack_from(data, offset)
+            except struct.error:
+                raise StorageError(f"{self._names_path} is truncated") from None
+            offset += TABLE_ENTRY.size
+            if tag not in self._tables:
+                raise StorageError(f"{self._names_path}: unknown table tag {tag}")
+            text = data[offset : offset + length].decode("utf-8")
+            offset += length
+            self._ids[tag][text] = len(self._tables[tag])
+            self._tables[tag].append(text)
+
+    def _intern(self, tag: int, text: str) -> int:
+        """Get the id of a sidecar entry, appending it if new."""
+        entry_id = self._ids[tag].get(text)
+        if entry_id is None:
+            encoded = text.encode("utf-8")
+            self._names_file.write(TABLE_ENTRY.pack(tag, len(encoded)) + encoded)
+            entry_id = len(self._tables[tag])
+            self._tables[tag].append(text)
+            self._ids[tag][text] = entry_id
+        return entry_id
+
+    def name(self, name_id: int) -> str:
+        """Look up a name by id."""
+        return self._tables[TAG_NAME][name_id]
+
+    def type_name(self, kind: int, type_code: int) -> str:
+        """Look up the race (characters) or enemy type a type code stands for.
+
+        Raises:
+            StorageError: If the file has no such kind or type code
+        """
+        tag = KIND_TAGS.get(kind)
+        if tag is None or not 0 <= type_code < len(self._tables[tag]):
+            raise StorageError(f"No type code {type_code} for record kind {kind}")
+        return self._tables[tag][type_code]
+
+    def __len__(self) -> int:
+        self._file.seek(0, 2)
+        return (self._file.tell() - HEADER.size) // RECORD.size
+
+    def encode(self, entity: Entity) -> bytes:
+        """Pack an entity into a record.
+
+        Raises:
+            StorageError: If the entity's race or type isn't defined, a
+                field doesn't fit its column, or the entity isn't a
+                Character or an Enemy
+        """
+        if isinstance(entity, Character):
+            kind, kind_name, known = KIND_CHARACTER, entity.race, RACES
+            base_hp = entity.base_hp
+        elif isinstance(entity, Enemy):
+            kind, kind_name, known = KIND_ENEMY, entity.enemy_type, ENEMY_TEMPLATES
+            base_hp = 0
+        else:
+            raise StorageError(f"Cannot store {type(entity).__name__}")
+        if kind_name not in known:
+            raise StorageError(f"{entity.name}: {kind_name!r} is not defined")
+        # Only add the name and type to the tables once the record is known
+        # to fit.
+        tag = KIND_TAGS[kind]
+        type_code = self._ids[tag].get(kind_name, len(self._tables[tag]))
+        name_id = self._ids[TAG_NAME].get(entity.name, len(self._tables[TAG_NAME]))
+        try:
+            record = RECORD.pack(
+                kind,
+                type_code,
+                entity.level,
+                entity.armor_class,
+                0,
+                entity.hp,
+                entity.max_hp,
+                base_hp,
+                *entity.scores(),
+                name_id,
+            )
+        except struct.error as error:
+            raise StorageError(f"{entity.name}: {error}") from None
+        self._intern(tag, kind_name)
+        self._intern(TAG_NAME, entity.name)
+        return record
+
+    def decode(self, data: bytes) -> Entity:
+        """Rebuild an entity from a record.
+
+        Raises:
+            StorageError: If the record's race or enemy type is no longer
+                defined, or the record is malformed
+        """
+        (
+            kind,
+            type_code,
+            level,
+            armor_class,
+            _,
+            hp,
+            max_hp,
+            base_hp,
+            *scores,
+            name_id,
+        ) = RECORD.unpack(data)
+        kind_name = self.type_name(kind, type_code)
+        if kind_name not in (RACES if kind == KIND_CHARACTER else ENEMY_TEMPLATES):
+            raise StorageError(f"{kind_name!r} is no longer defined")
+        entity: Entity
+        if kind == KIND_CHARACTER:
+            entity = Character(self.name(name_id), kind_name, base_hp)
+        else:
+            entity = Enemy(kind_name, self.name(name_id))
+        for index, score in enumerate(scores):
+            entity.set_score(index, score)
+        entity.level = level
+        entity.armor_class = armor_class
+        entity.hp = hp
+        entity.max_hp = max_hp
+        return entity
+
+    def append(self, entity: Entity) -> int:
+        """Save an entity as a new record.
+
+        Returns:
+            Index of the new record
+        """
+        data = self.encode(entity)
+        self._file.seek(0, 2)
+        index = (self._file.tell() - HEADER.size) // RECORD.size
+        self._file.write(data)
+        return index
+
+    def write(self, index: int, entity: Entity) -> None:
+        """Overwrite record ``index`` in place, e.g. after a fight."""
+        if not 0 <= index < len(self):
+            raise IndexError(f"record {index} out of range")
+        data = self.encode(entity)
+        self._file.seek(HEADER.size + index * RECORD.size)
+        self._file.write(data)
+
+    def read(self, index: int) -> Entity:
+        """Load record ``index`` as a Character or Enemy."""
+        if not 0 <= index < len(self):
+            raise IndexError(f"record {index} out of range")
+        self._file.seek(HEADER.size + index * RECORD.size)
+        return self.decode(self._file.read(RECORD.size))
+
+    def records(self) -> "np.memmap[Any, np.dtype[Any]]":
+        """Memory-map every record as a read-only structured array.
+
+        Scans over the array run without creating any entity objects; use
+        :meth:`read` to materialize the rows you need.
+        """
+        import numpy as np
+
+        self.flush()
+        count = len(self)
+        return np.memmap(
+            self.path,
+            dtype=record_dtype(),
+            mode="r",
+            offset=HEADER.size,
+            shape=(count,),
+        )
+
+    def flush(self) -> None:
+        """Push buffered writes to disk."""
+        self._file.flush()
+        self._names_file.flush()
+
+    def close(self) -> None:
+        """Flush and close both files."""
+        self.flush()
+        self._file.close()
+        self._names_file.close()
+
+    def __enter__(self) -> "EntityStore":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
@@ -0,0 +1,180 @@
+"""Dice tape recording and deterministic replay.
+
+A :class:`RecordingRng` wraps any random source and writes every roll to a
+:class:`DiceTape` as two numbers: the size of the range and the offset that
+came up, one byte each unless a range is wider than 256 values. A
+:class:`ReplayRng` feeds those rolls back in order, so a fight built with
+the same combatants replays exactly. Both plug into the ``rng`` parameter
+that dice, Character and Combat already accept.
+
+Example:
+    >>> tape = DiceTape()
+    >>> Combat(hero(), Enemy("Orc"), rng=RecordingRng(tape)).run_combat()
+    >>> data = tape.to_bytes()  # store alongside the bug report
+    >>> replay = ReplayRng(DiceTape.from_bytes(data))
+    >>> Combat(hero(), Enemy("Orc"), rng=replay).run_combat()
+"""
+
+import random
+import sys
+from array import array
+from pathlib import Path
+from typing import Optional, Union
+
+from dndgame.rng import RandomSource
+
+
+MAGIC: bytes = b"DTP1"
+
+MAX_SPAN: int = 0xFFFFFFFF
+
+# Storage widths a tape can use, narrowest first: the largest span each
+# holds and the magic its serialized form starts with.
+_WIDTHS: dict[str, tuple[int, bytes]] = {
+    "B": (0xFF, MAGIC),
+    "H": (0xFFFF, b"DTP2"),
+    "I": (0xFFFFFFFF, b"DTP4"),
+}
+
+
+class TapeError(ValueError):
+    """A tape cannot record a roll or doesn't match the replayed fight."""
+
+
+class DiceTape:
+    """Packed sequence of recorded rolls, two numbers per roll.
+
+    Each roll of ``randint(a, b)`` is stored as ``(b - a, value - a)``, with
+    every number at the tape's current width: 1 byte while no range has
+    more than 256 values. The first wider range (a d1000, or picking among
+    hundreds of combatants) re-packs the whole tape at 2 or 4 bytes per
+    number, the narrowest that holds it, so a roll takes 2, 4 or 8 bytes.
+    """
+
+    __slots__ = ("_data", "_limit")
+
+    def __init__(self, data: Optional["array[int]"] = None) -> None:
+        self._data: "array[int]" = data if data is not None else array("B")
+        self._limit: int = _WIDTHS[self._data.typecode][0]
+
+    def append(self, low: int, high: int, value: int) -> None:
+        """Record that ``randint(low, high)`` returned ``value``."""
+        span = high - low
+        if not 0 <= span <= self._limit:
+            self._widen(span)
+        self._data.append(span)
+        self._data.append(value - low)
+
+    def _widen(self, span: int) -> None:
+        """Re-pack the tape in the narrowest width that holds ``span``."""
+        if not 0 <= span <= MAX_SPAN:
+            raise TapeError(f"Cannot record a range of {span + 1} values")
+        for typecode, (limit, _) in _WIDTHS.items():
+            if span <= limit:
+                self._data = array(typecode, self._data)
+                self._limit = limit
+                return
+
+    def __len__(self) -> int:
+        return len(self._data) // 2
+
+    def __getitem__(self, index: int) -> tuple[int, int]:
+        """Get the ``(span, offset)`` pair of roll ``index``."""
+        if index < 0:
+            index += len(self)
+        return self._data[2 * index], self._data[2 * index + 1]
+
+    def to_bytes(self) -> bytes:
+        """Serialize the tape (little-endian for wide tapes)."""
+        data = self._data
+        if sys.byteorder == "big" and data.itemsize > 1:
+            data = array(data.typecode, data)
+            data.byteswap()
+        return _WIDTHS[data.typecode][1] + data.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "DiceTape":
+        """Load a tape serialized with :meth:`to_bytes`."""
+        for typecode, (_, magic) in _WIDTHS.items():
+            if data.startswith(magic):
+                rolls = array(typecode)
+                body = data[len(magic) :]
+                if len(body) % (2 * rolls.itemsize):
+                    break
+                rolls.frombytes(body)
+                if sys.byteorder == "big" and rolls.itemsize > 1:
+                    rolls.byteswap()
+                return cls(rolls)
+        raise TapeError("Not a dice tape")
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the tape to a file."""
+        Path(path).write_bytes(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "DiceTape":
+        """Read a tape from a file."""
+        return cls.from_bytes(Path(path).read_bytes())
+
+
+class RecordingRng:
+    """Random source that records every roll it hands out.
+
+    Attributes:
+        tape: Where rolls are written
+        source: Random source actually rolled (global ``random`` if omitted)
+    """
+
+    __slots__ = ("tape", "source")
+
+    def __init__(
+        self, tape: Optional[DiceTape] = None, source: Optional[RandomSource] = None
+    ) -> None:
+        self.tape: DiceTape = tape if tape is not None else DiceTape()
+        self.source: Optional[RandomSource] = source
+
+    def randint(self, a: int, b: int) -> int:
+        """Roll from the wrapped source and record the result."""
+        source = self.source
+        value = source.randint(a, b) if source is not None else random.randint(a, b)
+        self.tape.append(a, b, value)
+        return value
+
+
+class ReplayRng:
+    """Random source that plays back a tape instead of rolling.
+
+    Raises :class:`TapeError` if the tape runs out or a roll asks for a
+    different range than the one recorded, which means the replayed fight
+    diverged from the original.
+
+    Attributes:
+        tape: Rolls being replayed
+        position: Index of the next roll
+    """
+
+    __slots__ = ("tape", "position", "_data")
+
+    def __init__(self, tape: DiceTape) -> None:
+        self.tape: DiceTape = tape
+        self.position: int = 0
+        self._data: "array[int]" = tape._data
+
+    @property
+    def exhausted(self) -> bool:
+        """Check if every recorded roll has been replayed."""
+        return 2 * self.position >= len(self._data)
+
+    def randint(self, a: int, b: int) -> int:
+        """Return the next recorded roll."""
+        index = 2 * self.position
+        if index >= len(self._data):
+            raise TapeError(f"Tape exhausted after {self.position} rolls")
+        span = self._data[index]
+        if span != b - a:
+            raise TapeError(
+                f"Roll {self.position} asked for {a}..{b} but the tape recorded "
+                f"a range of {span + 1} values"
+            )
+        self.position += 1
+        return a + self._data[index + 1]
@@ -0,0 +1,47 @@
+"""Shared test fixtures."""
+
+from typing import Callable, Optional
+
+import pytest
+from dndgame.character import Character
+
+# Scores of the standard test player; unlisted abilities are 10.
+PLAYER_STATS: dict[str, int] = {"STR": 14, "DEX": 12, "CON": 14}
+
+
+def _build_player(
+    name: str = "Hero",
+    race: str = "Human",
+    stats: Optional[dict[str, int]] = None,
+    hp: int = 15,
+    armor_class: int = 10,
+) -> Character:
+    """Create a character with fixed scores instead of rolled ones.
+
+    Args:
+        name: Character name
+        race: Character race (no racial bonuses are applied)
+        stats: Ability scores (the standard player's if omitted)
+        hp: Current and maximum HP
+        armor_class: Armor class
+
+    Returns:
+        The new character
+    """
+    char = Character(name, race, 10)
+    char.stats = PLAYER_STATS if stats is None else stats
+    char.hp = char.max_hp = hp
+    char.armor_class = armor_class
+    return char
+
+
+@pytest.fixture
+def make_player() -> Callable[..., Character]:
+    """Factory for test players, for tests that need several or a variant."""
+    return _build_player
+
+
+@pytest.fixture
+def player() -> Character:
+    """Create test player."""
+    return _build_player()
@@ -0,0 +1,122 @@
+"""Tests for lazily generated dungeons."""
+
+import pytest
+
+from dndgame.adventure import Dungeon
+from dndgame.enemy import ENEMY_TEMPLATES, Enemy
+
+
+def test_rooms_are_deterministic() -> None:
+    """Test the same seed builds the same rooms, in any order."""
+    first = Dungeon(seed=7)
+    second = Dungeon(seed=7)
+    rooms = [999_999, 0, 123_456, 500_500]
+    assert [first.room(room) for room in rooms] == [
+        second.room(room) for room in reversed(rooms)
+    ][::-1]
+    assert first.exit_rooms == second.exit_rooms
+    assert Dungeon(seed=8).exit_rooms != first.exit_rooms
+
+
+def test_doors_are_symmetric() -> None:
+    """Test every door can be walked through both ways."""
+    dungeon = Dungeon(30, 20, seed=3)
+    for room in range(len(dungeon)):
+        for neighbor in dungeon.neighbors(room):
+            assert room in dungeon.neighbors(neighbor)
+            assert dungeon._distance(room, neighbor) == 1
+
+
+def test_dungeon_is_connected() -> None:
+    """Test every room can be reached from the entrance."""
+    dungeon = Dungeon(40, 25, seed=5, loop_chance=0.0)
+    assert len(dungeon.reachable(dungeon.entrance, len(dungeon))) == len(dungeon)
+    # Without loops the maze is a tree: one door fewer than rooms.
+    doors = sum(len(dungeon.neighbors(room)) for room in range(len(dungeon)))
+    assert doors == 2 * (len(dungeon) - 1)
+
+
+def test_rooms_hold_known_enemies() -> None:
+    """Test encounters come from the enemy templates and spawn."""
+    dungeon = Dungeon(50, 50, seed=1, encounter_chance=0.5)
+    rooms = [dungeon.room(room) for room in range(len(dungeon))]
+    encounters = {room.encounter for room in rooms}
+    assert encounters - {None} == set(ENEMY_TEMPLATES)
+    guarded = next(room for room in rooms if room.encounter is not None)
+    enemy = guarded.spawn()
+    assert isinstance(enemy, Enemy)
+    assert enemy.enemy_type == guarded.encounter
+    assert Dungeon(10, 10, encounter_chance=0.0).room(5).spawn() is None
+
+
+def test_room_cache_is_bounded() -> None:
+    """Test only the most recently used rooms stay materialized."""
+    dungeon = Dungeon(seed=2, cache_size=3)
+    first = dungeon.room(10)
+    for room in (11, 12, 10, 13):
+        dungeon.room(room)
+    assert dungeon.materialized == 3
+    assert dungeon.room(10) is first
+    assert 11 not in dungeon._rooms
+    dungeon.clear_cache()
+    assert dungeon.materialized == 0
+
+
+def test_invalid_rooms_and_sizes() -> None:
+    """Test out-of-range rooms and bad settings are rejected."""
+    dungeon = Dungeon(10, 10)
+    with pytest.raises(IndexError):
+        dungeon.room(100)
+    with pytest.raises(IndexError):
+        dungeon.neighbors(-1)
+    with pytest.raises(ValueError):
+        Dungeon(0, 10)
+    with pytest.raises(ValueError):
+        Dungeon(2, 2, exits=5)
+
+
+def test_shortest_path_matches_bfs() -> None:
+    """Test A* paths are valid and as short as breadth-first search."""
+    dungeon = Dungeon(25, 20, seed=11)
+    steps = dungeon.reachable(0, len(dungeon))
+    for goal in (1, 57, 263, len(dungeon) - 1):
+        path = dungeon.shortest_path(0, goal)
+        assert path is not None
+        assert path[0] == 0 and path[-1] == goal
+        assert len(path) - 1 == steps[goal]
+        for room, following in zip(path, path[1:]):
+            assert following in dungeon.neighbors(room)
+    assert dungeon.shortest_path(42, 42) == [42]
+
+
+def test_exit_distances_are_exact_and_cached() -> None:
+    """Test nearest-exit answers match BFS and fill the cache."""
+    dungeon = Dungeon(20, 15, seed=4, exits=3)
+    reference = Dungeon(20, 15, seed=4, exits=3)
+    start = 150
+    path = dungeon.path_to_exit(start)
+    assert path[-1] in dungeon.exit_rooms
+    # Every room on the path now has a remembered distance.
+    assert all(room in dungeon._exit_distance for room in path)
+    for room in range(len(dungeon)):
+        steps = reference.reachable(room, len(reference))
+        nearest = min(steps[exit_room] for exit_room in reference.exit_rooms)
+        assert dungeon.distance_to_exit(room) == nearest
+        assert len(dungeon.path_to_exit(room)) - 1 == nearest
+
+
+def test_exit_index_matches_search() -> None:
+    """Test the NumPy exit index agrees with the A* answers."""
+    pytest.importorskip("numpy")
+    searched = Dungeon(31, 17, seed=9, exits=2)
+    indexed = Dungeon(31, 17, seed=9, exits=2)
+    index = indexed.build_exit_index()
+    assert index.shape == (len(indexed),)
+    for room in range(len(indexed)):
+        assert index[room] == searched.distance_to_exit(room)
+        assert indexed.distance_to_exit(room) == index[room]
+        path = indexed.path_to_exit(room)
+        assert len(path) - 1 == index[room]
+        assert path[-1] in indexed.exit_rooms
+    indexed.clear_cache()
+    assert indexed._exit_index is None
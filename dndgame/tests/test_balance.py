@@ -0,0 +1,68 @@
+"""Tests for the encounter balancer."""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from dndgame.balance import Balancer, wilson_interval
+from dndgame.parallel import CombatantTemplate
+
+
+def test_wilson_interval() -> None:
+    """Test the interval brackets the estimate and narrows with samples."""
+    low, high = wilson_interval(60, 100)
+    assert low < 0.6 < high
+    wide = high - low
+    low, high = wilson_interval(6000, 10000)
+    assert low < 0.6 < high
+    assert high - low < wide / 5
+    assert wilson_interval(0, 0) == (0.0, 1.0)
+    assert wilson_interval(0, 50)[0] == 0.0
+
+
+def test_tune_reaches_target() -> None:
+    """Test tuning finds an enemy inside the target band."""
+    balancer = Balancer(CombatantTemplate.character("Human"), target=0.5)
+    result = balancer.tune("Orc")
+    assert result.converged
+    assert abs(result.win_rate - 0.5) <= 0.02
+    assert result.interval[0] <= result.win_rate <= result.interval[1]
+    assert result.enemy.type_name == "Orc"
+
+
+def test_weaker_target_gives_weaker_enemy() -> None:
+    """Test a higher player win rate needs a less sturdy enemy."""
+    player = CombatantTemplate.character("Orc")
+    hard = Balancer(player, target=0.3).tune("Goblin", parameters=("hp",))
+    easy = Balancer(player, target=0.8).tune("Goblin", parameters=("hp",))
+    assert easy.hp < hard.hp
+
+
+def test_evaluations_are_cached() -> None:
+    """Test repeating a search reuses earlier simulations."""
+    balancer = Balancer(CombatantTemplate.character("Elf"), target=0.6)
+    first = balancer.retune()
+    fights = balancer.fights_run
+    assert set(first) == {"Goblin", "Orc"}
+    second = balancer.retune()
+    assert balancer.fights_run == fights
+    assert second == first
+
+
+def test_clear_mismatch_stops_early() -> None:
+    """Test a lopsided candidate is settled by the first batch."""
+    balancer = Balancer(
+        CombatantTemplate.character("Human"), target=0.5, batch_size=1000
+    )
+    enemy = CombatantTemplate.enemy(
+        "Goblin", hp=1, armor_class=1, stats=(8, 14, 10, 10, 8, 8)
+    )
+    evaluation, verdict = balancer.evaluate(enemy)
+    assert verdict == 1
+    assert evaluation.result.fights == 1000
+
+
+def test_rejects_bad_target() -> None:
+    """Test targets outside [0, 1] are rejected."""
+    with pytest.raises(ValueError):
+        Balancer(CombatantTemplate.character("Human"), target=1.5)
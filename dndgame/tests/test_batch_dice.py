@@ -0,0 +1,88 @@
+"""Tests for vectorized dice rolling."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from dndgame.batch_dice import (
+    keep_highest,
+    keep_lowest,
+    roll_batch,
+    roll_keep_highest,
+    roll_keep_lowest,
+    roll_totals,
+    roll_with_advantage,
+    roll_with_disadvantage,
+)
+
+
+def test_roll_batch_shape_and_range() -> None:
+    """Test batch rolls have the right shape and stay on the die."""
+    rolls = roll_batch(6, 3, 1000, np.random.default_rng(0))
+    assert rolls.shape == (1000, 3)
+    assert rolls.min() >= 1
+    assert rolls.max() <= 6
+    assert rolls.dtype == np.int8
+
+
+def test_roll_totals() -> None:
+    """Test totals match summing the individual dice."""
+    totals = roll_totals(6, 3, 500, np.random.default_rng(1))
+    rolls = roll_batch(6, 3, 500, np.random.default_rng(1))
+    assert totals.shape == (500,)
+    assert (totals == rolls.sum(axis=1)).all()
+
+    d20 = roll_totals(20, 1, 100_000, np.random.default_rng(2))
+    assert abs(d20.mean() - 10.5) < 0.1
+
+
+def test_seeded_generator_is_reproducible() -> None:
+    """Test an explicit generator makes rolls repeatable."""
+    a = roll_batch(20, 4, 50, np.random.default_rng(42))
+    b = roll_batch(20, 4, 50, np.random.default_rng(42))
+    assert (a == b).all()
+
+
+def test_advantage_and_disadvantage() -> None:
+    """Test advantage takes the highest and disadvantage the lowest of two."""
+    pairs = roll_batch(20, 2, 1000, np.random.default_rng(3))
+    assert (
+        roll_with_advantage(20, 1000, np.random.default_rng(3)) == pairs.max(axis=1)
+    ).all()
+    assert (
+        roll_with_disadvantage(20, 1000, np.random.default_rng(3)) == pairs.min(axis=1)
+    ).all()
+
+
+def test_keep_highest_and_lowest() -> None:
+    """Test keep-highest/lowest select the right dice."""
+    rolls = np.array([[1, 6, 3, 4], [2, 2, 5, 1]])
+    assert sorted(keep_highest(rolls, 3)[0]) == [3, 4, 6]
+    assert sorted(keep_lowest(rolls, 2)[1]) == [1, 2]
+
+    expected = np.sort(roll_batch(6, 4, 200, np.random.default_rng(4)), axis=1)
+    assert (
+        roll_keep_highest(6, 4, 3, 200, np.random.default_rng(4))
+        == expected[:, 1:].sum(axis=1)
+    ).all()
+    assert (
+        roll_keep_lowest(6, 4, 3, 200, np.random.default_rng(4))
+        == expected[:, :3].sum(axis=1)
+    ).all()
+
+
+def test_keep_zero_dice() -> None:
+    """Test keeping no dice gives empty rows and zero totals."""
+    rolls = np.array([[1, 6, 3, 4], [2, 2, 5, 1]])
+    assert keep_highest(rolls, 0).shape == (2, 0)
+    assert keep_lowest(rolls, 0).shape == (2, 0)
+    assert (roll_keep_highest(6, 4, 0, 5, np.random.default_rng(1)) == 0).all()
+    assert (roll_keep_lowest(6, 4, 0, 5, np.random.default_rng(1)) == 0).all()
+
+
+def test_invalid_arguments() -> None:
+    """Test bad dice arguments are rejected."""
+    with pytest.raises(ValueError):
+        roll_batch(0, 1, 10)
+    with pytest.raises(ValueError):
+        keep_highest(np.ones((2, 3), dtype=np.int8), 4)
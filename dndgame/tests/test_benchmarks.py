@@ -0,0 +1,89 @@
+"""Tests for the benchmark harness and regression gate."""
+
+import random
+from pathlib import Path
+from benchmarks.__main__ import main
+from benchmarks.harness import REGISTRY, Report, Result, compare, run, select
+from benchmarks.suite import roll_uninstrumented
+from dndgame.dice import roll
+from dndgame.events import NullSink
+
+
+def _report(ns_per_op: dict[str, float]) -> Report:
+    """Create a report with one result per name at scale 1000."""
+    return Report(
+        [
+            Result(name, 1000, 1, 1, ns * 1000 / 1e9, ns * 1000 / 1e9)
+            for name, ns in ns_per_op.items()
+        ]
+    )
+
+
+def test_suite_covers_hot_paths() -> None:
+    """Test the suite registers the hot paths at 1, 1k and 1M operations."""
+    for name in (
+        "dice.roll",
+        "combat.execute_round",
+        "character.roll_stats",
+        "spellbook.query",
+        "spellbook.get_available_spells",
+    ):
+        assert REGISTRY[name].scales == (1, 1_000, 1_000_000)
+
+
+def test_select_by_prefix_and_scale() -> None:
+    """Test choosing benchmarks by name prefix and scale."""
+    cases = select(["dice."], [1, 1000])
+    assert {bench.name for bench, _ in cases} == {"dice.roll", "dice.roll_3d6"}
+    assert {scale for _, scale in cases} == {1, 1000}
+    assert select(["nothing"]) == []
+
+
+def test_uninstrumented_roll_matches_roll() -> None:
+    """Test the metrics overhead pair times the same rolls."""
+    sink, first, second = NullSink(), random.Random(3), random.Random(3)
+    assert [roll_uninstrumented(6, 3, sink, first) for _ in range(50)] == [
+        roll(6, 3, sink, second) for _ in range(50)
+    ]
+    assert {"metrics.roll_disabled", "metrics.roll_uninstrumented"} <= set(REGISTRY)
+
+
+def test_run_is_deterministic_workload() -> None:
+    """Test a run times each case and reports per-operation cost."""
+    results = run(select(["dice.roll"], [1]), repeats=1)
+    [result] = [r for r in results if r.name == "dice.roll"]
+    assert result.scale == 1
+    assert result.number >= 1
+    assert result.best > 0
+    assert result.ns_per_op == result.best * 1e9
+
+
+def test_compare_flags_regressions() -> None:
+    """Test only slowdowns beyond the threshold are reported."""
+    baseline = _report({"dice.roll": 100.0, "spellbook.query": 100.0, "gone": 1.0})
+    current = _report({"dice.roll": 109.0, "spellbook.query": 125.0, "new": 1.0})
+    regressions = compare(baseline, current, threshold=0.10)
+    assert [r.key for r in regressions] == ["spellbook.query[1000]"]
+    assert abs(regressions[0].slowdown - 0.25) < 1e-9
+    assert compare(baseline, current, threshold=0.30) == []
+
+
+def test_report_round_trip(tmp_path: Path) -> None:
+    """Test reports survive saving and loading."""
+    report = _report({"dice.roll": 42.0})
+    path = tmp_path / "bench.json"
+    report.save(path)
+    loaded = Report.load(path)
+    assert loaded.results == report.results
+    assert loaded.seed == report.seed
+
+
+def test_cli_compare_exit_status(tmp_path: Path) -> None:
+    """Test the compare command fails on a regression."""
+    baseline, faster, slower = (tmp_path / f"{n}.json" for n in "abc")
+    _report({"dice.roll": 100.0}).save(baseline)
+    _report({"dice.roll": 90.0}).save(faster)
+    _report({"dice.roll": 150.0}).save(slower)
+    assert main(["compare", str(baseline), str(faster)]) == 0
+    assert main(["compare", str(baseline), str(slower)]) == 1
+    assert main(["compare", str(baseline), str(slower), "--threshold", "0.6"]) == 0
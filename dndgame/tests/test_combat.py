@@ -7,16 +7,6 @@ from dndgame.character import Character
 from dndgame.enemy import Enemy
 
 
-@pytest.fixture
-def player() -> Character:
-    """Create test player."""
-    char = Character("Hero", "Human", 10)
-    char.stats = {"STR": 14, "DEX": 12, "CON": 14, "INT": 10, "WIS": 10, "CHA": 10}
-    char.hp = 15
-    char.max_hp = 15
-    return char
-
-
 @pytest.fixture
 def enemy() -> Enemy:
     """Create test enemy."""
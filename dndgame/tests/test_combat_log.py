@@ -0,0 +1,117 @@
+"""Tests for the bounded combat log."""
+
+from unittest.mock import patch
+import pytest
+from dndgame.character import Character
+from dndgame.combat import Combat
+from dndgame.combat_log import DEFAULT_CAPACITY, CombatLog, LogCode, LogDetail
+from dndgame.enemy import Enemy
+from dndgame.events import NullSink
+
+
+def test_messages_rendered_on_read() -> None:
+    """Test records read back as the classic messages."""
+    log = CombatLog()
+    log.record(LogCode.HIT, "Hero", "Goblin", 5)
+    log.record(LogCode.MISS, "Goblin", "Hero")
+    log.record(LogCode.DEFEAT, "Hero", "Goblin")
+    assert list(log) == ["Hero hit for 5 damage!", "Goblin missed!", "Goblin defeated!"]
+    assert log[-1] == "Goblin defeated!"
+    assert log[0:2] == ["Hero hit for 5 damage!", "Goblin missed!"]
+    assert log == ["Hero hit for 5 damage!", "Goblin missed!", "Goblin defeated!"]
+
+
+def test_ring_buffer_keeps_latest() -> None:
+    """Test the log never grows past its capacity."""
+    log = CombatLog(capacity=3)
+    for damage in range(1, 11):
+        log.record(LogCode.HIT, "Hero", "Orc", damage)
+    assert len(log) == 3
+    assert log.total == 10
+    assert log.dropped == 7
+    assert [r.value for r in log.records()] == [8, 9, 10]
+    with pytest.raises(IndexError):
+        log[3]
+
+
+def test_names_are_interned() -> None:
+    """Test each name is stored once however often it appears."""
+    log = CombatLog(capacity=4)
+    for _ in range(100):
+        log.record(LogCode.MISS, "Hero", "Orc")
+    assert log.intern("Hero") == 0
+    assert log.intern("Orc") == 1
+    assert log.intern("Elf") == 2
+
+
+def test_combat_per_attack_detail() -> None:
+    """Test the default log keeps only attacks, like the classic list."""
+    enemy = Enemy("Goblin")
+    enemy.hp = 1
+    combat = Combat(Character("Hero", "Human", 10), enemy, sink=NullSink())
+    combat.initiative_order = [combat.player, combat.enemy]
+    with patch("dndgame.combat.roll", side_effect=[20, 3]):
+        combat.execute_round()
+    assert list(combat.combat_log) == ["Hero hit for 3 damage!"]
+
+
+def test_combat_full_detail() -> None:
+    """Test FULL detail adds the defeat and the winner."""
+    enemy = Enemy("Goblin")
+    enemy.hp = 1
+    log = CombatLog(detail=LogDetail.FULL)
+    combat = Combat(Character("Hero", "Human", 10), enemy, sink=NullSink(), log=log)
+    combat.initiative_order = [combat.player, combat.enemy]
+    with patch("dndgame.combat.roll", side_effect=[20, 3]):
+        combat.execute_round()
+    assert list(log) == ["Hero hit for 3 damage!", "Goblin defeated!"]
+
+
+def test_combat_summary_and_off() -> None:
+    """Test lower detail levels skip per-attack records."""
+    summary = CombatLog(detail=LogDetail.SUMMARY)
+    hero = Character("Hero", "Human", 10)
+    Combat(hero, Enemy("Orc"), sink=NullSink(), log=summary).run_combat()
+    assert [r.code for r in summary.records()] == [LogCode.DEFEAT, LogCode.VICTORY]
+
+    off = CombatLog(detail=LogDetail.OFF)
+    hero = Character("Hero", "Human", 10)
+    Combat(hero, Enemy("Orc"), sink=NullSink(), log=off).run_combat()
+    assert len(off) == 0
+
+
+def test_default_log_is_bounded() -> None:
+    """Test the default log is a ring buffer and None opts out of it."""
+    log = CombatLog()
+    for damage in range(1, DEFAULT_CAPACITY + 11):
+        log.record(LogCode.HIT, "Hero", "Orc", damage)
+    assert len(log) == DEFAULT_CAPACITY
+    assert log.dropped == 10
+    assert log[0] == "Hero hit for 11 damage!"
+
+    unbounded = CombatLog(capacity=None)
+    for damage in range(1, DEFAULT_CAPACITY + 11):
+        unbounded.record(LogCode.HIT, "Hero", "Orc", damage)
+    assert len(unbounded) == DEFAULT_CAPACITY + 10
+    assert unbounded.dropped == 0
+
+
+def test_name_table_is_bounded() -> None:
+    """Test names of overwritten records don't pile up in the table."""
+    log = CombatLog(capacity=3)
+    for i in range(1000):
+        log.record(LogCode.HIT, f"Hero {i}", f"Orc {i}", i)
+    assert len(log._names) <= 4 * 3
+    assert list(log) == [f"Hero {i} hit for {i} damage!" for i in (997, 998, 999)]
+    assert [r.target for r in log.records()] == ["Orc 997", "Orc 998", "Orc 999"]
+
+
+def test_clear_forgets_names() -> None:
+    """Test clearing a reused log also resets the name table."""
+    for log in (CombatLog(), CombatLog(capacity=2)):
+        log.record(LogCode.HIT, "Hero", "Orc", 4)
+        log.clear()
+        log.record(LogCode.MISS, "Elf", "Goblin")
+        assert list(log) == ["Elf missed!"]
+        assert log.intern("Elf") == 0
+        assert log.intern("Hero") == 2
@@ -0,0 +1,107 @@
+"""Tests for compiled dice expressions."""
+
+import random
+from fractions import Fraction
+from unittest.mock import patch
+
+import pytest
+from dndgame.character import Character
+from dndgame.combat import Combat
+from dndgame.dice_expr import DiceSyntaxError, compile_dice, roll_dice
+from dndgame.enemy import Enemy
+from dndgame.events import MemorySink, NullSink, RollEvent
+
+
+def test_compile_is_cached() -> None:
+    """Test equivalent notation compiles once."""
+    expression = compile_dice("2d6+3")
+    assert compile_dice(" 2D6 + 3 ") is expression
+    assert compile_dice(expression) is expression
+    assert expression.text == "2d6+3"
+
+
+@pytest.mark.parametrize(
+    ("text", "minimum", "maximum", "mean"),
+    [
+        ("2d6+3", 5, 15, 10.0),
+        ("d20", 1, 20, 10.5),
+        ("8d6/2", 4, 24, 13.75),
+        ("(2d6+3)*2", 10, 30, 20.0),
+        ("3d6-1d4", -1, 17, 8.0),
+        ("-1d4+2", -2, 1, -0.5),
+        ("4d6kh3", 3, 18, 15869 / 1296),
+        ("4d6kl1", 1, 6, 2275 / 1296),
+        ("1d20adv+5", 6, 25, 18.825),
+        ("1d20dis", 1, 20, 7.175),
+    ],
+)
+def test_exact_statistics(text: str, minimum: int, maximum: int, mean: float) -> None:
+    """Test range, mean and distribution without rolling."""
+    expression = compile_dice(text)
+    assert (expression.minimum, expression.maximum) == (minimum, maximum)
+    assert expression.mean == pytest.approx(mean)
+    distribution = expression.distribution()
+    assert sum(distribution.values()) == 1
+    assert (min(distribution), max(distribution)) == (minimum, maximum)
+
+
+def test_known_probabilities() -> None:
+    """Test a few probabilities against hand-computed values."""
+    assert compile_dice("2d6").distribution()[7] == Fraction(1, 6)
+    assert compile_dice("1d20adv").distribution()[20] == Fraction(39, 400)
+    assert compile_dice("4d6kh3").probability(18) == pytest.approx(21 / 1296)
+
+
+def test_rolls_stay_in_range() -> None:
+    """Test rolled totals match the compiled bounds and mean."""
+    rng = random.Random(3)
+    for text in ["4d6kh3", "1d20adv+5", "8d6/2", "3d6-1d4"]:
+        expression = compile_dice(text)
+        totals = [expression.roll(NullSink(), rng) for _ in range(4000)]
+        assert expression.minimum <= min(totals)
+        assert max(totals) <= expression.maximum
+        assert sum(totals) / len(totals) == pytest.approx(expression.mean, rel=0.05)
+
+
+def test_rolls_go_through_dice_roll() -> None:
+    """Test sinks see the individual dice of keep-highest rolls."""
+    sink = MemorySink()
+    with patch("random.randint", side_effect=[2, 6, 1, 5]):
+        assert roll_dice("4d6kh3", sink) == 13
+    rolls = [event.total for event in sink.events if isinstance(event, RollEvent)]
+    assert rolls == [2, 6, 1, 5]
+
+
+def test_syntax_errors() -> None:
+    """Test malformed notation is rejected."""
+    for text in ["", "2d", "2d6+", "2x6", "1d6*1d4", "3d6kh4", "1d6/0", "(1d6"]:
+        with pytest.raises(DiceSyntaxError):
+            compile_dice(text)
+
+
+def test_whitespace_separates_tokens() -> None:
+    """Test spaces are never removed to glue numbers together."""
+    for text in ["2d6 3", "2 d6", "1 0", "4d6 kh3", "1d20 adv"]:
+        with pytest.raises(DiceSyntaxError):
+            compile_dice(text)
+    assert compile_dice("\t2d6 +\n 3").text == "2d6+3"
+    assert compile_dice("2d63").maximum == 126
+
+
+def test_combat_damage_dice() -> None:
+    """Test Combat rolls hits with its damage expression."""
+    player = Character("Hero", "Human", 10)
+    combat = Combat(player, Enemy("Orc"), sink=NullSink(), damage_dice="2d6+10")
+    with patch("dndgame.combat.roll", side_effect=[20, 7]):
+        damage = combat.attack(player, combat.enemy)
+    assert damage == 17 + player.get_modifier("STR")
+
+
+def test_roll_stats_dice() -> None:
+    """Test characters can roll stats with other notation."""
+    character = Character("Hero", "Human", 10)
+    character.roll_stats(NullSink(), random.Random(1), dice="4d6kh3")
+    assert all(3 <= score <= 18 for score in character.stats.values())
+    with patch("dndgame.character.roll", return_value=2):
+        character.roll_stats(NullSink(), dice="4d6kh3")
+    assert character.stats["STR"] == 6
@@ -0,0 +1,81 @@
+"""Tests for team encounters."""
+
+import random
+from functools import partial
+from typing import Callable
+import pytest
+from dndgame.character import Character
+from dndgame.enemy import Enemy
+from dndgame.encounter import Encounter, Team
+from dndgame.events import MemorySink, NullSink
+
+
+@pytest.fixture
+def make_hero(make_player: Callable[..., Character]) -> Callable[..., Character]:
+    """Factory for sturdy heroes."""
+    return partial(
+        make_player, stats={"STR": 18, "DEX": 14, "CON": 14}, hp=40, armor_class=16
+    )
+
+
+def test_team_living_index() -> None:
+    """Test removal keeps the living index consistent."""
+    goblins = [Enemy("Goblin", f"G{i}") for i in range(5)]
+    team = Team("Horde", goblins)
+    team.remove(1)
+    team.remove(4)
+    team.remove(1)
+    assert team.living_count() == 3
+    assert {g.name for g in team.living()} == {"G0", "G2", "G3"}
+    picks = {team.random_living(random.Random(s)) for s in range(50)}
+    assert picks == {0, 2, 3}
+
+
+def test_initiative_order_within_round(make_hero: Callable[..., Character]) -> None:
+    """Test combatants act in descending initiative order."""
+    sink = MemorySink()
+    party = [make_hero("Slow"), make_hero("Fast")]
+    party[0].stats["DEX"] = -30
+    party[1].stats["DEX"] = 50
+    horde = [Enemy("Goblin")]
+    horde[0].hp = horde[0].max_hp = 1000
+    encounter = Encounter(party, horde, sink=sink, rng=random.Random(0))
+    encounter.roll_initiative()
+    sink.clear()
+    encounter.execute_round()
+    turns = [e.to_dict()["combatant"] for e in sink.of_kind("turn")]
+    assert turns == ["Fast", "Goblin", "Slow"]
+
+
+def test_party_beats_horde(make_hero: Callable[..., Character]) -> None:
+    """Test a fight runs to a winner and the dead stop acting."""
+    party = [make_hero(f"Hero {i}") for i in range(6)]
+    horde = [Enemy("Goblin", f"Goblin {i}") for i in range(30)]
+    encounter = Encounter(party, horde, sink=NullSink(), rng=random.Random(5))
+    winner = encounter.run_combat()
+    assert winner is encounter.party
+    assert encounter.horde.is_defeated()
+    assert all(not goblin.is_alive() for goblin in horde)
+
+
+def test_one_on_one_matches_combat_rules(make_hero: Callable[..., Character]) -> None:
+    """Test a 1v1 encounter ends with exactly one side standing."""
+    encounter = Encounter(
+        [make_hero("Solo")], [Enemy("Orc")], sink=NullSink(), rng=random.Random(2)
+    )
+    winner = encounter.run_combat()
+    assert winner is not None
+    loser = encounter.horde if winner is encounter.party else encounter.party
+    assert loser.is_defeated()
+    assert not winner.is_defeated()
+
+
+def test_round_limit(make_hero: Callable[..., Character]) -> None:
+    """Test fights nobody can win stop at the round limit."""
+    hero = make_hero("Wall")
+    hero.armor_class = 100
+    goblin = Enemy("Goblin")
+    goblin.armor_class = 100
+    encounter = Encounter([hero], [goblin], sink=NullSink(), rng=random.Random(1))
+    assert encounter.run_combat(max_rounds=3) is None
+    assert encounter.round == 3
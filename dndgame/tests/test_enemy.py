@@ -1,7 +1,7 @@
 """Tests for Enemy class."""
 
 import pytest
-from dndgame.enemy import Enemy
+from dndgame.enemy import ENEMY_TEMPLATES, Enemy
 
 
 def test_enemy_creation() -> None:
@@ -47,3 +47,12 @@ def test_enemy_alive() -> None:
 
     goblin.take_damage(100)
     assert goblin.is_alive() is False
+
+
+def test_enemy_reads_template_edits(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test new enemies pick up edited template stats."""
+    stats = dict(ENEMY_TEMPLATES["Goblin"]["stats"], STR=18)
+    monkeypatch.setitem(ENEMY_TEMPLATES["Goblin"], "stats", stats)
+    goblin = Enemy("Goblin")
+    assert goblin.stats["STR"] == 18
+    assert goblin.get_modifier("STR") == 4
@@ -0,0 +1,81 @@
+"""Tests for the packed Entity representation."""
+
+import pytest
+from dndgame.character import Character
+from dndgame.enemy import Enemy
+from dndgame.entity import Ability
+
+
+def test_entities_have_no_instance_dict() -> None:
+    """Test entities are slotted."""
+    assert not hasattr(Character("Test", "Elf", 10), "__dict__")
+    assert not hasattr(Enemy("Goblin"), "__dict__")
+
+
+def test_stats_view_reads_and_writes() -> None:
+    """Test the stats view behaves like the old dict."""
+    char = Character("Test", "Human", 10)
+    assert char.stats == {
+        "STR": 10,
+        "DEX": 10,
+        "CON": 10,
+        "INT": 10,
+        "WIS": 10,
+        "CHA": 10,
+    }
+    char.stats["DEX"] += 4
+    assert char.stats["DEX"] == 14
+    assert dict(char.stats)["DEX"] == 14
+    assert list(char.stats) == ["STR", "DEX", "CON", "INT", "WIS", "CHA"]
+
+
+def test_modifier_cache_follows_score_changes() -> None:
+    """Test cached modifiers are refreshed when a score changes."""
+    char = Character("Test", "Human", 10)
+    assert char.get_modifier("CON") == 0
+    char.stats["CON"] = 7
+    assert char.get_modifier("CON") == -2
+    char.set_score(Ability.CON, 18)
+    assert char.get_modifier(Ability.CON) == 4
+    assert char.get_modifier("CON") == 4
+
+
+def test_assigning_stats_resets_missing_scores() -> None:
+    """Test replacing stats wholesale."""
+    char = Character("Test", "Human", 10)
+    char.stats["WIS"] = 18
+    char.stats = {"STR": 16}
+    assert char.scores() == (16, 10, 10, 10, 10, 10)
+    assert char.get_modifier("WIS") == 0
+
+
+def test_assigning_own_stats_view() -> None:
+    """Test assigning an entity its own view, or another's, keeps the scores."""
+    char = Character("Test", "Human", 10)
+    char.stats = {"STR": 16, "DEX": 8, "CHA": 14}
+    char.stats = char.stats
+    assert char.scores() == (16, 8, 10, 10, 10, 14)
+    assert char.get_modifier("STR") == 3
+    orc = Enemy("Orc")
+    orc.stats = char.stats
+    assert orc.scores() == char.scores()
+
+
+def test_invalid_stats() -> None:
+    """Test unknown abilities and deletion are rejected."""
+    char = Character("Test", "Human", 10)
+    with pytest.raises(KeyError):
+        char.get_modifier("LUCK")
+    with pytest.raises(KeyError):
+        char.stats["LUCK"] = 3
+    with pytest.raises(TypeError):
+        del char.stats["STR"]
+
+
+def test_enemies_do_not_share_scores() -> None:
+    """Test template scores are copied per spawned enemy."""
+    first = Enemy("Orc")
+    second = Enemy("Orc")
+    first.stats["STR"] = 3
+    assert second.stats["STR"] == 16
+    assert second.get_modifier("STR") == 3
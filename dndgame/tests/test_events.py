@@ -0,0 +1,129 @@
+"""Tests for events and sinks."""
+
+import io
+import json
+import pickle
+from unittest.mock import patch
+import pytest
+from dndgame.character import Character
+from dndgame.combat import Combat
+from dndgame.dice import roll
+from dndgame.enemy import Enemy
+from dndgame.events import (
+    Event,
+    HitEvent,
+    JsonLinesSink,
+    MemorySink,
+    MissEvent,
+    NullSink,
+    RollEvent,
+    StdoutSink,
+    get_default_sink,
+    set_default_sink,
+)
+
+
+def test_roll_emits_event() -> None:
+    """Test dice rolls are reported as structured events."""
+    sink = MemorySink()
+    with patch("random.randint", side_effect=[2, 5]):
+        total = roll(6, 2, sink=sink)
+    assert total == 7
+    assert sink.events == [RollEvent(6, 2, (2, 5), 7)]
+
+
+def test_stdout_sink_keeps_classic_text() -> None:
+    """Test the stdout sink prints the same text as before."""
+    stream = io.StringIO()
+    with patch("random.randint", return_value=4):
+        roll(6, 1, sink=StdoutSink(stream))
+    assert stream.getvalue() == "Rolling 1d6: [4] = 4\n"
+
+
+def test_null_sink_builds_no_events() -> None:
+    """Test a disabled sink never has events built for it."""
+
+    class Exploding(NullSink):
+        def emit(self, event: Event) -> None:
+            raise AssertionError("emit called on a disabled sink")
+
+    player = Character("Hero", "Human", 10)
+    player.roll_stats(sink=Exploding())
+    Combat(player, Enemy("Goblin"), sink=Exploding()).run_combat()
+
+
+def test_combat_event_sequence() -> None:
+    """Test a fight reports start, rounds, attacks and its end."""
+    sink = MemorySink()
+    player = Character("Hero", "Human", 10)
+    player.stats["STR"] = 30
+    enemy = Enemy("Goblin")
+    enemy.armor_class = 1
+    with patch("dndgame.combat.roll", side_effect=[20, 1, 20, 6]):
+        winner = Combat(player, enemy, sink=sink).run_combat()
+
+    assert winner is player
+    kinds = [e.kind for e in sink.events]
+    assert kinds == [
+        "combat_start",
+        "initiative",
+        "round_start",
+        "turn",
+        "attack",
+        "hit",
+        "status",
+        "defeat",
+        "combat_end",
+    ]
+    hit = sink.of_kind("hit")[0]
+    assert isinstance(hit, HitEvent)
+    assert hit.damage == 16
+
+
+def test_event_base_is_abstract() -> None:
+    """Test every event type has to say how it renders."""
+    with pytest.raises(TypeError):
+        Event()  # type: ignore[abstract]
+
+
+def test_events_are_values() -> None:
+    """Test events compare, hash and pickle by kind and field values."""
+    event = RollEvent(6, 2, (2, 5), 7)
+    assert event == RollEvent(dice_type=6, number_of_dice=2, rolls=(2, 5), total=7)
+    assert event != RollEvent(6, 2, (2, 5), 8)
+    assert HitEvent("Hero", "Goblin", 4) != MissEvent("Hero", "Goblin")
+    assert len({event, RollEvent(6, 2, (2, 5), 7)}) == 1
+    assert pickle.loads(pickle.dumps(event)) == event
+    assert repr(event) == (
+        "RollEvent(dice_type=6, number_of_dice=2, rolls=(2, 5), total=7)"
+    )
+    with pytest.raises(AttributeError):
+        event.total = 8
+
+
+def test_json_lines_sink() -> None:
+    """Test events are written as one JSON object per line."""
+    stream = io.StringIO()
+    sink = JsonLinesSink(stream)
+    sink.emit(HitEvent("Hero", "Goblin", 4))
+    sink.emit(RollEvent(20, 1, (17,), 17))
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert lines[0] == {
+        "event": "hit",
+        "attacker": "Hero",
+        "defender": "Goblin",
+        "damage": 4,
+    }
+    assert lines[1]["rolls"] == [17]
+
+
+def test_set_default_sink() -> None:
+    """Test swapping the default sink silences default rolls."""
+    sink = MemorySink()
+    previous = set_default_sink(sink)
+    try:
+        roll(20, 1)
+        assert get_default_sink() is sink
+    finally:
+        set_default_sink(previous)
+    assert len(sink.events) == 1
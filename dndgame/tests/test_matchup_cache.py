@@ -0,0 +1,65 @@
+"""Tests for the memoized matchup cache."""
+
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from dndgame.character import Character
+from dndgame.enemy import Enemy
+from dndgame.matchup_cache import MatchupCache, matchup_key
+from dndgame.solver import solve_combat
+
+
+def test_key_ignores_identity(player: Character) -> None:
+    """Test matchups with the same numbers share a key."""
+    twin = Character("Twin", "Human", 10)
+    twin.stats = dict(player.stats)
+    twin.stats["INT"] = 18
+    twin.hp = player.hp
+    assert matchup_key(player, Enemy("Goblin")) == matchup_key(twin, Enemy("Goblin"))
+    assert matchup_key(player, Enemy("Goblin")) != matchup_key(player, Enemy("Orc"))
+    player.hp = 14
+    assert matchup_key(player, Enemy("Goblin")) != matchup_key(twin, Enemy("Goblin"))
+
+
+def test_get_matches_solver(player: Character) -> None:
+    """Test cached odds equal a direct solve and repeats are hits."""
+    cache = MatchupCache()
+    odds = cache.get(player, Enemy("Goblin"))
+    assert odds == solve_combat(player, Enemy("Goblin"))
+    assert cache.get(player, Enemy("Goblin")) is odds
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_lru_eviction(player: Character) -> None:
+    """Test the least recently used entry is dropped first."""
+    cache = MatchupCache(maxsize=2)
+    goblin, orc, wounded = Enemy("Goblin"), Enemy("Orc"), Enemy("Orc")
+    wounded.hp -= 1
+    cache.get(player, goblin)
+    cache.get(player, orc)
+    cache.get(player, goblin)
+    cache.get(player, wounded)
+    assert len(cache) == 2
+    assert matchup_key(player, goblin) in cache
+    assert matchup_key(player, orc) not in cache
+    with pytest.raises(ValueError):
+        MatchupCache(maxsize=0)
+
+
+def test_persistent_tier(player: Character, tmp_path: Path) -> None:
+    """Test entries survive in the on-disk tier across caches."""
+    path = tmp_path / "matchups.sqlite"
+    first = MatchupCache(path=path)
+    odds = first.get(player, Enemy("Orc"))
+    first.close()
+
+    second = MatchupCache(path=path)
+    assert second.get(player, Enemy("Orc")) == odds
+    assert (second.disk_hits, second.misses) == (1, 0)
+    second.clear(persistent=True)
+    second.get(player, Enemy("Orc"))
+    assert second.misses == 1
+    second.close()
@@ -0,0 +1,110 @@
+"""Tests for opt-in instrumentation."""
+
+import random
+from typing import Callable
+from dndgame.character import Character
+from dndgame.combat import Combat
+from dndgame.dice import roll
+from dndgame.enemy import Enemy
+from dndgame.encounter import Encounter
+from dndgame.events import MemorySink, NullSink
+from dndgame.metrics import METRICS, PHASES, Metrics, collecting
+
+
+def test_disabled_by_default(make_player: Callable[..., Character]) -> None:
+    """Test nothing is recorded unless collection is on."""
+    METRICS.reset()
+    assert not METRICS.enabled
+    Combat(make_player(), Enemy("Goblin"), sink=NullSink()).run_combat()
+    assert METRICS.snapshot() == {
+        "counters": {},
+        "dice": {},
+        "timers": {},
+        "timer_counts": {},
+    }
+
+
+def test_roll_counters() -> None:
+    """Test rolls are counted by call and by die type."""
+    with collecting() as metrics:
+        roll(20, 1, sink=NullSink())
+        roll(6, 3, sink=NullSink())
+        roll(6, 2, sink=NullSink())
+    snapshot = metrics.snapshot()
+    assert snapshot["counters"] == {"rolls": 3}
+    assert snapshot["dice"] == {"d6": 5, "d20": 1}
+    assert not METRICS.enabled
+
+
+def test_combat_counters_match_events(make_player: Callable[..., Character]) -> None:
+    """Test hits, misses and rounds agree with the emitted events."""
+    sink = MemorySink()
+    with collecting() as metrics:
+        combat = Combat(make_player(), Enemy("Orc"), sink=sink, rng=random.Random(3))
+        combat.run_combat()
+    counters = metrics.counters
+    assert counters["combats"] == 1
+    assert counters["rounds"] == combat.round
+    assert counters.get("hits", 0) == len(sink.of_kind("hit"))
+    assert counters.get("misses", 0) == len(sink.of_kind("miss"))
+    assert counters["rolls"] == len(sink.of_kind("roll"))
+
+    attacks = counters.get("hits", 0) + counters.get("misses", 0)
+    assert metrics.timer_counts["attack_roll"] == attacks
+    assert metrics.timer_counts["initiative"] == 1
+    assert metrics.timer_counts.get("damage", 0) == counters.get("hits", 0)
+    assert set(metrics.timers) <= set(PHASES)
+    assert all(seconds >= 0 for seconds in metrics.timers.values())
+
+
+def test_encounter_is_instrumented(make_player: Callable[..., Character]) -> None:
+    """Test team fights report rounds and initiative too."""
+    party = [make_player() for _ in range(3)]
+    horde = [Enemy("Goblin", f"Goblin {i}") for i in range(5)]
+    with collecting() as metrics:
+        encounter = Encounter(party, horde, sink=NullSink(), rng=random.Random(1))
+        encounter.run_combat()
+    assert metrics.counters["rounds"] == encounter.round
+    assert metrics.counters["combats"] == 1
+    assert metrics.timer_counts["initiative"] == 1
+
+
+def test_collecting_restores_state() -> None:
+    """Test collecting() can keep earlier values and restores the flag."""
+    with collecting():
+        roll(4, 1, sink=NullSink())
+    with collecting(reset=False) as metrics:
+        roll(4, 1, sink=NullSink())
+    assert metrics.dice == {4: 2}
+    assert not metrics.enabled
+
+
+def test_timer_context() -> None:
+    """Test the timer context manager only records while enabled."""
+    metrics = Metrics()
+    with metrics.timer("damage"):
+        pass
+    assert metrics.timers == {}
+    metrics.enabled = True
+    with metrics.timer("damage"):
+        pass
+    assert metrics.timer_counts == {"damage": 1}
+
+
+def test_prometheus_export() -> None:
+    """Test the Prometheus text format."""
+    metrics = Metrics(enabled=True)
+    metrics.inc("hits", 3)
+    metrics.count_roll(20, 1)
+    metrics.count_roll(6, 2)
+    metrics.add_time("damage", 0.25)
+    text = metrics.to_prometheus()
+    lines = text.splitlines()
+    assert "# TYPE dndgame_hits_total counter" in lines
+    assert "dndgame_hits_total 3" in lines
+    assert "dndgame_rolls_total 2" in lines
+    assert 'dndgame_dice_rolled_total{die="d6"} 2' in lines
+    assert 'dndgame_dice_rolled_total{die="d20"} 1' in lines
+    assert 'dndgame_phase_seconds_total{phase="damage"} 0.25' in lines
+    assert 'dndgame_phase_spans_total{phase="damage"} 1' in lines
+    assert text.endswith("\n")
@@ -0,0 +1,95 @@
+"""Tests for bulk NPC generation."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from dndgame.character import RACES, Character
+from dndgame.npcgen import (
+    StatReport,
+    generate_npcs,
+    iter_npcs,
+    racial_bonus_matrix,
+)
+
+
+def test_bonus_matrix() -> None:
+    """Test the matrix mirrors RACES."""
+    matrix = racial_bonus_matrix(["Human", "Orc"])
+    assert matrix[0].tolist() == [1, 1, 1, 1, 1, 1]
+    assert matrix[1].tolist() == [2, 0, 1, 0, 0, 0]
+
+
+def test_generated_rules() -> None:
+    """Test stats, modifiers and HP follow the character rules."""
+    npcs = generate_npcs(20_000, base_hp=12, rng=np.random.default_rng(1))
+    records = npcs.records
+    bonuses = racial_bonus_matrix(npcs.races)[records["race"]]
+    base = records["stats"].astype(int) - bonuses
+    assert base.min() == 3 and base.max() == 18
+    assert (records["modifiers"] == (records["stats"].astype(int) - 10) // 2).all()
+    assert (records["max_hp"] == 12 + records["modifiers"][:, 2]).all()
+    assert set(np.unique(records["race"]).tolist()) == set(range(len(RACES)))
+    assert abs(base.mean() - 10.5) < 0.05
+
+
+def test_restricted_races() -> None:
+    """Test generating only some races."""
+    npcs = generate_npcs(500, races=["Dwarf"], rng=np.random.default_rng(2))
+    assert {npcs.race_of(i) for i in range(len(npcs))} == {"Dwarf"}
+    assert len(npcs.of_race("Dwarf")) == 500
+    assert len(npcs.of_race("Elf")) == 0
+    with pytest.raises(ValueError):
+        generate_npcs(5, races=["Dragon"])
+
+
+def test_materialize_on_demand() -> None:
+    """Test rows become equivalent Character objects."""
+    npcs = generate_npcs(100, rng=np.random.default_rng(3))
+    character = npcs.character(7)
+    row = npcs.records[7]
+    assert isinstance(character, Character)
+    assert character.name == "NPC 7"
+    assert character.race == npcs.race_of(7)
+    assert list(character.stats.values()) == row["stats"].tolist()
+    assert character.get_modifier("CON") == row["modifiers"][2]
+    assert character.hp == character.max_hp == row["max_hp"]
+    assert npcs.character(7, name="Bob").name == "Bob"
+    assert [c.name for c in npcs.characters([1, 2])] == ["NPC 1", "NPC 2"]
+
+
+def test_chunks_match_single_batch() -> None:
+    """Test chunked generation yields the same NPCs and names."""
+    whole = generate_npcs(1000, rng=np.random.default_rng(4))
+    chunks = list(iter_npcs(1000, rng=np.random.default_rng(4), chunk_size=300))
+    assert [len(chunk) for chunk in chunks] == [300, 300, 300, 100]
+    assert chunks[2].character(5).name == "NPC 605"
+    assert len(np.concatenate([chunk.records for chunk in chunks])) == 1000
+    assert whole.records.dtype == chunks[0].records.dtype
+
+
+def test_streaming_report() -> None:
+    """Test the report matches counts computed directly."""
+    report = StatReport()
+    records = np.concatenate(
+        [
+            chunk.records
+            for chunk in iter_npcs(
+                5000, rng=np.random.default_rng(5), chunk_size=1024, report=report
+            )
+        ]
+    )
+    assert report.counts.sum() == 5000
+    orc = records[records["race"] == list(RACES).index("Orc")]
+    assert report.counts[list(RACES).index("Orc")] == len(orc)
+    values, counts = np.unique(orc["stats"][:, 0], return_counts=True)
+    assert report.stat_distribution("Orc", "STR") == dict(
+        zip(values.tolist(), counts.tolist())
+    )
+    values, counts = np.unique(orc["modifiers"][:, 0], return_counts=True)
+    assert report.modifier_distribution("Orc", "STR") == dict(
+        zip(values.tolist(), counts.tolist())
+    )
+    means = report.means()
+    assert abs(means["Orc"]["STR"] - orc["stats"][:, 0].mean()) < 1e-9
+    assert "Halfling" in report.format()
@@ -0,0 +1,113 @@
+"""Tests for the sharded simulation runner."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from dndgame.character import Character
+from dndgame.enemy import Enemy
+from dndgame.parallel import CombatantTemplate, ShardedRunner, run_shard
+
+
+def test_character_template_build() -> None:
+    """Test character templates build average or explicit characters."""
+    orc = CombatantTemplate.character("Orc").build()
+    assert isinstance(orc, Character)
+    assert orc.stats["STR"] == 12
+    assert orc.max_hp == 10
+
+    custom = CombatantTemplate.character(
+        "Human", name="Hero", stats=(14, 12, 14, 10, 10, 10), armor_class=15
+    ).build()
+    assert custom.name == "Hero"
+    assert custom.hp == custom.max_hp == 12
+    assert custom.armor_class == 15
+
+
+def test_enemy_template_build() -> None:
+    """Test enemy templates apply overrides."""
+    goblin = CombatantTemplate.enemy("Goblin", hp=20).build()
+    assert isinstance(goblin, Enemy)
+    assert goblin.hp == goblin.max_hp == 20
+    with pytest.raises(ValueError):
+        CombatantTemplate("dragon", "Red").build()
+
+
+def test_shard_layout() -> None:
+    """Test workloads split into fixed-size shards."""
+    runner = ShardedRunner(
+        CombatantTemplate.character("Elf"),
+        CombatantTemplate.enemy("Orc"),
+        shard_size=400,
+    )
+    shards = runner.shards(1000, master_seed=3)
+    assert [task[2] for task in shards] == [400, 400, 200]
+    assert [task[4] for task in shards] == [0, 1, 2]
+
+
+def test_same_result_for_any_worker_count() -> None:
+    """Test a fixed seed gives identical results in-process and in a pool."""
+    player = CombatantTemplate.character("Dwarf")
+    enemy = CombatantTemplate.enemy("Goblin")
+    serial = ShardedRunner(player, enemy, workers=1, shard_size=500).run(2000, 11)
+    pooled = ShardedRunner(player, enemy, workers=2, shard_size=500).run(2000, 11)
+    assert serial.fights == pooled.fights == 2000
+    assert serial.player_wins == pooled.player_wins
+    assert serial.player_damage == pooled.player_damage
+    assert (serial.rounds_histogram == pooled.rounds_histogram).all()
+
+
+def test_merge_matches_shards() -> None:
+    """Test the merged result is the sum of its shards."""
+    player = CombatantTemplate.character("Human")
+    enemy = CombatantTemplate.enemy("Orc")
+    merged = ShardedRunner(player, enemy, workers=1, shard_size=300).run(600, 5)
+    a = run_shard(player, enemy, 300, 5, 0)
+    b = run_shard(player, enemy, 300, 5, 1)
+    assert merged.player_wins == a.player_wins + b.player_wins
+    assert merged.enemy_damage == a.enemy_damage + b.enemy_damage
+    assert (
+        merged.player_hp_histogram == a.player_hp_histogram + b.player_hp_histogram
+    ).all()
+
+
+def test_resolved_templates_skip_definitions(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test resolved templates build without the race or enemy definitions."""
+    from dndgame.character import RACES
+    from dndgame.enemy import ENEMY_TEMPLATES
+
+    monkeypatch.setitem(RACES, "Gnome", {"INT": 2})
+    gnome = CombatantTemplate.character("Gnome").resolve()
+    ogre = CombatantTemplate.enemy("Orc", name="Ogre", hp=40).resolve()
+    assert gnome.resolved and gnome.resolve() is gnome
+    assert gnome.stats == (10, 10, 10, 12, 10, 10)
+    assert (ogre.hp, ogre.armor_class, ogre.level) == (40, 13, 2)
+
+    monkeypatch.delitem(RACES, "Gnome")
+    monkeypatch.delitem(ENEMY_TEMPLATES, "Orc")
+    built = gnome.build()
+    assert isinstance(built, Character)
+    assert (built.race, built.get_modifier("INT"), built.hp) == ("Gnome", 1, 10)
+    enemy = ogre.build()
+    assert isinstance(enemy, Enemy)
+    assert (enemy.name, enemy.enemy_type, enemy.max_hp) == ("Ogre", "Orc", 40)
+
+
+def test_template_edits_reach_cached_simulators(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test a changed enemy definition isn't served from the simulator cache."""
+    from dndgame.enemy import ENEMY_TEMPLATES
+    from dndgame.rng import RngStreams
+    from dndgame.simulation import CombatSimulator
+
+    player = CombatantTemplate.character("Human")
+    enemy = CombatantTemplate.enemy("Orc")
+    runner = ShardedRunner(player, enemy, workers=1, shard_size=2000)
+    before = runner.run(2000, 8)
+    monkeypatch.setitem(ENEMY_TEMPLATES["Orc"], "hp", 1)
+    after = runner.run(2000, 8)
+    fresh = CombatSimulator(player.build(), enemy.build()).run(
+        2000, RngStreams(8).generator(0)
+    )
+    assert after.player_wins == fresh.player_wins > before.player_wins
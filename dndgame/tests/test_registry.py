@@ -0,0 +1,202 @@
+"""Tests for the data-driven template registry."""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+import pytest
+from dndgame.character import RACES, Character
+from dndgame.enemy import ENEMY_TEMPLATES, Enemy
+from dndgame.registry import Registry, RegistryError
+
+
+TOML = """
+[races.Gnome]
+bonuses = { INT = 2, DEX = 1 }
+
+[enemies.Kobold]
+hp = 5
+ac = 12
+stats = { STR = 7, DEX = 15 }
+"""
+
+JSON: dict[str, dict[str, dict[str, Any]]] = {
+    "enemies": {
+        "Ogre": {
+            "hp": 59,
+            "ac": 11,
+            "level": 5,
+            "stats": {"STR": 19, "DEX": 8, "CON": 16},
+        },
+        "Kobold": {"hp": 6, "ac": 12},
+    }
+}
+
+
+@pytest.fixture
+def content(tmp_path: Path) -> Path:
+    """Create a content directory with a TOML and a JSON file."""
+    directory = tmp_path / "content"
+    directory.mkdir()
+    (directory / "a_core.toml").write_text(TOML)
+    (directory / "b_extra.json").write_text(json.dumps(JSON))
+    (directory / "notes.txt").write_text("ignored")
+    return directory
+
+
+def test_lazy_loading(content: Path) -> None:
+    """Test nothing is parsed until the first lookup."""
+    registry = Registry([content])
+    assert registry.parsed == 0
+    assert registry.enemy("Ogre").hp == 59
+    assert registry.parsed == 2
+    registry.enemy("Kobold")
+    assert registry.parsed == 2
+
+
+def test_prototypes_and_overrides(content: Path) -> None:
+    """Test definitions compile and later files override earlier ones."""
+    registry = Registry([content])
+    kobold = registry.enemy("Kobold")
+    assert (kobold.hp, kobold.armor_class, kobold.level) == (6, 12, 1)
+    assert kobold.scores == (10,) * 6
+    assert registry.enemy("Ogre").scores == (19, 8, 16, 10, 10, 10)
+    assert registry.race("Gnome").as_dict() == {"INT": 2, "DEX": 1}
+    assert registry.enemy("Orc").hp == ENEMY_TEMPLATES["Orc"]["hp"]
+    assert "Human" in registry.race_names()
+    assert {"Goblin", "Orc", "Kobold", "Ogre"} <= set(registry.enemy_types())
+    assert registry.enemy("Ogre") is registry.enemy("Ogre")
+    with pytest.raises(KeyError):
+        registry.enemy("Dragon")
+    with pytest.raises(AttributeError):
+        registry.enemy("Ogre").hp = 1  # type: ignore[misc]
+
+
+def test_without_builtins(content: Path) -> None:
+    """Test built-in definitions can be left out."""
+    registry = Registry([content], include_builtins=False)
+    assert set(registry.enemy_types()) == {"Kobold", "Ogre"}
+
+
+def test_spawn_matches_constructor() -> None:
+    """Test cloned enemies equal ones built by Enemy.__init__."""
+    registry = Registry()
+    spawned = registry.spawn("Orc", "Grug")
+    built = Enemy("Orc", "Grug")
+    assert type(spawned) is Enemy
+    assert spawned.name == "Grug"
+    assert spawned.enemy_type == "Orc"
+    assert spawned.scores() == built.scores()
+    assert spawned.get_modifier("STR") == built.get_modifier("STR")
+    assert (spawned.hp, spawned.max_hp, spawned.armor_class, spawned.level) == (
+        built.hp,
+        built.max_hp,
+        built.armor_class,
+        built.level,
+    )
+
+
+def test_spawned_enemies_are_independent(content: Path) -> None:
+    """Test clones don't share state with each other or the prototype."""
+    registry = Registry([content])
+    first, second = registry.spawn_many("Ogre", 2)
+    assert [first.name, second.name] == ["Ogre 1", "Ogre 2"]
+    first.take_damage(10)
+    first.stats["STR"] = 3
+    assert second.hp == 59
+    assert second.stats["STR"] == 19
+    assert registry.spawn("Ogre").stats["STR"] == 19
+
+
+def test_install_and_create_character(content: Path) -> None:
+    """Test registry races and enemies can be used by the game classes."""
+    registry = Registry([content])
+    try:
+        hero = registry.create_character("Pip", "Gnome", 10)
+        assert isinstance(hero, Character)
+        assert "Gnome" in Character.available_races
+        hero.apply_racial_bonuses()
+        assert hero.stats["INT"] == 12
+
+        registry.install_enemy("Ogre")
+        assert Enemy("Ogre").max_hp == 59
+        assert "Ogre" in Enemy.available_types
+    finally:
+        registry.uninstall()
+    assert "Gnome" not in RACES
+    assert "Gnome" not in Character.available_races
+    assert "Ogre" not in ENEMY_TEMPLATES
+    assert "Ogre" not in Enemy.available_types
+
+
+def test_uninstall_restores_overridden_builtins(tmp_path: Path) -> None:
+    """Test uninstalling brings back the built-in definitions it replaced."""
+    path = tmp_path / "override.json"
+    path.write_text(json.dumps({"enemies": {"Goblin": {"hp": 99}}}))
+    original = ENEMY_TEMPLATES["Goblin"]
+    types = list(Enemy.available_types)
+    registry = Registry([path])
+    try:
+        registry.install_enemy("Goblin")
+        registry.install_enemy("Goblin")
+        assert Enemy("Goblin").max_hp == 99
+    finally:
+        registry.uninstall()
+    assert ENEMY_TEMPLATES["Goblin"] is original
+    assert Enemy.available_types == types
+    assert Enemy("Goblin").max_hp == 7
+
+
+def test_compiled_cache(content: Path, tmp_path: Path) -> None:
+    """Test unchanged files are read from the cache, changed ones reparsed."""
+    cache = tmp_path / "cache"
+    assert Registry([content], cache_dir=cache).enemy("Ogre").hp == 59
+
+    warm = Registry([content], cache_dir=cache)
+    assert warm.enemy("Ogre").hp == 59
+    assert warm.enemy("Kobold").armor_class == 12
+    assert warm.parsed == 0
+
+    path = content / "b_extra.json"
+    JSON["enemies"]["Ogre"]["hp"] = 70
+    try:
+        path.write_text(json.dumps(JSON))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        changed = Registry([content], cache_dir=cache)
+        assert changed.enemy("Ogre").hp == 70
+        assert changed.parsed == 1
+    finally:
+        JSON["enemies"]["Ogre"]["hp"] = 59
+
+
+@pytest.mark.parametrize(
+    "document, message",
+    [
+        ({"enemies": {"X": {"ac": 10}}}, "missing hp"),
+        ({"enemies": {"X": {"hp": "lots"}}}, "must be an integer"),
+        ({"enemies": {"X": {"hp": 5, "stats": {"LUCK": 3}}}}, "unknown ability"),
+        ({"enemies": {"X": {"hp": 5, "speed": 30}}}, "unknown keys"),
+        ({"races": {"Y": {"bonuses": {"STR": True}}}}, "must be an integer"),
+        ({"monsters": {}}, "unknown sections"),
+    ],
+)
+def test_validation_errors(
+    tmp_path: Path, document: dict[str, Any], message: str
+) -> None:
+    """Test malformed definitions are rejected with the file name."""
+    path = tmp_path / "bad.json"
+    path.write_text(json.dumps(document))
+    with pytest.raises(RegistryError, match=message) as error:
+        Registry([path]).enemy_types()
+    assert "bad.json" in str(error.value)
+
+
+def test_parse_errors(tmp_path: Path) -> None:
+    """Test syntax errors and missing files raise RegistryError."""
+    path = tmp_path / "broken.toml"
+    path.write_text("[enemies.Kobold\nhp = ")
+    with pytest.raises(RegistryError):
+        Registry([path]).enemy_types()
+    with pytest.raises(RegistryError):
+        Registry([tmp_path / "missing.json"]).enemy_types()
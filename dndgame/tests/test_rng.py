@@ -0,0 +1,81 @@
+"""Tests for seedable random streams."""
+
+import random
+
+import pytest
+from dndgame.character import Character
+from dndgame.combat import Combat
+from dndgame.dice import roll
+from dndgame.enemy import Enemy
+from dndgame.events import MemorySink, NullSink
+from dndgame.rng import RngStreams, derive_seed
+
+
+def _fight(rng: random.Random) -> tuple[int, int, list[str]]:
+    """Run one silent seeded fight and summarise it."""
+    player = Character("Hero", "Human", 10)
+    player.roll_stats(sink=NullSink(), rng=rng)
+    player.apply_racial_bonuses()
+    enemy = Enemy("Orc")
+    combat = Combat(player, enemy, sink=NullSink(), rng=rng)
+    combat.run_combat()
+    return player.hp, enemy.hp, list(combat.combat_log)
+
+
+def test_roll_uses_injected_rng() -> None:
+    """Test rolls come from the given source, not the global one."""
+    a = [roll(20, 1, sink=NullSink(), rng=random.Random(9)) for _ in range(3)]
+    b = [roll(20, 1, sink=NullSink(), rng=random.Random(9)) for _ in range(3)]
+    assert a == b
+
+
+def test_streams_are_distinct_and_stable() -> None:
+    """Test child streams differ from each other but not between runs."""
+    streams = RngStreams(1234)
+    first = [streams.stream(0).randint(1, 10**9) for _ in range(2)]
+    assert first[0] == first[1]
+    assert streams.stream(0).randint(1, 10**9) != streams.stream(1).randint(1, 10**9)
+    assert streams.seed(5) == RngStreams(1234).seed(5)
+    assert derive_seed(1234, 5) != derive_seed(1235, 5)
+
+
+def test_fight_replays_from_seed_and_index() -> None:
+    """Test any fight in a batch is reproduced from (master_seed, index)."""
+    streams = RngStreams(99)
+    batch = [_fight(streams.stream(i)) for i in range(50)]
+    assert _fight(RngStreams(99).stream(37)) == batch[37]
+    assert len({str(outcome) for outcome in batch}) > 1
+
+
+def test_replay_ignores_global_random_state() -> None:
+    """Test seeded fights aren't disturbed by other users of random."""
+    sink = MemorySink()
+    random.seed(1)
+    Combat(
+        Character("A", "Elf", 10), Enemy("Goblin"), sink=sink, rng=random.Random(3)
+    ).run_combat()
+    first = [e.to_dict() for e in sink.events]
+    sink.clear()
+    random.seed(2)
+    Combat(
+        Character("A", "Elf", 10), Enemy("Goblin"), sink=sink, rng=random.Random(3)
+    ).run_combat()
+    assert [e.to_dict() for e in sink.events] == first
+
+
+def test_child_streams() -> None:
+    """Test nested families are deterministic."""
+    shard = RngStreams(7).child(3)
+    assert shard.stream(0).random() == RngStreams(7).child(3).stream(0).random()
+
+
+def test_numpy_generators() -> None:
+    """Test NumPy generators follow the same seed-and-index scheme."""
+    pytest.importorskip("numpy")
+    streams = RngStreams(42)
+    assert streams.generator(4).integers(0, 10**9) == RngStreams(42).generator(
+        4
+    ).integers(0, 10**9)
+    assert streams.generator(4).integers(0, 10**9) != streams.generator(5).integers(
+        0, 10**9
+    )
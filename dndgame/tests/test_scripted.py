@@ -0,0 +1,93 @@
+"""Tests for scripted, non-interactive sessions."""
+
+import json
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from dndgame.scripted import main, run_script, run_scripts, summarize
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_run_script_outcomes() -> None:
+    """Test quitting, running out of input and losing a fight."""
+    result = run_script(["Aria", "2", "3", "4", "5", "1"], random.Random(1))
+    assert result.outcome == "quit"
+    assert result.inputs_used == 5
+    assert result.race == "Elf" and result.hp == result.max_hp
+    assert result.transcript is None
+
+    result = run_script(["Aria"], random.Random(1), transcript=True)
+    assert result.outcome == "incomplete" and result.race is None
+    assert result.transcript is not None
+    assert result.transcript.endswith("Enter choice (1-5): ")
+
+    result = run_script(["Aria", "1"] + ["2"] * 50, random.Random(1))
+    assert result.outcome == "defeated"
+    assert result.hp == 0 and result.inputs_used < 52
+
+
+def test_run_scripts_is_reproducible() -> None:
+    """Test seeded batches replay exactly and sessions differ."""
+    script = ["Bram", "3", "1", "4", "2", "5"]
+    first = [result.to_dict() for result in run_scripts(script, 50, seed=9)]
+    second = [result.to_dict() for result in run_scripts(script, 50, seed=9)]
+    assert first == second
+    assert [result["session"] for result in first] == list(range(50))
+    assert len({result["max_hp"] for result in first}) > 1
+
+    summary = summarize(list(run_scripts(script, 50, seed=9)))
+    assert summary["sessions"] == 50
+    assert sum(summary["outcomes"].values()) == 50
+
+
+def test_main_json_lines(capsys: pytest.CaptureFixture[str], tmp_path: Path) -> None:
+    """Test the CLI prints one JSON object per session."""
+    assert main(["--inputs", "Aria", "2", "5", "--sessions", "3", "--seed", "1"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)["outcome"] for line in lines] == ["quit"] * 3
+
+    script = tmp_path / "smoke.txt"
+    script.write_text("Aria\n2\n")
+    assert main(["--script", str(script), "--summary"]) == 1
+    summary = json.loads(capsys.readouterr().out)
+    assert summary["outcomes"] == {"incomplete": 1}
+    assert summary["elapsed_ms"] >= 0
+
+
+def test_main_py_batch_mode() -> None:
+    """Test main.py switches to scripted mode when given arguments."""
+    completed = subprocess.run(
+        [sys.executable, "main.py", "--inputs", "Aria", "2", "5", "--seed", "4"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        stdin=subprocess.DEVNULL,
+        timeout=60,
+    )
+    assert completed.returncode == 0
+    assert json.loads(completed.stdout)["outcome"] == "quit"
+
+
+def test_main_py_batch_mode_imports() -> None:
+    """Test scripted runs skip modules that only slow startup down."""
+    code = (
+        "import sys; sys.argv = ['main.py', '--inputs', 'Aria', '5']; "
+        "import runpy; runpy.run_path('main.py', run_name='__main__')"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        stdin=subprocess.DEVNULL,
+        timeout=60,
+    )
+    imported = {
+        line.rsplit("|", 1)[-1].strip() for line in completed.stderr.splitlines()
+    }
+    assert "dndgame.session" in imported
+    assert not imported & {"dataclasses", "inspect", "shutil"}
@@ -0,0 +1,81 @@
+"""Tests for the asyncio game server and its load-test client."""
+
+import asyncio
+from dndgame.loadtest import LoadReport, percentile, player_script, run_load_test
+from dndgame.server import END_OF_RESPONSE, END_OF_SESSION, GameServer
+
+
+def test_percentile() -> None:
+    """Test nearest-rank percentiles."""
+    samples = [float(i) for i in range(1, 101)]
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile(samples, 100) == 100.0
+    assert percentile([], 50) == 0.0
+
+
+def test_player_script() -> None:
+    """Test the simulated player's steps."""
+    steps = player_script("Aria", "2", fights=2)
+    assert steps[:2] == [("name", "Aria"), ("race", "2")]
+    assert [action for action, _ in steps[2:]] == [
+        "fight",
+        "rest",
+        "fight",
+        "rest",
+        "view",
+        "quit",
+    ]
+
+
+def test_session_over_tcp() -> None:
+    """Test one client playing through the server."""
+
+    async def play() -> list[bytes]:
+        server = GameServer(port=0, seed=3)
+        await server.start()
+        try:
+            reader, writer = await asyncio.open_connection(server.host, server.port)
+            replies = [await reader.readuntil(END_OF_RESPONSE)]
+            for line in [b"Aria\n", b"1\n", b"3\n", b"5\n"]:
+                writer.write(line)
+                replies.append(await reader.readuntil(END_OF_RESPONSE))
+            assert await reader.read() == b""
+            writer.close()
+            await writer.wait_closed()
+            return replies
+        finally:
+            await server.close()
+
+    replies = asyncio.run(play())
+    assert replies[0].startswith(b"Welcome to D&D Adventure!")
+    assert b"Choose your race" in replies[1]
+    assert b"Character created!" in replies[2]
+    assert b"Aria the Human" in replies[3]
+    assert replies[4].endswith(
+        b"Thanks for playing!\n" + END_OF_SESSION + END_OF_RESPONSE
+    )
+
+
+def test_many_concurrent_sessions() -> None:
+    """Test the server handles many players at once on one event loop."""
+
+    async def load() -> tuple[LoadReport, GameServer]:
+        server = GameServer(port=0, seed=5)
+        await server.start()
+        try:
+            report = await run_load_test(server.host, server.port, players=200)
+        finally:
+            await server.close()
+        return report, server
+
+    report, server = asyncio.run(load())
+    assert report.sessions == 200
+    assert report.errors == 0
+    assert server.completed == 200
+    assert server.active == 0
+    summary = report.summary()
+    assert summary["connect"]["count"] == 200
+    assert summary["name"]["count"] == 200
+    assert 0 < summary["fight"]["p50_ms"] <= summary["fight"]["p99_ms"]
+    assert "p99 ms" in report.format()
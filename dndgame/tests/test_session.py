@@ -0,0 +1,98 @@
+"""Tests for the input-driven game session."""
+
+import random
+import pytest
+from dndgame.session import GameSession, SessionState
+
+
+def _state(session: GameSession) -> SessionState:
+    """Read the state fresh (mypy would keep an earlier ``is`` narrowing)."""
+    return session.state
+
+
+def test_character_creation_flow() -> None:
+    """Test name and race prompts, including invalid input."""
+    session = GameSession(rng=random.Random(1))
+    text = session.start()
+    assert text.startswith("Welcome to D&D Adventure!")
+    assert text.endswith("Enter character name: ")
+
+    assert "Cannot be empty" in session.feed("   ")
+    assert _state(session) is SessionState.NAME
+
+    text = session.feed("Aria")
+    assert "1. Human" in text
+    assert text.endswith("Enter choice (1-5): ")
+
+    assert "Invalid. Choose from: 1, 2, 3, 4, 5" in session.feed("9")
+    text = session.feed("2")
+    assert "Creating Aria the Elf..." in text
+    assert "Character created!" in text
+    assert text.endswith("Enter choice (1-5): ")
+    assert _state(session) is SessionState.MENU
+    assert session.player is not None and session.player.race == "Elf"
+
+
+def test_menu_actions() -> None:
+    """Test viewing, resting and quitting."""
+    session = GameSession(rng=random.Random(2))
+    session.start()
+    session.feed("Bram")
+    session.feed("3")
+    player = session.player
+    assert player is not None
+
+    assert "Bram the Dwarf" in session.feed("3")
+    player.hp = 1
+    text = session.feed("4")
+    assert "Bram rests!" in text
+    assert player.hp == player.max_hp
+    assert "Invalid" in session.feed("x")
+
+    text = session.feed("5")
+    assert text.endswith("Thanks for playing!\n")
+    assert session.finished
+    with pytest.raises(RuntimeError):
+        session.feed("1")
+
+
+def test_fight_outcomes() -> None:
+    """Test fights either continue the menu or end the game."""
+    outcomes = set()
+    for seed in range(20):
+        session = GameSession(rng=random.Random(seed))
+        session.start()
+        session.feed("Cora")
+        session.feed("5")
+        text = session.feed("2")
+        assert "COMBAT: Cora vs Orc" in text
+        if session.finished:
+            assert text.endswith("Game Over!\n")
+            assert session.won == 0
+        else:
+            assert text.endswith("Enter choice (1-5): ")
+            assert session.won == 1
+        outcomes.add(session.finished)
+    assert outcomes == {True, False}
+
+
+def test_seeded_sessions_are_reproducible() -> None:
+    """Test the same seed and input give the same transcript."""
+    transcripts = []
+    for _ in range(2):
+        session = GameSession(rng=random.Random(7))
+        text = session.start()
+        for line in ["Dell", "1", "1", "4", "1", "5"]:
+            if session.finished:
+                break
+            text += session.feed(line)
+        transcripts.append(text)
+    assert transcripts[0] == transcripts[1]
+
+
+def test_start_twice() -> None:
+    """Test a session can only be started once."""
+    session = GameSession()
+    session.start()
+    with pytest.raises(RuntimeError):
+        session.start()
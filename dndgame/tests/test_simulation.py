@@ -0,0 +1,84 @@
+"""Tests for the batch combat simulator."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from dndgame.character import Character
+from dndgame.enemy import Enemy
+from dndgame.simulation import CombatSimulator
+
+
+def test_counts_add_up(player: Character) -> None:
+    """Test every fight is a win, a loss or a draw."""
+    result = CombatSimulator(player, Enemy("Goblin")).run(
+        5000, np.random.default_rng(1)
+    )
+    assert result.fights == 5000
+    assert result.player_wins + result.enemy_wins + result.draws == 5000
+    assert result.rounds_histogram.sum() == 5000
+    assert result.player_hp_histogram.sum() == result.player_wins
+    assert result.enemy_hp_histogram.sum() == result.enemy_wins
+    assert result.rounds_histogram[0] == 0
+
+
+def test_entities_not_modified(player: Character) -> None:
+    """Test simulation leaves the combatants untouched."""
+    goblin = Enemy("Goblin")
+    CombatSimulator(player, goblin).run(100, np.random.default_rng(2))
+    assert player.hp == 15
+    assert goblin.hp == 7
+
+
+def test_seeded_runs_are_reproducible(player: Character) -> None:
+    """Test the same generator seed gives the same result."""
+    sim = CombatSimulator(player, Enemy("Orc"))
+    a = sim.run(2000, np.random.default_rng(7), chunk_size=300)
+    b = sim.run(2000, np.random.default_rng(7), chunk_size=300)
+    assert a.player_wins == b.player_wins
+    assert (a.rounds_histogram == b.rounds_histogram).all()
+
+
+def test_overwhelming_player_always_wins(player: Character) -> None:
+    """Test an unhittable player who always kills wins in round one."""
+    player.stats["STR"] = 30
+    player.armor_class = 100
+    goblin = Enemy("Goblin")
+    goblin.armor_class = 1
+    result = CombatSimulator(player, goblin).run(1000, np.random.default_rng(3))
+    assert result.player_wins == 1000
+    assert result.rounds_histogram[1] == 1000
+    assert result.player_hp_histogram[15] == 1000
+
+
+def test_unhittable_fights_are_draws(player: Character) -> None:
+    """Test fights nobody can win stop at the round limit."""
+    goblin = Enemy("Goblin")
+    goblin.armor_class = 100
+    player.armor_class = 100
+    result = CombatSimulator(player, goblin, max_rounds=5).run(
+        50, np.random.default_rng(4)
+    )
+    assert result.draws == 50
+    assert result.rounds_histogram[5] == 50
+
+
+def test_win_rate_matches_combat(
+    player: Character, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test the simulator agrees with the interactive Combat rules."""
+    from dndgame.combat import Combat
+
+    combat_wins = 0
+    for _ in range(2000):
+        hero = Character("Hero", "Human", 10)
+        hero.stats = dict(player.stats)
+        hero.hp = hero.max_hp = 15
+        if Combat(hero, Enemy("Orc")).run_combat() is hero:
+            combat_wins += 1
+    capsys.readouterr()
+
+    result = CombatSimulator(player, Enemy("Orc")).run(
+        200_000, np.random.default_rng(5)
+    )
+    assert abs(result.player_win_rate - combat_wins / 2000) < 0.05
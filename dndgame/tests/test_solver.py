@@ -0,0 +1,77 @@
+"""Tests for the exact combat solver."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from dndgame.character import Character
+from dndgame.enemy import Enemy
+from dndgame.simulation import CombatSimulator
+from dndgame.solver import (
+    attack_damage_distribution,
+    dice_distribution,
+    hit_probability,
+    initiative_probability,
+    solve_combat,
+)
+
+
+def test_dice_distribution() -> None:
+    """Test dice convolution gives the known 2d6 and 3d6 shapes."""
+    two_d6 = dice_distribution(6, 2)
+    assert len(two_d6) == 13
+    assert two_d6[7] == pytest.approx(6 / 36)
+    assert sum(dice_distribution(6, 3)) == pytest.approx(1.0)
+    assert dice_distribution(6, 3)[3] == pytest.approx(1 / 216)
+
+
+def test_attack_probabilities() -> None:
+    """Test hit chance, damage floor and initiative ties."""
+    assert hit_probability(2, 13) == pytest.approx(0.5)
+    assert hit_probability(0, 30) == 0.0
+    damage = dict(attack_damage_distribution(-3, -5))
+    assert damage[1] == pytest.approx(4 / 6)
+    assert 0 not in damage
+    assert initiative_probability(0, 0) == pytest.approx(210 / 400)
+
+
+def test_probabilities_sum_to_one(player: Character) -> None:
+    """Test every outcome is accounted for."""
+    odds = solve_combat(player, Enemy("Orc"))
+    assert odds.player_win_probability + odds.enemy_win_probability == pytest.approx(
+        1.0
+    )
+    assert sum(odds.player_hp_distribution) == pytest.approx(
+        odds.player_win_probability
+    )
+    assert sum(odds.rounds_distribution) + odds.rounds_tail == pytest.approx(1.0)
+    assert odds.stalemate_probability == 0.0
+
+
+def test_matches_simulation(player: Character) -> None:
+    """Test the exact answer agrees with a large simulation."""
+    goblin = Enemy("Goblin")
+    odds = solve_combat(player, goblin)
+    result = CombatSimulator(player, goblin).run(400_000, np.random.default_rng(0))
+    assert odds.player_win_probability == pytest.approx(
+        result.player_win_rate, abs=0.005
+    )
+    assert odds.mean_rounds == pytest.approx(result.mean_rounds, abs=0.02)
+
+
+def test_stalemate(player: Character) -> None:
+    """Test fights where nobody can hit are reported as stalemates."""
+    goblin = Enemy("Goblin")
+    goblin.armor_class = 100
+    player.armor_class = 100
+    odds = solve_combat(player, goblin)
+    assert odds.stalemate_probability == pytest.approx(1.0)
+    assert odds.player_win_probability == 0.0
+
+
+def test_downed_player_loses_immediately(player: Character) -> None:
+    """Test a player at 0 HP loses without a round being fought."""
+    player.hp = 0
+    odds = solve_combat(player, Enemy("Goblin"))
+    assert odds.enemy_win_probability == 1.0
+    assert odds.rounds_distribution == [1.0]
@@ -64,3 +64,171 @@ def test_spell_cast() -> None:
     """Test spell cast method (currently a placeholder)."""
     spell = Spell("Test Spell", 1, "Test", 1)
     spell.cast(None, None)
+
+
+def _library() -> tuple[SpellBook, list[Spell]]:
+    """Create a spellbook with a spread of schools, levels and powers."""
+    spellbook = SpellBook()
+    schools = ["Evocation", "Abjuration", "Conjuration", "Necromancy"]
+    spells = [
+        Spell(f"Spell {i}", i % 10, schools[i % 4], (i * 7) % 25) for i in range(200)
+    ]
+    for spell in spells:
+        spellbook.add_spell(spell)
+    return spellbook, spells
+
+
+def test_indexed_queries_match_scans() -> None:
+    """Test indexed lookups return the same spells as a linear scan."""
+    spellbook, spells = _library()
+
+    for level in range(-1, 11):
+        expected = [s for s in spells if s.level <= level]
+        assert spellbook.get_available_spells(level) == expected
+
+    for power in range(-1, 26):
+        expected = [s for s in spells if s.spell_power >= power]
+        assert spellbook.get_powerful_spells(power) == expected
+
+    assert spellbook.get_spells_by_school("Abjuration") == [
+        s for s in spells if s.school == "Abjuration"
+    ]
+    assert spellbook.get_spells_by_school("Illusion") == []
+
+
+def test_query_combines_conditions() -> None:
+    """Test combined queries against every mix of conditions."""
+    spellbook, spells = _library()
+    for school in (None, "Evocation", "Necromancy", "Illusion"):
+        for max_level in (None, 0, 4, 9):
+            for min_power in (None, 0, 12, 24):
+                expected = [
+                    s
+                    for s in spells
+                    if (school is None or s.school == school)
+                    and (max_level is None or s.level <= max_level)
+                    and (min_power is None or s.spell_power >= min_power)
+                ]
+                found = spellbook.query(school, max_level, min_power)
+                assert found == expected
+
+
+def test_get_spell_by_name() -> None:
+    """Test lookup by name."""
+    spellbook, spells = _library()
+    assert spellbook.get_spell("Spell 42") is spells[42]
+    assert spellbook.get_spell("Wish") is None
+
+
+def test_remove_spell_updates_indexes() -> None:
+    """Test removal keeps every index consistent."""
+    spellbook, spells = _library()
+    removed = spells[::3]
+    for spell in removed:
+        spellbook.remove_spell(spell)
+    remaining = [s for s in spells if s not in removed]
+
+    assert spellbook.spells == remaining
+    assert len(spellbook) == len(remaining)
+    assert spells[0] not in spellbook
+    assert spellbook.get_spell("Spell 0") is None
+    assert spellbook.get_spell_names() == [s.name for s in remaining]
+    assert spellbook.get_available_spells(4) == [s for s in remaining if s.level <= 4]
+    assert spellbook.query("Evocation", 6, 10) == [
+        s
+        for s in remaining
+        if s.school == "Evocation" and s.level <= 6 and s.spell_power >= 10
+    ]
+    with pytest.raises(ValueError):
+        spellbook.remove_spell(spells[0])
+
+
+def test_spell_names_are_a_fresh_list() -> None:
+    """Test changing a returned name list doesn't affect the book."""
+    spellbook = SpellBook()
+    spellbook.add_spell(Spell("Shield", 1, "Abjuration", 2))
+    spellbook.get_spell_names().append("Wish")
+    spellbook.add_spell(Spell("Fireball", 3, "Evocation", 8))
+    assert spellbook.get_spell_names() == ["Shield", "Fireball"]
+
+
+def test_add_same_spell_twice() -> None:
+    """Test a spell added twice is listed twice until both are removed."""
+    spellbook = SpellBook()
+    shield = Spell("Shield", 1, "Abjuration", 2)
+    fireball = Spell("Fireball", 3, "Evocation", 8)
+    for spell in (shield, fireball, shield):
+        spellbook.add_spell(spell)
+    assert spellbook.get_available_spells(3) == [shield, fireball, shield]
+    assert spellbook.get_spells_by_school("Abjuration") == [shield, shield]
+
+    spellbook.remove_spell(shield)
+    assert spellbook.spells == [fireball, shield]
+    assert shield in spellbook
+    assert spellbook.get_powerful_spells(0) == [fireball, shield]
+    spellbook.remove_spell(shield)
+    assert shield not in spellbook
+    assert spellbook.get_spell("Shield") is None
+
+
+class FixedRolls:
+    """Random source returning queued values."""
+
+    def __init__(self, *values: int) -> None:
+        self.values = list(values)
+
+    def randint(self, a: int, b: int) -> int:
+        """Return the next queued value."""
+        return self.values.pop(0)
+
+
+def test_cast_save_halves_damage() -> None:
+    """Test a cast rolls a save against the DC, then spell_power d6."""
+    from dndgame.enemy import Enemy
+    from dndgame.events import NullSink
+
+    caster = Enemy("Goblin")
+    caster.stats["INT"] = 14
+    spell = Spell("Burning Hands", 1, "Evocation", 3)
+    assert spell.save_ability == "DEX"
+    assert spell.save_dc(caster) == 11
+    assert spell.save_dc(None) == 9
+
+    goblin = Enemy("Goblin")  # DEX 14, +2 to the save
+    damage = spell.cast(caster, goblin, NullSink(), FixedRolls(8, 6, 6, 6))
+    assert damage == 18 and goblin.hp == 0
+
+    orc = Enemy("Orc")
+    damage = spell.cast(caster, orc, NullSink(), FixedRolls(10, 5, 5, 5))
+    assert damage == 7 and orc.hp == 8
+    assert spell.cast(caster, None) == 0
+
+
+def test_cast_area_writes_hp_in_bulk() -> None:
+    """Test an area cast damages every target by the single-cast rules."""
+    np = pytest.importorskip("numpy")
+    from dndgame.enemy import Enemy
+
+    fireball = Spell("Fireball", 3, "Evocation", 8)
+    horde = [Enemy("Orc", f"Orc {i}") for i in range(500)]
+    damage = fireball.cast_area(None, horde, np.random.default_rng(3))
+    assert damage.shape == (500,)
+    assert damage.min() >= 4 and damage.max() <= 48
+    assert [orc.hp for orc in horde] == np.maximum(15 - damage, 0).tolist()
+    # DC 11 against DEX +1: over half the horde saves for half damage.
+    assert damage.mean() < 28 * 0.75 + 1
+
+
+def test_resolve_area_saves() -> None:
+    """Test guaranteed saves halve and failed saves don't."""
+    np = pytest.importorskip("numpy")
+
+    spell = Spell("Blight", 4, "Necromancy", 8)
+    assert spell.save_ability == "CON"
+    rng = np.random.default_rng(0)
+    hp = np.full(1000, 100, dtype=np.int64)
+    saved = spell.resolve_area(None, hp, np.full(1000, 50, dtype=np.int64), rng)
+    assert saved.max() <= 24 and (hp == 100 - saved).all()
+    hp = np.full(1000, 10, dtype=np.int64)
+    failed = spell.resolve_area(None, hp, np.full(1000, -50, dtype=np.int64), rng)
+    assert failed.min() >= 8 and hp.min() == 0
@@ -0,0 +1,133 @@
+"""Tests for streaming statistics."""
+
+import math
+import random
+import statistics
+
+import pytest
+from dndgame.character import Character
+from dndgame.combat import Combat
+from dndgame.enemy import Enemy
+from dndgame.events import CombatEndEvent, HitEvent, MemorySink, RoundStartEvent
+from dndgame.stats import (
+    CombatStats,
+    Histogram,
+    QuantileSketch,
+    RunningStats,
+    StatsSink,
+)
+
+
+def test_running_stats_match_statistics() -> None:
+    """Test Welford updates and merging against the statistics module."""
+    rng = random.Random(1)
+    values = [rng.gauss(50, 12) for _ in range(5000)]
+    whole = RunningStats()
+    whole.update(values)
+    assert whole.count == 5000
+    assert whole.mean == pytest.approx(statistics.fmean(values))
+    assert whole.variance == pytest.approx(statistics.variance(values))
+    assert (whole.minimum, whole.maximum) == (min(values), max(values))
+
+    left, right = RunningStats(), RunningStats()
+    left.update(values[:1234])
+    right.update(values[1234:])
+    merged = left.merge(right)
+    assert merged.mean == pytest.approx(whole.mean)
+    assert merged.variance == pytest.approx(whole.variance)
+    assert merged.merge(RunningStats()).count == 5000
+
+    weighted = RunningStats()
+    weighted.add(3, count=4)
+    weighted.add(7)
+    assert weighted.mean == pytest.approx(3.8)
+    assert weighted.population_variance == pytest.approx(2.56)
+
+
+def test_histogram_exact_quantiles() -> None:
+    """Test histogram counts, quantiles and merging."""
+    histogram = Histogram()
+    histogram.update([1, 2, 2, 3, 3, 3, 4, 4, 4, 4])
+    assert histogram.quantile(0.0) == 1
+    assert histogram.quantile(0.5) == 3
+    assert histogram.quantile(1.0) == 4
+    assert histogram.mean == 3.0
+    other = Histogram()
+    other.add(10, count=10)
+    histogram.merge(other)
+    assert histogram.total == 20 and histogram.quantile(0.6) == 10
+    with pytest.raises(ValueError):
+        Histogram().quantile(0.5)
+
+
+def test_sketch_relative_error_and_merge() -> None:
+    """Test sketch quantiles stay within their relative accuracy."""
+    rng = random.Random(2)
+    values = [rng.lognormvariate(3, 2) for _ in range(20_000)] + [0.0, -5.0]
+    ordered = sorted(values)
+    halves = QuantileSketch(0.01), QuantileSketch(0.01)
+    halves[0].update(values[::2])
+    halves[1].update(values[1::2])
+    sketch = halves[0].merge(halves[1])
+    assert sketch.count == len(values)
+    for q in (0.01, 0.25, 0.5, 0.9, 0.99, 0.999):
+        exact = ordered[max(1, math.ceil(q * len(values))) - 1]
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.011)
+    assert sketch.quantile(0.0) == pytest.approx(-5.0, rel=0.011)
+    assert sketch.buckets < 2000
+    with pytest.raises(ValueError):
+        sketch.merge(QuantileSketch(0.05))
+
+
+def test_sketch_collapses_to_bounded_size() -> None:
+    """Test memory stays bounded and high quantiles stay accurate."""
+    sketch = QuantileSketch(0.01, max_buckets=100)
+    for exponent in range(2000):
+        sketch.add(1.01**exponent)
+    assert sketch.buckets == 100
+    assert sketch.quantile(1.0) == pytest.approx(1.01**1999, rel=0.011)
+
+
+def test_stats_sink_records_fights() -> None:
+    """Test combat events feed rounds and damage statistics."""
+    memory = MemorySink()
+    sink = StatsSink(forward=memory)
+    rng = random.Random(3)
+    for _ in range(200):
+        hero = Character("Hero", "Orc", 10)
+        hero.roll_stats(sink=sink, rng=rng)
+        Combat(hero, Enemy("Goblin"), sink=sink, rng=rng).run_combat()
+    stats = sink.stats
+    assert stats.fights == 200
+    ends = [e for e in memory.events if isinstance(e, CombatEndEvent)]
+    assert stats.player_wins == len([event for event in ends if event.player_won])
+    hits = [e.damage for e in memory.events if isinstance(e, HitEvent)]
+    assert stats.damage.count == len(hits)
+    assert stats.damage_histogram.counts == {d: hits.count(d) for d in set(hits)}
+    assert stats.rounds.maximum == max(
+        e.round for e in memory.events if isinstance(e, RoundStartEvent)
+    )
+    summary = stats.summary()
+    assert summary["fights"] == 200
+    assert summary["damage_p50"] >= 1
+
+
+def test_combat_stats_merge_and_simulation() -> None:
+    """Test shard statistics merge like one run and simulations fold in."""
+    np = pytest.importorskip("numpy")
+    from dndgame.simulation import CombatSimulator
+
+    hero = Character("Hero", "Human", 10)
+    simulator = CombatSimulator(hero, Enemy("Goblin"))
+    parts = [simulator.run(2000, np.random.default_rng(seed)) for seed in (1, 2)]
+    merged = CombatStats()
+    for part in parts:
+        shard = CombatStats()
+        shard.add_simulation(part)
+        merged.merge(shard)
+    whole = CombatStats()
+    whole.add_simulation(parts[0].merge(parts[1]))
+    assert merged.fights == whole.fights == 4000
+    assert merged.player_wins == whole.player_wins
+    assert merged.rounds.mean == pytest.approx(whole.rounds.mean)
+    assert merged.rounds_sketch.quantile(0.5) == whole.rounds_sketch.quantile(0.5)
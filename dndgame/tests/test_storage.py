@@ -0,0 +1,172 @@
+"""Tests for binary entity storage."""
+
+from pathlib import Path
+from typing import Callable
+import pytest
+from dndgame.character import RACES, Character
+from dndgame.enemy import Enemy
+from dndgame.storage import (
+    HEADER,
+    KIND_CHARACTER,
+    KIND_ENEMY,
+    RECORD,
+    TABLE_ENTRY,
+    EntityStore,
+    StorageError,
+)
+
+
+@pytest.fixture
+def make_hero(make_player: Callable[..., Character]) -> Callable[..., Character]:
+    """Factory for characters whose fields all differ from the defaults."""
+
+    def make(name: str = "Hero", hp: int = 15) -> Character:
+        stats = {"STR": 16, "DEX": 9, "CON": 15, "CHA": 7}
+        char = make_player(name, "Dwarf", stats, hp=20, armor_class=14)
+        char.base_hp = 12
+        char.hp = hp
+        char.level = 3
+        return char
+
+    return make
+
+
+def test_round_trip_character(
+    tmp_path: Path, make_hero: Callable[..., Character]
+) -> None:
+    """Test a character loads back with every field intact."""
+    with EntityStore(tmp_path / "world.dnd") as store:
+        index = store.append(make_hero())
+        loaded = store.read(index)
+    assert isinstance(loaded, Character)
+    assert loaded.name == "Hero"
+    assert loaded.race == "Dwarf"
+    assert loaded.base_hp == 12
+    assert loaded.scores() == (16, 9, 15, 10, 10, 7)
+    assert loaded.get_modifier("STR") == 3
+    assert (loaded.hp, loaded.max_hp, loaded.armor_class, loaded.level) == (
+        15,
+        20,
+        14,
+        3,
+    )
+
+
+def test_round_trip_enemy(tmp_path: Path) -> None:
+    """Test an enemy keeps its type, name and damage."""
+    orc = Enemy("Orc", "Grug")
+    orc.take_damage(4)
+    with EntityStore(tmp_path / "world.dnd") as store:
+        loaded = store.read(store.append(orc))
+    assert isinstance(loaded, Enemy)
+    assert loaded.enemy_type == "Orc"
+    assert loaded.name == "Grug"
+    assert loaded.hp == orc.hp
+    assert loaded.stats == orc.stats
+
+
+def test_fixed_width_and_shared_names(tmp_path: Path) -> None:
+    """Test records are fixed width and repeated names and types are stored once."""
+    path = tmp_path / "world.dnd"
+    with EntityStore(path) as store:
+        for _ in range(10):
+            store.append(Enemy("Goblin"))
+        assert len(store) == 10
+    assert path.stat().st_size == HEADER.size + 10 * RECORD.size
+    # One "Goblin" entry as a name, one as an enemy type.
+    sidecar = Path(str(path) + ".names").stat().st_size
+    assert sidecar == 2 * (TABLE_ENTRY.size + len("Goblin"))
+
+
+def test_reopen_and_overwrite(
+    tmp_path: Path, make_hero: Callable[..., Character]
+) -> None:
+    """Test records persist across opens and can be updated in place."""
+    path = tmp_path / "world.dnd"
+    with EntityStore(path) as store:
+        store.append(make_hero("Ann"))
+        store.append(make_hero("Bob"))
+    with EntityStore(path) as store:
+        bob = store.read(1)
+        bob.take_damage(10)
+        store.write(1, bob)
+        assert store.append(make_hero("Cid")) == 2
+    with EntityStore(path) as store:
+        assert [store.read(i).name for i in range(3)] == ["Ann", "Bob", "Cid"]
+        assert store.read(1).hp == 5
+        with pytest.raises(IndexError):
+            store.read(3)
+
+
+def test_type_codes_survive_race_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, make_hero: Callable[..., Character]
+) -> None:
+    """Test records keep their race when races are added or removed later."""
+    path = tmp_path / "world.dnd"
+    monkeypatch.setitem(RACES, "Gnome", {"INT": 2})
+    with EntityStore(path) as store:
+        store.append(make_hero())
+        store.append(Character("Pip", "Gnome", 8))
+        store.append(Enemy("Orc"))
+        assert store.type_name(KIND_ENEMY, 0) == "Orc"
+
+    monkeypatch.delitem(RACES, "Gnome")
+    monkeypatch.setitem(RACES, "Tiefling", {"CHA": 2})
+    with EntityStore(path) as store:
+        hero = store.read(0)
+        assert isinstance(hero, Character) and hero.race == "Dwarf"
+        assert store.read(2).name == "Orc"
+        with pytest.raises(StorageError, match="Gnome"):
+            store.read(1)
+        with pytest.raises(StorageError):
+            store.type_name(KIND_ENEMY, 1)
+
+
+def test_rejects_foreign_file(tmp_path: Path) -> None:
+    """Test opening a file that isn't a store fails."""
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a store at all")
+    with pytest.raises(StorageError):
+        EntityStore(path)
+
+
+def test_unencodable_entities(
+    tmp_path: Path, make_hero: Callable[..., Character]
+) -> None:
+    """Test unknown types and oversized fields raise StorageError."""
+    with EntityStore(tmp_path / "world.dnd") as store:
+        goblin = Enemy("Goblin")
+        goblin.enemy_type = "Dragon"
+        with pytest.raises(StorageError, match="Dragon"):
+            store.encode(goblin)
+        giant = make_hero("Giant")
+        giant.level = 70_000
+        with pytest.raises(StorageError, match="Giant"):
+            store.append(giant)
+        assert len(store) == 0
+        store.append(make_hero("Ann"))
+        assert store.read(0).name == "Ann"
+        assert store.name(0) == "Ann"
+
+
+def test_bulk_scan_below_half_hp(
+    tmp_path: Path, make_hero: Callable[..., Character]
+) -> None:
+    """Test a memory-mapped scan finds wounded characters."""
+    np = pytest.importorskip("numpy")
+    with EntityStore(tmp_path / "world.dnd") as store:
+        for i in range(100):
+            store.append(make_hero(f"Hero {i}", hp=i % 20 + 1))
+            store.append(Enemy("Goblin"))
+        records = store.records()
+        assert len(records) == 200
+        wounded = np.flatnonzero(
+            (records["kind"] == KIND_CHARACTER)
+            & (2 * records["hp"] < records["max_hp"])
+        )
+        expected = [2 * i for i in range(100) if 2 * (i % 20 + 1) < 20]
+        assert wounded.tolist() == expected
+        assert records["stats"][0].tolist() == [16, 9, 15, 10, 10, 7]
+        first = store.read(int(wounded[0]))
+        assert first.name == "Hero 0"
+        assert store.name(int(records["name_id"][1])) == "Goblin"
@@ -0,0 +1,107 @@
+"""Tests for dice tape recording and replay."""
+
+import random
+from typing import Callable
+from pathlib import Path
+import pytest
+from dndgame.character import Character
+from dndgame.combat import Combat
+from dndgame.encounter import Encounter
+from dndgame.enemy import Enemy
+from dndgame.events import MemorySink, NullSink
+from dndgame.tape import DiceTape, RecordingRng, ReplayRng, TapeError
+
+
+def test_record_and_replay_fight(make_player: Callable[..., Character]) -> None:
+    """Test a replayed fight reproduces every event."""
+    tape = DiceTape()
+    original = MemorySink()
+    Combat(
+        make_player(),
+        Enemy("Orc"),
+        sink=original,
+        rng=RecordingRng(tape, random.Random(8)),
+    ).run_combat()
+    rolls = original.of_kind("roll")
+    assert len(tape) == len(rolls)
+
+    replayed = MemorySink()
+    replay = ReplayRng(DiceTape.from_bytes(tape.to_bytes()))
+    Combat(make_player(), Enemy("Orc"), sink=replayed, rng=replay).run_combat()
+    assert replay.exhausted
+    assert [e.to_dict() for e in replayed.events] == [
+        e.to_dict() for e in original.events
+    ]
+
+
+def test_tape_is_two_bytes_per_roll() -> None:
+    """Test rolls are packed compactly."""
+    tape = DiceTape()
+    rng = RecordingRng(tape, random.Random(1))
+    for _ in range(100):
+        rng.randint(1, 20)
+    assert len(tape.to_bytes()) == 4 + 200
+    span, offset = tape[0]
+    assert span == 19
+    assert 0 <= offset < 20
+
+
+def test_replay_detects_divergence() -> None:
+    """Test replay fails loudly when the fight asks for different dice."""
+    tape = DiceTape()
+    tape.append(1, 20, 12)
+    replay = ReplayRng(tape)
+    with pytest.raises(TapeError):
+        replay.randint(1, 6)
+    assert replay.randint(1, 20) == 12
+    with pytest.raises(TapeError):
+        replay.randint(1, 20)
+
+
+def test_invalid_tapes() -> None:
+    """Test backwards ranges and foreign bytes are rejected."""
+    with pytest.raises(TapeError):
+        DiceTape().append(6, 1, 5)
+    with pytest.raises(TapeError):
+        DiceTape.from_bytes(b"nope")
+
+
+def test_save_and_load(tmp_path: Path) -> None:
+    """Test tapes round-trip through a file."""
+    tape = DiceTape()
+    RecordingRng(tape, random.Random(3)).randint(1, 6)
+    tape.save(tmp_path / "fight.tape")
+    assert DiceTape.load(tmp_path / "fight.tape")[0] == tape[0]
+
+
+def test_wide_ranges_widen_the_tape() -> None:
+    """Test ranges over 256 values re-pack the tape instead of failing."""
+    tape = DiceTape()
+    tape.append(1, 20, 7)
+    tape.append(0, 299, 280)
+    tape.append(1, 100_000, 99_999)
+    restored = DiceTape.from_bytes(tape.to_bytes())
+    assert restored.to_bytes()[:4] == b"DTP4"
+    replay = ReplayRng(restored)
+    assert replay.randint(1, 20) == 7
+    assert replay.randint(0, 299) == 280
+    assert replay.randint(1, 100_000) == 99_999
+    with pytest.raises(TapeError):
+        tape.append(0, 1 << 40, 5)
+
+
+def test_record_large_encounter(make_player: Callable[..., Character]) -> None:
+    """Test a fight against hundreds of enemies records and replays."""
+
+    def fight(rng: RecordingRng | ReplayRng) -> list[int]:
+        horde = [Enemy("Goblin", f"Goblin {i}") for i in range(300)]
+        hero = make_player()
+        hero.hp = hero.max_hp = 1 << 20
+        Encounter([hero], horde, sink=NullSink(), rng=rng).run_combat(max_rounds=3)
+        return [goblin.hp for goblin in horde]
+
+    tape = DiceTape()
+    original = fight(RecordingRng(tape, random.Random(5)))
+    replay = ReplayRng(DiceTape.from_bytes(tape.to_bytes()))
+    assert fight(replay) == original
+    assert replay.exhausted
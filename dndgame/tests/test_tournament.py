@@ -0,0 +1,94 @@
+"""Tests for the round-robin tournament."""
+
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from dndgame.character import RACES
+from dndgame.tournament import (
+    Tournament,
+    TournamentResult,
+    enemy_entrant,
+    main,
+    race_entrant,
+    run_cell,
+)
+
+
+def test_entrant_fingerprints() -> None:
+    """Test fingerprints follow template content, not identity."""
+    assert race_entrant("Elf").fingerprint == race_entrant("Elf").fingerprint
+    assert race_entrant("Elf").fingerprint != race_entrant("Halfling").fingerprint
+    assert race_entrant("Orc").label != enemy_entrant("Orc").label
+    with pytest.raises(ValueError):
+        race_entrant("Dragon")
+    with pytest.raises(ValueError):
+        enemy_entrant("Dragon")
+
+
+def test_matrix_and_intervals() -> None:
+    """Test every cell is filled with an interval around its win rate."""
+    result = Tournament(["Human", "Orc"], ["Goblin"], fights=500, workers=1).run()
+    assert result.players == ["race:Human", "race:Orc"]
+    assert result.opponents == ["race:Human", "race:Orc", "enemy:Goblin"]
+    assert len(result.cells) == 6 and result.computed == 6
+    for cell in result.cells.values():
+        assert cell.wins + cell.losses + cell.draws == 500
+        assert cell.interval[0] <= cell.win_rate <= cell.interval[1]
+    orc = result.cell("race:Orc", "enemy:Goblin")
+    assert orc.win_rate > result.cell("race:Human", "enemy:Goblin").win_rate
+
+
+def test_workers_do_not_change_results() -> None:
+    """Test parallel runs match in-process runs cell for cell."""
+    serial = Tournament(["Human", "Elf"], fights=300, workers=1).run()
+    parallel = Tournament(["Human", "Elf"], fights=300, workers=2).run()
+    assert serial.cells == parallel.cells
+
+
+def test_new_race_only_recomputes_its_row_and_column(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test unchanged cells are reused from the previous result."""
+    first = Tournament(["Human", "Elf"], ["Goblin"], fights=200, workers=1).run()
+    monkeypatch.setitem(RACES, "Gnome", {"INT": 2})
+    second = Tournament(
+        ["Human", "Elf", "Gnome"], ["Goblin"], fights=200, workers=1
+    ).run(first)
+    # New row of 4 cells plus the new column in the 2 old rows.
+    assert (second.computed, second.reused) == (6, 6)
+    assert second.cell("race:Human", "race:Elf") == first.cell("race:Human", "race:Elf")
+
+    monkeypatch.setitem(RACES, "Gnome", {"INT": 2, "DEX": 1})
+    third = Tournament(
+        ["Human", "Elf", "Gnome"], ["Goblin"], fights=200, workers=1
+    ).run(second)
+    assert (third.computed, third.reused) == (6, 6)
+
+
+def test_cells_run_without_the_definitions(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a worker without a runtime-added race still builds its cell."""
+    monkeypatch.setitem(RACES, "Gnome", {"INT": 2, "STR": 2})
+    gnome = race_entrant("Gnome")
+    goblin = enemy_entrant("Goblin")
+    expected = run_cell((gnome.template, goblin.template, 300, 1000, "ab12"))
+    # As in a spawned worker, which never saw the monkeypatched race.
+    monkeypatch.delitem(RACES, "Gnome")
+    assert run_cell((gnome.template, goblin.template, 300, 1000, "ab12")) == expected
+    assert gnome.template.stats == (12, 10, 10, 12, 10, 10)
+
+
+def test_save_load_and_cli(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """Test results round-trip through JSON and the CLI reuses them."""
+    output = tmp_path / "tournament.json"
+    args = ["--races", "Human", "--enemies", "Orc", "--fights", "100"]
+    main(args + ["--workers", "1", "--output", str(output)])
+    result = TournamentResult.load(output)
+    assert result.computed == 0 and len(result.cells) == 2
+    assert "2 cells computed, 0 reused" in capsys.readouterr().out
+
+    main(args + ["--output", str(output)])
+    assert "0 cells computed, 2 reused" in capsys.readouterr().out
+    assert TournamentResult.load(output).cells == result.cells
@@ -0,0 +1,394 @@
+"""Round-robin tournament of every race against every race and enemy.
+
+Each race (built as an average, unrolled character) fights every race and
+every enemy type. The cells of the matrix are independent, so they are
+simulated in parallel worker processes, and each gets a Wilson confidence
+interval for the row's win rate.
+
+Every cell is keyed by a content hash of both sides' template data and the
+run settings. Results are saved to a JSON file, and the next run reuses any
+cell whose key is unchanged, so adding or editing one race only recomputes
+that race's row and column. Entrants are resolved to their final scores,
+HP and AC when they are created, so worker processes build exactly the
+fingerprinted combatants without needing the same races and enemy types
+defined.
+
+Example:
+    $ python -m dndgame.tournament --fights 100000 --output tournament.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Sequence, Union
+
+import numpy as np
+
+from dndgame.balance import wilson_interval
+from dndgame.character import RACES
+from dndgame.enemy import ENEMY_TEMPLATES
+from dndgame.parallel import CombatantTemplate
+from dndgame.simulation import CombatSimulator
+
+
+FORMAT_VERSION: int = 1
+
+DEFAULT_OUTPUT: str = "tournament.json"
+
+# (resolved player, resolved opponent, fights, max_rounds, cell key)
+CellTask = tuple[CombatantTemplate, CombatantTemplate, int, int, str]
+
+
+@dataclass(frozen=True)
+class Entrant:
+    """One side of the matrix.
+
+    Attributes:
+        label: Unique name, "race:<race>" or "enemy:<type>"
+        template: Resolved recipe for building the combatant
+        fingerprint: Hash of the template data the combatant is built from
+    """
+
+    label: str
+    template: CombatantTemplate
+    fingerprint: str
+
+
+def _digest(data: Any) -> str:
+    """Stable hash of JSON-serializable data."""
+    text = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def race_entrant(race: str, base_hp: int = 10) -> Entrant:
+    """Entrant for a race from ``RACES``."""
+    if race not in RACES:
+        raise ValueError(f"Invalid race: {race}. Must be one of {list(RACES)}")
+    return Entrant(
+        f"race:{race}",
+        CombatantTemplate.character(race, base_hp=base_hp).resolve(),
+        _digest(["race", race, base_hp, RACES[race]]),
+    )
+
+
+def enemy_entrant(enemy_type: str) -> Entrant:
+    """Entrant for an enemy type from ``ENEMY_TEMPLATES``."""
+    if enemy_type not in ENEMY_TEMPLATES:
+        raise ValueError(
+            f"Invalid enemy type: {enemy_type}. "
+            f"Must be one of {list(ENEMY_TEMPLATES)}"
+        )
+    return Entrant(
+        f"enemy:{enemy_type}",
+        CombatantTemplate.enemy(enemy_type).resolve(),
+        _digest(["enemy", enemy_type, ENEMY_TEMPLATES[enemy_type]]),
+    )
+
+
+@dataclass(frozen=True)
+class CellResult:
+    """Outcome of one matchup of the matrix.
+
+    Attributes:
+        player: Label of the row entrant
+        opponent: Label of the column entrant
+        key: Content hash of both templates and the run settings
+        fights: Fights simulated
+        wins: Fights won by the row entrant
+        losses: Fights won by the column entrant
+        draws: Fights stopped at the round limit
+        interval: Wilson interval of the row entrant's win rate
+        mean_rounds: Average fight length
+    """
+
+    player: str
+    opponent: str
+    key: str
+    fights: int
+    wins: int
+    losses: int
+    draws: int
+    interval: tuple[float, float]
+    mean_rounds: float
+
+    @property
+    def win_rate(self) -> float:
+        """Fraction of fights won by the row entrant."""
+        return self.wins / self.fights if self.fights else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to JSON-serializable data."""
+        return {
+            "player": self.player,
+            "opponent": self.opponent,
+            "key": self.key,
+            "fights": self.fights,
+            "wins": self.wins,
+            "losses": self.losses,
+            "draws": self.draws,
+            "interval": list(self.interval),
+            "mean_rounds": self.mean_rounds,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CellResult":
+        """Rebuild from :meth:`to_dict` output."""
+        low, high = data["interval"]
+        return cls(
+            data["player"],
+            data["opponent"],
+            data["key"],
+            data["fights"],
+            data["wins"],
+            data["losses"],
+            data["draws"],
+            (low, high),
+            data["mean_rounds"],
+        )
+
+
+def run_cell(task: CellTask) -> tuple[int, int, int, float]:
+    """Simulate one cell, seeded by its key.
+
+    Returns:
+        Wins, losses, draws and mean rounds of the row entrant
+    """
+    player, opponent, fights, max_rounds, key = task
+    simulator = CombatSimulator(player.build(), opponent.build(), max_rounds)
+    result = simulator.run(fights, np.random.default_rng(int(key, 16)))
+    return result.player_wins, result.enemy_wins, result.draws, result.mean_rounds
+
+
+@dataclass
+class TournamentResult:
+    """The result matrix of a tournament.
+
+    Attributes:
+        players: Row labels
+        opponents: Column labels
+        cells: Results by (player, opponent) label
+        computed: Cells simulated by the run that produced this result
+        reused: Cells carried over from an earlier result
+    """
+
+    players: list[str]
+    opponents: list[str]
+    cells: dict[tuple[str, str], CellResult] = field(default_factory=dict)
+    computed: int = 0
+    reused: int = 0
+
+    def cell(self, player: str, opponent: str) -> CellResult:
+        """Result of one matchup."""
+        return self.cells[player, opponent]
+
+    def by_key(self) -> dict[str, CellResult]:
+        """Cells indexed by their content hash."""
+        return {cell.key: cell for cell in self.cells.values()}
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to JSON-serializable data."""
+        return {
+            "version": FORMAT_VERSION,
+            "players": self.players,
+            "opponents": self.opponents,
+            "cells": [cell.to_dict() for cell in self.cells.values()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "TournamentResult":
+        """Rebuild from :meth:`to_dict` output."""
+        if data.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported tournament format: {data.get('version')}")
+        cells = [CellResult.from_dict(cell) for cell in data["cells"]]
+        return cls(
+            list(data["players"]),
+            list(data["opponents"]),
+            {(cell.player, cell.opponent): cell for cell in cells},
+        )
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the result as JSON."""
+        Path(path).write_text(json.dumps(self.to_dict(), indent=2) + "\n")
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "TournamentResult":
+        """Read a result written by :meth:`save`."""
+        return cls.from_dict(json.loads(Path(path).read_text()))
+
+    def format(self) -> str:
+        """Render row win rates with their intervals as a table."""
+        width = max(len(label) for label in self.players)
+        column = max([len(label) for label in self.opponents] + [19]) + 2
+        header = "".join(f"{opponent:>{column}}" for opponent in self.opponents)
+        lines = [f"{'':<{width}}{header}"]
+        for player in self.players:
+            row = f"{player:<{width}}"
+            for opponent in self.opponents:
+                cell = self.cells[player, opponent]
+                low, high = cell.interval
+                text = f"{cell.win_rate:.3f} [{low:.3f}-{high:.3f}]"
+                row += f"{text:>{column}}"
+            lines.append(row)
+        return "\n".join(lines)
+
+
+class Tournament:
+    """Round-robin of races against races and enemy types.
+
+    Attributes:
+        players: Row entrants (races)
+        opponents: Column entrants (races, then enemy types)
+        fights: Fights per cell
+        seed: Master seed, part of every cell key
+        max_rounds: Round limit per fight
+        workers: Worker processes (all CPUs if omitted; 1 runs in-process)
+        z: Normal quantile of the confidence intervals
+    """
+
+    def __init__(
+        self,
+        races: Optional[Sequence[str]] = None,
+        enemy_types: Optional[Sequence[str]] = None,
+        fights: int = 10_000,
+        seed: int = 0,
+        max_rounds: int = 1000,
+        workers: Optional[int] = None,
+        z: float = 1.96,
+    ) -> None:
+        if fights < 1:
+            raise ValueError(f"fights must be positive, got {fights}")
+        races = list(RACES) if races is None else races
+        enemy_types = list(ENEMY_TEMPLATES) if enemy_types is None else enemy_types
+        self.players: list[Entrant] = [race_entrant(race) for race in races]
+        self.opponents: list[Entrant] = self.players + [
+            enemy_entrant(enemy_type) for enemy_type in enemy_types
+        ]
+        self.fights: int = fights
+        self.seed: int = seed
+        self.max_rounds: int = max_rounds
+        self.workers: int = workers or os.cpu_count() or 1
+        self.z: float = z
+
+    def cell_key(self, player: Entrant, opponent: Entrant) -> str:
+        """Content hash of a cell's inputs."""
+        return _digest(
+            [
+                FORMAT_VERSION,
+                player.fingerprint,
+                opponent.fingerprint,
+                self.fights,
+                self.seed,
+                self.max_rounds,
+            ]
+        )
+
+    def run(self, previous: Optional[TournamentResult] = None) -> TournamentResult:
+        """Fill the matrix, reusing unchanged cells of ``previous``.
+
+        Cells are seeded by their key, so a cell's result doesn't depend on
+        which other cells are recomputed or on the number of workers.
+        """
+        known = previous.by_key() if previous is not None else {}
+        result = TournamentResult(
+            [entrant.label for entrant in self.players],
+            [entrant.label for entrant in self.opponents],
+        )
+        tasks: list[CellTask] = []
+        labels: list[tuple[str, str]] = []
+        for player in self.players:
+            for opponent in self.opponents:
+                key = self.cell_key(player, opponent)
+                cell = known.get(key)
+                if cell is not None:
+                    result.cells[player.label, opponent.label] = cell
+                    result.reused += 1
+                    continue
+                tasks.append(
+                    (
+                        player.template,
+                        opponent.template,
+                        self.fights,
+                        self.max_rounds,
+                        key,
+                    )
+                )
+                labels.append((player.label, opponent.label))
+
+        if self.workers == 1 or len(tasks) <= 1:
+            outcomes = [run_cell(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(tasks))) as pool:
+                outcomes = list(pool.map(run_cell, tasks))
+
+        for (player_label, opponent_label), task, outcome in zip(
+            labels, tasks, outcomes
+        ):
+            wins, losses, draws, mean_rounds = outcome
+            result.cells[player_label, opponent_label] = CellResult(
+                player_label,
+                opponent_label,
+                task[4],
+                self.fights,
+                wins,
+                losses,
+                draws,
+                wilson_interval(wins, self.fights, self.z),
+                mean_rounds,
+            )
+        result.computed = len(tasks)
+        # Keep row-major order whichever cells were reused.
+        result.cells = {
+            (player, opponent): result.cells[player, opponent]
+            for player in result.players
+            for opponent in result.opponents
+        }
+        return result
+
+
+def _names(text: Optional[str]) -> Optional[list[str]]:
+    """Split a comma-separated command-line list."""
+    return None if text is None else [name for name in text.split(",") if name]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Run a tournament from the command line."""
+    parser = argparse.ArgumentParser(description="Round-robin combat tournament.")
+    parser.add_argument("--races", help="comma-separated races (default: all)")
+    parser.add_argument("--enemies", help="comma-separated enemy types (default: all)")
+    parser.add_argument("--fights", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-rounds", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--force", action="store_true", help="recompute every cell")
+    parser.add_argument("--json", action="store_true", help="print JSON results")
+    args = parser.parse_args(argv)
+
+    tournament = Tournament(
+        _names(args.races),
+        _names(args.enemies),
+        fights=args.fights,
+        seed=args.seed,
+        max_rounds=args.max_rounds,
+        workers=args.workers,
+    )
+    output = Path(args.output)
+    previous = None
+    if output.exists() and not args.force:
+        previous = TournamentResult.load(output)
+    result = tournament.run(previous)
+    result.save(output)
+
+    if args.json:
+        print(json.dumps(result.to_dict()))
+    else:
+        print(result.format())
+        print(f"{result.computed} cells computed, {result.reused} reused")
+
+
+if __name__ == "__main__":
+    main()